@@ -7,16 +7,25 @@ from claim_extractor.config.nodes import (
     CONTEXT_WINDOWS,
     DECOMPOSITION_CONFIG,
     DISAMBIGUATION_CONFIG,
+    MEMO_CONFIG,
     SELECTION_CONFIG,
+    SELECTION_PREFILTER_CONFIG,
+    SENTENCE_SPLITTER_CONFIG,
+    STREAMING_CONFIG,
     VALIDATION_CONFIG,
 )
 
 __all__ = [
     # Node configurations
+    "SENTENCE_SPLITTER_CONFIG",
     "SELECTION_CONFIG",
+    "SELECTION_PREFILTER_CONFIG",
     "DISAMBIGUATION_CONFIG",
     "DECOMPOSITION_CONFIG",
     "VALIDATION_CONFIG",
+    "STREAMING_CONFIG",
+    # Memoization
+    "MEMO_CONFIG",
     # Context windows
     "CONTEXT_WINDOWS",
 ]
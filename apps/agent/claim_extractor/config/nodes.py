@@ -4,16 +4,32 @@ Contains settings for the pipeline nodes.
 """
 
 # Node settings
+SENTENCE_SPLITTER_CONFIG = {
+    "language": "english",  # Punkt model used to split sentences
+}
+
 SELECTION_CONFIG = {
     "completions": 3,
     "min_successes": 2,
     "temperature": 0.2,  # Higher temp for diverse judgments
+    "max_concurrency": 16,  # Max in-flight LLM calls across all sentences
+    "early_exit": True,  # Start min_successes attempts, add one per failure until decided
+}
+
+SELECTION_PREFILTER_CONFIG = {
+    "enabled": True,  # Score sentences locally before the selection LLM calls
+    "shadow_mode": False,  # Only report would-be drops, send everything to the LLM
+    "drop_threshold": 0.9,  # Min no-claim confidence to skip a sentence (raise for precision)
+    "model_path": None,  # Trained classifier from scripts/train_prefilter.py
+    "outcome_log_path": None,  # JSONL file collecting selection outcomes for training
 }
 
 DISAMBIGUATION_CONFIG = {
     "completions": 3,
     "min_successes": 2,
     "temperature": 0.2,  # Higher temp for diverse judgments
+    "max_concurrency": 16,  # Max in-flight LLM calls across all sentences
+    "early_exit": True,  # Start min_successes attempts, add one per failure until decided
 }
 
 DECOMPOSITION_CONFIG = {
@@ -24,6 +40,23 @@ DECOMPOSITION_CONFIG = {
 
 VALIDATION_CONFIG = {
     "temperature": 0.0,  # Zero temp for consistent results
+    "batching": True,  # Validate many claims per LLM call
+    "max_batch_size": 25,  # Max claims per batched call
+    "batch_token_budget": 1_500,  # Max claim tokens packed into one batched call
+}
+
+# Per-sentence streaming (fact_checker pipelined mode)
+STREAMING_CONFIG = {
+    "max_parallel_sentences": 8,  # Sentences moving through the stages at once
+}
+
+# Sentence-level memoization of stage outputs (edit-and-recheck)
+MEMO_CONFIG = {
+    "enabled": True,
+    "use_redis": True,  # Re-submissions may land on another worker
+    "ttl_seconds": 24 * 60 * 60,
+    "negative_ttl_seconds": 60 * 60,  # "No claim" results (failed LLM calls are not stored)
+    "max_entries": 50_000,  # In-memory tier size
 }
 
 # Context windows
@@ -0,0 +1,73 @@
+"""Compact document representation for context windows.
+
+The sentence array of a text is stored once; each ContextualSentence only
+references its index and window bounds. Context strings for the LLM are
+built on demand and cached per window, so voting attempts and stages that
+share a window reuse the same string.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from claim_extractor.schemas import ContextualSentence, State
+
+
+class SentenceDocument:
+    """Sentences of a text with lazily materialized context windows."""
+
+    def __init__(self, sentences: Sequence[str], metadata: Optional[str] = None):
+        self.sentences = sentences
+        self.metadata = metadata
+        self._contexts: Dict[Tuple[int, int, int], str] = {}
+
+    @classmethod
+    def from_state(cls, state: State) -> "SentenceDocument":
+        """Build the document for a workflow state."""
+        return cls(state.sentences, state.metadata)
+
+    def context(self, index: int, start: int, end: int) -> str:
+        """Context string for a sentence and the window [start, end).
+
+        Args:
+            index: Index of the sentence of interest
+            start: Index of the first preceding sentence to include
+            end: Index one past the last following sentence to include
+
+        Returns:
+            The context in the format the prompts expect
+        """
+        key = (index, start, end)
+        if key not in self._contexts:
+            self._contexts[key] = self._build_context(index, start, end)
+        return self._contexts[key]
+
+    def _build_context(self, index: int, start: int, end: int) -> str:
+        context_parts: List[str] = []
+
+        # Add metadata if available
+        if self.metadata:
+            context_parts.append(f"[Document Metadata: {self.metadata}]")
+
+        # Add preceding sentences
+        if start < index:
+            context_parts.append("\n[Preceding Sentences:]")
+            context_parts.extend(self.sentences[start:index])
+
+        # Add the sentence itself
+        context_parts.append(
+            f"\n[Sentence of Interest for current task:]\n{self.sentences[index]}"
+        )
+
+        # Add following sentences
+        if index + 1 < end:
+            context_parts.append("\n[Following Sentences:]")
+            context_parts.extend(self.sentences[index + 1 : end])
+
+        return "\n".join(context_parts)
+
+    def selection_context(self, item: ContextualSentence) -> str:
+        """Full window, with preceding and following sentences."""
+        return self.context(item.original_index, item.window_start, item.window_end)
+
+    def preceding_context(self, item: ContextualSentence) -> str:
+        """Window without following sentences, for disambiguation and decomposition."""
+        return self.context(item.original_index, item.window_start, item.original_index + 1)
@@ -0,0 +1,119 @@
+"""Sentence-level memoization of extraction stage outputs.
+
+Each stage's output is stored under a hash of exactly what the stage
+sees - the sentence and its context window - so re-checking an edited
+document only reprocesses sentences whose context changed. Values are
+small (sentences, claim texts, booleans) and rebuilt into stage objects
+with the current sentence index. Negative results ("no claim here") are
+stored too, with a shorter TTL. Outcomes of failed LLM calls are never
+stored. Keys include the model and a fingerprint of the stage prompts, so
+changing either starts from a clean slate.
+"""
+
+import json
+import logging
+from typing import Any, List, Optional, Sequence, Tuple
+
+from langchain_core.language_models.chat_models import BaseChatModel
+from utils import TieredCache, make_cache_key
+
+from claim_extractor.config import MEMO_CONFIG
+
+logger = logging.getLogger(__name__)
+
+NEGATIVE_TTL_SECONDS = MEMO_CONFIG["negative_ttl_seconds"]
+
+# Returned for keys with nothing stored (None is a valid stored value)
+MISS = object()
+
+# Stage output of a failed LLM call; set() skips it
+FAILED = object()
+
+_memo_cache: Optional[TieredCache] = (
+    TieredCache(
+        namespace="extract",
+        max_entries=MEMO_CONFIG["max_entries"],
+        ttl_seconds=MEMO_CONFIG["ttl_seconds"],
+        use_redis=MEMO_CONFIG["use_redis"],
+    )
+    if MEMO_CONFIG["enabled"]
+    else None
+)
+
+
+def _model_id(llm: BaseChatModel) -> str:
+    model = getattr(llm, "model_name", None) or getattr(llm, "model", None)
+    return f"{model or type(llm).__name__}@{getattr(llm, 'temperature', None)}"
+
+
+class StageMemo:
+    """Memoized outputs of one extraction stage.
+
+    Args:
+        stage: Stage name, used as the key prefix
+        prompts: The stage's prompt templates; their fingerprint versions the keys
+    """
+
+    def __init__(self, stage: str, prompts: Sequence[str] = ()):
+        self.stage = stage
+        self.version = make_cache_key(*prompts)[:16]
+
+    def key(self, llm: BaseChatModel, *parts: Any) -> str:
+        """Key for the given stage inputs as processed by `llm`."""
+        return f"{self.stage}:{self.version}:{make_cache_key(_model_id(llm), *parts)}"
+
+    async def get(self, key: str) -> Any:
+        """Stored output for a key, or MISS."""
+        if _memo_cache is None:
+            return MISS
+
+        try:
+            cached = await _memo_cache.get(key)
+        except Exception as e:
+            logger.warning(f"Memo lookup failed for {self.stage}: {e}")
+            return MISS
+        return MISS if cached is None else json.loads(cached)["value"]
+
+    async def get_many(self, keys: Sequence[str]) -> List[Any]:
+        """Stored outputs for several keys, MISS where nothing is stored."""
+        if _memo_cache is None or not keys:
+            return [MISS] * len(keys)
+
+        # One round trip for the whole batch rather than a pooled connection per key
+        try:
+            cached = await _memo_cache.get_many(keys)
+        except Exception as e:
+            logger.warning(f"Memo lookup failed for {self.stage}: {e}")
+            return [MISS] * len(keys)
+
+        values = [MISS if raw is None else json.loads(raw)["value"] for raw in cached]
+        hits = sum(value is not MISS for value in values)
+        if hits:
+            logger.info(f"Reused {hits} of {len(keys)} memoized {self.stage} results")
+        return values
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store a stage output; empty outputs expire sooner, FAILED is skipped."""
+        if _memo_cache is None or value is FAILED:
+            return
+
+        ttl = None if value else NEGATIVE_TTL_SECONDS
+        try:
+            await _memo_cache.set(key, json.dumps({"value": value}), ttl_seconds=ttl)
+        except Exception as e:
+            logger.warning(f"Memo write failed for {self.stage}: {e}")
+
+    async def set_many(self, entries: Sequence[Tuple[str, Any]]) -> None:
+        """Store several (key, value) stage outputs in one write, skipping FAILED."""
+        if _memo_cache is None:
+            return
+
+        items = [
+            (key, json.dumps({"value": value}), None if value else NEGATIVE_TTL_SECONDS)
+            for key, value in entries
+            if value is not FAILED
+        ]
+        try:
+            await _memo_cache.set_many(items)
+        except Exception as e:
+            logger.warning(f"Memo write failed for {self.stage}: {e}")
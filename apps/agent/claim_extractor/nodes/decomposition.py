@@ -6,14 +6,16 @@ Breaks complex sentences into simple, standalone factual claims.
 import asyncio
 import itertools
 import logging
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
 from claim_extractor.config import DECOMPOSITION_CONFIG
+from claim_extractor.context import SentenceDocument
+from claim_extractor.memo import MISS, StageMemo
 from claim_extractor.prompts import DECOMPOSITION_SYSTEM_PROMPT, HUMAN_PROMPT
 from claim_extractor.schemas import DisambiguatedContent, PotentialClaim, State
-from utils import call_llm_with_structured_output, get_llm, remove_following_sentences
+from utils import call_llm_with_structured_output, get_llm
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,9 @@ logger = logging.getLogger(__name__)
 COMPLETIONS = DECOMPOSITION_CONFIG["completions"]
 MIN_SUCCESSES = DECOMPOSITION_CONFIG["min_successes"]
 
+# Keyed by the disambiguated sentence and its context without following sentences
+_memo = StageMemo("decomposition", prompts=(DECOMPOSITION_SYSTEM_PROMPT, HUMAN_PROMPT))
+
 
 class DecompositionOutput(BaseModel):
     """Response schema for decomposition LLM calls."""
@@ -35,11 +40,13 @@ class DecompositionOutput(BaseModel):
 
 async def _decomposition_stage(
     disambiguated_item: DisambiguatedContent,
+    document: SentenceDocument,
 ) -> List[PotentialClaim]:
     """Extract atomic claims from a disambiguated sentence.
 
     Args:
         disambiguated_item: Disambiguated content to process
+        document: The sentences the context window refers to
 
     Returns:
         List of potential claims
@@ -47,14 +54,55 @@ async def _decomposition_stage(
     sentence = disambiguated_item.disambiguated_sentence
     logger.debug(f"Processing decomposition for: '{sentence}'")
 
-    # Get zero-temp LLM for consistent results
-    llm = get_llm(completions=COMPLETIONS)
-
     # Get context without following sentences
-    original_context = (
-        disambiguated_item.original_selected_item.original_context_item.context_for_llm
+    modified_context = document.preceding_context(
+        disambiguated_item.original_selected_item.original_context_item
+    )
+
+    # Reuse the claims of an unchanged sentence from an earlier run
+    memo_key = _memo.key(get_llm(completions=COMPLETIONS), sentence, modified_context)
+    claims_texts = await _memo.get(memo_key)
+    if claims_texts is MISS:
+        claims_texts = await _extract_claim_texts(sentence, modified_context)
+        # Failed calls (None) are not stored
+        if claims_texts is not None:
+            await _memo.set(memo_key, claims_texts)
+
+    if not claims_texts:
+        return []
+
+    # Get original sentence and index
+    original_sentence = disambiguated_item.original_selected_item.original_context_item.original_sentence
+    original_index = disambiguated_item.original_selected_item.original_context_item.original_index
+
+    potential_claims = [
+        PotentialClaim(
+            claim_text=claim_text, 
+            disambiguated_sentence=sentence,
+            original_sentence=original_sentence,
+            original_index=original_index
+        )
+        for claim_text in claims_texts
+    ]
+
+    logger.info(
+        f"Extracted {len(potential_claims)} potential claims from: '{sentence}'"
     )
-    modified_context = remove_following_sentences(original_context)
+    return potential_claims
+
+
+async def _extract_claim_texts(sentence: str, modified_context: str) -> Optional[List[str]]:
+    """Ask the LLM for the atomic claims in a sentence.
+
+    Args:
+        sentence: Disambiguated sentence
+        modified_context: Its context without following sentences
+
+    Returns:
+        Cleaned claim texts, empty if there are none, None if the call failed
+    """
+    # Get zero-temp LLM for consistent results
+    llm = get_llm(completions=COMPLETIONS)
 
     # Prep the prompt
     messages = [
@@ -76,34 +124,18 @@ async def _decomposition_stage(
         context_desc=f"decomposition stage for sentence '{sentence}'",
     )
 
+    if not response:
+        return None
+
     # If no claims were found
-    if not response or response.no_claims or not response.claims:
+    if response.no_claims or not response.claims:
         logger.info(f"No claims found in: '{sentence}'")
         return []
 
     logger.debug(f"Decomposition response: {response}")
 
-    # Clean up claims and convert to objects
-    claims_texts = [claim.strip() for claim in response.claims if claim.strip()]
-
-    # Get original sentence and index
-    original_sentence = disambiguated_item.original_selected_item.original_context_item.original_sentence
-    original_index = disambiguated_item.original_selected_item.original_context_item.original_index
-
-    potential_claims = [
-        PotentialClaim(
-            claim_text=claim_text, 
-            disambiguated_sentence=sentence,
-            original_sentence=original_sentence,
-            original_index=original_index
-        )
-        for claim_text in claims_texts
-    ]
-
-    logger.info(
-        f"Extracted {len(potential_claims)} potential claims from: '{sentence}'"
-    )
-    return potential_claims
+    # Clean up claims
+    return [claim.strip() for claim in response.claims if claim.strip()]
 
 
 async def decomposition_node(state: State) -> Dict[str, List[PotentialClaim]]:
@@ -121,10 +153,12 @@ async def decomposition_node(state: State) -> Dict[str, List[PotentialClaim]]:
         logger.warning("Nothing to decompose")
         return {"potential_claims": []}
 
+    document = SentenceDocument.from_state(state)
+
     # Process all contents in parallel for speed
     potential_claims = await asyncio.gather(
         *(
-            _decomposition_stage(disambiguated_content)
+            _decomposition_stage(disambiguated_content, document)
             for disambiguated_content in disambiguated_contents
         )
     )
@@ -4,20 +4,18 @@ Clarifies pronouns and other references so claims make sense on their own.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from functools import partial
+from typing import Dict, List, Optional, Set, Tuple
 
 from langchain_core.language_models.chat_models import BaseChatModel
 from pydantic import BaseModel, Field
 
 from claim_extractor.config import DISAMBIGUATION_CONFIG
+from claim_extractor.context import SentenceDocument
+from claim_extractor.memo import FAILED, MISS, StageMemo
 from claim_extractor.prompts import DISAMBIGUATION_SYSTEM_PROMPT, HUMAN_PROMPT
 from claim_extractor.schemas import DisambiguatedContent, SelectedContent, State
-from utils import (
-    call_llm_with_structured_output,
-    get_llm,
-    process_with_voting,
-    remove_following_sentences,
-)
+from utils import call_llm_with_structured_output, get_llm, process_with_voting
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +23,11 @@ logger = logging.getLogger(__name__)
 # to ensure consistency in how references are resolved
 COMPLETIONS = DISAMBIGUATION_CONFIG["completions"]
 MIN_SUCCESSES = DISAMBIGUATION_CONFIG["min_successes"]
+MAX_CONCURRENCY = DISAMBIGUATION_CONFIG["max_concurrency"]
+EARLY_EXIT = DISAMBIGUATION_CONFIG["early_exit"]
+
+# Keyed by the selected sentence and its context without following sentences
+_memo = StageMemo("disambiguation", prompts=(DISAMBIGUATION_SYSTEM_PROMPT, HUMAN_PROMPT))
 
 
 class DisambiguationOutput(BaseModel):
@@ -39,13 +42,18 @@ class DisambiguationOutput(BaseModel):
 
 
 async def _single_disambiguation_attempt(
-    selected_item: SelectedContent, llm: BaseChatModel
+    selected_item: SelectedContent,
+    llm: BaseChatModel,
+    document: SentenceDocument,
+    failed: Set[int],
 ) -> Tuple[bool, Optional[str]]:
     """Try to disambiguate a single sentence.
 
     Args:
         selected_item: Selected content to disambiguate
         llm: LLM instance
+        document: The sentences the context window refers to
+        failed: Collects original_index of sentences with a failed LLM call
 
     Returns:
         (success, disambiguated_sentence)
@@ -54,9 +62,7 @@ async def _single_disambiguation_attempt(
 
     # Get context but remove following sentences
     # We don't want to rely on future info that might not be available
-    modified_context = remove_following_sentences(
-        selected_item.original_context_item.context_for_llm
-    )
+    modified_context = document.preceding_context(selected_item.original_context_item)
 
     # Prep the prompt
     messages = [
@@ -78,11 +84,14 @@ async def _single_disambiguation_attempt(
         context_desc=f"disambiguation attempt for '{sentence}'",
     )
 
+    if not response:
+        failed.add(selected_item.original_context_item.original_index)
+        return False, None
+
     # Skip sentences we can't disambiguate - better to drop them
     # than have unclear claims
     if (
-        not response
-        or not response.disambiguated_sentence
+        not response.disambiguated_sentence
         or response.cannot_be_disambiguated
     ):
         return False, None
@@ -125,20 +134,71 @@ async def disambiguation_node(state: State) -> Dict[str, List[DisambiguatedConte
         logger.warning("Nothing to disambiguate")
         return {}
 
+    document = SentenceDocument.from_state(state)
+
     # Get LLM with temperature 0.2 for multiple completions
     llm = get_llm(completions=COMPLETIONS)
 
+    # Sentences whose context is unchanged since an earlier run are reused
+    keys = [
+        _memo.key(
+            llm,
+            item.processed_sentence,
+            document.preceding_context(item.original_context_item),
+        )
+        for item in selected_contents
+    ]
+    memoized = await _memo.get_many(keys)
+    reused = [
+        _create_disambiguated_content(disambiguated, item)
+        for item, disambiguated in zip(selected_contents, memoized)
+        if disambiguated not in (MISS, None)
+    ]
+    pending = [
+        item for item, disambiguated in zip(selected_contents, memoized) if disambiguated is MISS
+    ]
+
     # Process all selected contents with voting
+    failed: Set[int] = set()
     disambiguated_contents = await process_with_voting(
-        items=selected_contents,
-        processor=_single_disambiguation_attempt,
+        items=pending,
+        processor=partial(_single_disambiguation_attempt, document=document, failed=failed),
         llm=llm,
         completions=COMPLETIONS,
         min_successes=MIN_SUCCESSES,
+        max_concurrency=MAX_CONCURRENCY,
+        early_exit=EARLY_EXIT,
         result_factory=_create_disambiguated_content,
         description="sentence for disambiguation",
     )
 
+    # Selected contents are unique per sentence index
+    disambiguated_by_index = {
+        content.original_selected_item.original_context_item.original_index: (
+            content.disambiguated_sentence
+        )
+        for content in disambiguated_contents
+    }
+    # A rejection is only trusted if no attempt's LLM call failed
+    await _memo.set_many(
+        [
+            (
+                key,
+                disambiguated_by_index.get(
+                    item.original_context_item.original_index,
+                    FAILED if item.original_context_item.original_index in failed else None,
+                ),
+            )
+            for key, item, disambiguated in zip(keys, selected_contents, memoized)
+            if disambiguated is MISS
+        ]
+    )
+
+    disambiguated_contents = sorted(
+        reused + disambiguated_contents,
+        key=lambda content: content.original_selected_item.original_context_item.original_index,
+    )
+
     if not disambiguated_contents:
         logger.info("Nothing could be disambiguated")
         return {}
@@ -1,16 +1,21 @@
 """Selection node - identifies verifiable content in sentences.
 
-Filters out fluff and keeps only sentences with factual claims.
+Filters out fluff and keeps only sentences with factual claims. A local
+pre-filter skips obvious non-claims before any LLM call.
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from functools import partial
+from typing import Dict, List, Optional, Set, Tuple
 
 from langchain_core.prompts import ChatPromptTemplate
 from pydantic import BaseModel, Field
 from utils import call_llm_with_structured_output, get_llm, process_with_voting
 
-from claim_extractor.config import SELECTION_CONFIG
+from claim_extractor.config import SELECTION_CONFIG, SELECTION_PREFILTER_CONFIG
+from claim_extractor.context import SentenceDocument
+from claim_extractor.memo import FAILED, MISS, StageMemo
+from claim_extractor.prefilter import log_outcomes, prefilter_sentences, shadow_report
 from claim_extractor.prompts import HUMAN_PROMPT, SELECTION_SYSTEM_PROMPT
 from claim_extractor.schemas import ContextualSentence, SelectedContent, State
 
@@ -19,6 +24,13 @@ logger = logging.getLogger(__name__)
 
 COMPLETIONS = SELECTION_CONFIG["completions"]
 MIN_SUCCESSES = SELECTION_CONFIG["min_successes"]
+MAX_CONCURRENCY = SELECTION_CONFIG["max_concurrency"]
+EARLY_EXIT = SELECTION_CONFIG["early_exit"]
+PREFILTER_ENABLED = SELECTION_PREFILTER_CONFIG["enabled"]
+PREFILTER_SHADOW_MODE = SELECTION_PREFILTER_CONFIG["shadow_mode"]
+
+# Keyed by the sentence and its context window
+_memo = StageMemo("selection", prompts=(SELECTION_SYSTEM_PROMPT, HUMAN_PROMPT))
 
 
 class SelectionOutput(BaseModel):
@@ -36,13 +48,18 @@ class SelectionOutput(BaseModel):
 
 
 async def _single_selection_attempt(
-    contextual_item: ContextualSentence, llm
+    contextual_item: ContextualSentence,
+    llm,
+    document: SentenceDocument,
+    failed: Set[int],
 ) -> Tuple[bool, Optional[str]]:
     """Make a single selection attempt.
 
     Args:
         contextual_item: Sentence with context
         llm: LLM instance
+        document: The sentences the context window refers to
+        failed: Collects original_index of sentences with a failed LLM call
 
     Returns:
         (success, processed_sentence)
@@ -59,7 +76,7 @@ async def _single_selection_attempt(
 
     prompt_messages = messages.invoke(
         {
-            "excerpt": contextual_item.context_for_llm,
+            "excerpt": document.selection_context(contextual_item),
             "sentence": sentence,
         }
     )
@@ -72,10 +89,13 @@ async def _single_selection_attempt(
         context_desc=f"selection attempt for '{sentence}'",
     )
 
-    # If LLM call failed or no verifiable content
+    if not selection_response:
+        failed.add(contextual_item.original_index)
+        return False, None
+
+    # No verifiable content
     if (
-        not selection_response
-        or not selection_response.processed_sentence
+        not selection_response.processed_sentence
         or selection_response.no_verifiable_claims
     ):
         return False, None
@@ -124,20 +144,91 @@ async def selection_node(state: State) -> Dict[str, List[SelectedContent]]:
         logger.warning("No sentences to process")
         return {}
 
+    # Skip confident non-claims locally, unless we're only measuring
+    candidates, dropped = contextual_sentences, {}
+    if PREFILTER_ENABLED:
+        kept, dropped = prefilter_sentences(contextual_sentences)
+        if not PREFILTER_SHADOW_MODE:
+            candidates = kept
+            if dropped:
+                logger.info(
+                    f"Pre-filter skipped {len(dropped)} of {len(contextual_sentences)} sentences"
+                )
+
+    if not candidates:
+        logger.info("No verifiable claims found")
+        return {}
+
+    document = SentenceDocument.from_state(state)
+
     # Get LLM with temperature 0.2 since we're using multiple completions
     llm = get_llm(completions=COMPLETIONS)
 
+    # Sentences whose context is unchanged since an earlier run are reused
+    keys = [
+        _memo.key(llm, document.selection_context(item), item.original_sentence)
+        for item in candidates
+    ]
+    memoized = await _memo.get_many(keys)
+    reused = [
+        _create_selected_content(processed, item)
+        for item, processed in zip(candidates, memoized)
+        if processed not in (MISS, None)
+    ]
+    pending = [item for item, processed in zip(candidates, memoized) if processed is MISS]
+
     # Process all sentences with voting
+    failed: Set[int] = set()
     selected_contents = await process_with_voting(
-        items=contextual_sentences,
-        processor=_single_selection_attempt,
+        items=pending,
+        processor=partial(_single_selection_attempt, document=document, failed=failed),
         llm=llm,
         completions=COMPLETIONS,
         min_successes=MIN_SUCCESSES,
+        max_concurrency=MAX_CONCURRENCY,
+        early_exit=EARLY_EXIT,
         result_factory=_create_selected_content,
         description="sentence",
     )
 
+    selected_by_index = {
+        content.original_context_item.original_index: content.processed_sentence
+        for content in selected_contents
+    }
+    # A rejection is only trusted if no attempt's LLM call failed
+    await _memo.set_many(
+        [
+            (
+                key,
+                selected_by_index.get(
+                    item.original_index,
+                    FAILED if item.original_index in failed else None,
+                ),
+            )
+            for key, item, processed in zip(keys, candidates, memoized)
+            if processed is MISS
+        ]
+    )
+    # Rejections caused by failed LLM calls would only add noise to the labels
+    log_outcomes(
+        [
+            item
+            for item in pending
+            if item.original_index in selected_by_index or item.original_index not in failed
+        ],
+        set(selected_by_index),
+    )
+
+    selected_contents = sorted(
+        reused + selected_contents,
+        key=lambda content: content.original_context_item.original_index,
+    )
+    selected_indices = {
+        content.original_context_item.original_index for content in selected_contents
+    }
+    if PREFILTER_ENABLED and PREFILTER_SHADOW_MODE and dropped:
+        logger.info(f"Pre-filter shadow report: {shadow_report(dropped, selected_indices)}")
+
     if not selected_contents:
         logger.info("No verifiable claims found")
         return {}
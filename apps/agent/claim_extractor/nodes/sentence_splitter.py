@@ -1,67 +1,104 @@
 """Sentence splitting and context creation.
 
 Chunks input text into sentences and builds context windows for each one.
+Windows are stored as index bounds into the sentence list; the context
+text is only built when a stage needs it (see claim_extractor/context.py).
+
+The punkt model is loaded once when this module is imported, from the
+vendored NLTK data directory (NLTK_DATA) or NLTK's default locations. It is
+never downloaded at request time; a missing model fails at startup.
 """
 
 import logging
-from typing import Dict, List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 
 import nltk
+from nltk.tokenize import PunktTokenizer
+from utils.settings import settings
 
-from claim_extractor.config import CONTEXT_WINDOWS
+from claim_extractor.config import CONTEXT_WINDOWS, SENTENCE_SPLITTER_CONFIG
 from claim_extractor.schemas import ContextualSentence, State
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# apps/agent, where `pnpm setup:dev` vendors the NLTK data
+AGENT_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _nltk_data_dir() -> Optional[str]:
+    """NLTK_DATA as an absolute path; relative paths also try the agent root."""
+    if not settings.nltk_data_dir:
+        return None
+
+    path = Path(settings.nltk_data_dir).expanduser()
+    if not path.is_absolute() and not path.exists():
+        path = AGENT_ROOT / path
+    return str(path.resolve())
+
+
+def load_sentence_tokenizer(
+    language: str = SENTENCE_SPLITTER_CONFIG["language"],
+) -> PunktTokenizer:
+    """Load the punkt sentence tokenizer from local NLTK data.
+
+    Args:
+        language: Punkt model language
+
+    Returns:
+        The loaded tokenizer
 
-def ensure_nltk_resources() -> None:
-    """Download NLTK stuff if needed."""
-    resources = ["tokenizers/punkt_tab", "tokenizers/punkt"]
+    Raises:
+        RuntimeError: If the punkt_tab model is not installed locally
+    """
+    data_dir = _nltk_data_dir()
+    if data_dir and data_dir not in nltk.data.path:
+        nltk.data.path.insert(0, data_dir)
 
-    for resource in resources:
-        try:
-            nltk.data.find(resource)
-            return
-        except LookupError:
-            continue
+    try:
+        tokenizer = PunktTokenizer(language)
+    except LookupError as e:
+        target = data_dir or "<dir>"
+        raise RuntimeError(
+            f"NLTK punkt_tab model for '{language}' not found in {nltk.data.path}. "
+            f"Vendor it with: python -m nltk.downloader -d {target} punkt_tab "
+            f"(and set NLTK_DATA={target})"
+        ) from e
 
-    # None found, download both
-    logger.info("Downloading NLTK resources...")
-    nltk.download("punkt_tab", quiet=True)
-    nltk.download("punkt", quiet=True)
+    logger.info(f"Loaded punkt sentence tokenizer ({language})")
+    return tokenizer
+
+
+# Warm-up: load once per process instead of resolving the model per call
+_sentence_tokenizer = load_sentence_tokenizer()
 
 
 async def _sentence_splitter_and_context_creator(
     answer_text: str,
     p_sentences: int = 1,
     f_sentences: int = 1,
-    include_metadata: bool = False,
     metadata: Optional[str] = None,
-) -> List[ContextualSentence]:
+) -> Tuple[List[str], List[ContextualSentence]]:
     """Split text into sentences and add context windows.
 
     Args:
         answer_text: Text to split
         p_sentences: Number of preceding sentences for context
         f_sentences: Number of following sentences for context
-        include_metadata: Whether to include metadata
         metadata: Source metadata
 
     Returns:
-        List of sentences with context
+        (all sentences, sentences with their context window bounds)
     """
     logger.info("Stage 1: Sentence Splitting and Context Creation")
 
-    # Get tokenizer
-    ensure_nltk_resources()
-
     # Split by paragraphs first, then sentences
     # This handles bullet lists and paragraph breaks better
     paragraphs = [p.strip() for p in answer_text.split("\\n") if p.strip()]
     raw_sentences_from_paragraphs: List[str] = []
     for paragraph in paragraphs:
-        raw_sentences_from_paragraphs.extend(nltk.sent_tokenize(paragraph))
+        raw_sentences_from_paragraphs.extend(_sentence_tokenizer.tokenize(paragraph))
 
     # Use the paragraph-aware sentences
     raw_sentences = raw_sentences_from_paragraphs
@@ -86,37 +123,13 @@ async def _sentence_splitter_and_context_creator(
     contextual_sentences: List[ContextualSentence] = []
 
     for i, sentence in enumerate(merged_sentences):
-        context_parts: List[str] = []
-
-        # Add metadata if available
-        if include_metadata and metadata:
-            context_parts.append(f"[Document Metadata: {metadata}]")
-
-        # Add preceding sentences
-        start_index = max(0, i - p_sentences)
-        if start_index < i:
-            context_parts.append("\n[Preceding Sentences:]")
-            for j in range(start_index, i):
-                context_parts.append(merged_sentences[j])
-
-        # Add the sentence itself
-        context_parts.append(f"\n[Sentence of Interest for current task:]\n{sentence}")
-
-        # Add following sentences
-        end_index = min(len(merged_sentences), i + 1 + f_sentences)
-        if (i + 1) < end_index:
-            context_parts.append("\n[Following Sentences:]")
-            for j in range(i + 1, end_index):
-                context_parts.append(merged_sentences[j])
-
-        # Package it up
-        full_context_str = "\n".join(context_parts)
         contextual_sentences.append(
             ContextualSentence(
                 original_sentence=sentence,
-                context_for_llm=full_context_str,
                 metadata=metadata,
                 original_index=i,
+                window_start=max(0, i - p_sentences),
+                window_end=min(len(merged_sentences), i + 1 + f_sentences),
             )
         )
 
@@ -125,17 +138,17 @@ async def _sentence_splitter_and_context_creator(
         logger.debug(f"Context created for: '{sentence_preview}'")
 
     logger.info(f"Processed {len(contextual_sentences)} sentences with context")
-    return contextual_sentences
+    return merged_sentences, contextual_sentences
 
 
-async def sentence_splitter_node(state: State) -> Dict[str, List[ContextualSentence]]:
+async def sentence_splitter_node(state: State) -> Dict[str, Any]:
     """Split text into sentences and create context windows.
 
     Args:
         state: Current workflow state
 
     Returns:
-        Dictionary with contextual_sentences key
+        Dictionary with sentences and contextual_sentences keys
     """
     # Get what we need from state
     answer_text = state.answer_text
@@ -146,8 +159,8 @@ async def sentence_splitter_node(state: State) -> Dict[str, List[ContextualSente
     f_sentences = CONTEXT_WINDOWS["selection"]["following_sentences"]
 
     # Process the text
-    contextual_sentences = await _sentence_splitter_and_context_creator(
-        answer_text, p_sentences, f_sentences, bool(metadata), metadata
+    sentences, contextual_sentences = await _sentence_splitter_and_context_creator(
+        answer_text, p_sentences, f_sentences, metadata
     )
 
-    return {"contextual_sentences": contextual_sentences}
+    return {"sentences": sentences, "contextual_sentences": contextual_sentences}
@@ -1,19 +1,44 @@
 """Validation node - verifies claims are properly formed sentences.
 
 Makes sure claims are complete declarative sentences ready for fact-checking.
+Claims are validated in batches packed into one prompt, falling back to
+per-claim calls for anything a batch fails to answer.
 """
 
 import asyncio
 import logging
-from typing import Dict, Sequence
+from typing import Dict, List, Optional, Sequence
 
 from pydantic import BaseModel, Field
-from claim_extractor.prompts import VALIDATION_HUMAN_PROMPT, VALIDATION_SYSTEM_PROMPT
+from claim_extractor.config import VALIDATION_CONFIG
+from claim_extractor.memo import FAILED, MISS, StageMemo
+from claim_extractor.prompts import (
+    BATCH_VALIDATION_HUMAN_PROMPT,
+    BATCH_VALIDATION_SYSTEM_PROMPT,
+    VALIDATION_HUMAN_PROMPT,
+    VALIDATION_SYSTEM_PROMPT,
+)
 from claim_extractor.schemas import PotentialClaim, State, ValidatedClaim
-from utils import get_llm, call_llm_with_structured_output
+from utils import count_tokens, get_llm, call_llm_with_structured_output
 
 logger = logging.getLogger(__name__)
 
+BATCHING = VALIDATION_CONFIG["batching"]
+MAX_BATCH_SIZE = VALIDATION_CONFIG["max_batch_size"]
+BATCH_TOKEN_BUDGET = VALIDATION_CONFIG["batch_token_budget"]
+CLAIM_OVERHEAD_TOKENS = 8  # Numbering, newline and per-claim output
+
+# Validation only looks at the claim text itself
+_memo = StageMemo(
+    "validation",
+    prompts=(
+        VALIDATION_SYSTEM_PROMPT,
+        VALIDATION_HUMAN_PROMPT,
+        BATCH_VALIDATION_SYSTEM_PROMPT,
+        BATCH_VALIDATION_HUMAN_PROMPT,
+    ),
+)
+
 
 class ValidationOutput(BaseModel):
     """Response schema for validation LLM calls."""
@@ -23,14 +48,47 @@ class ValidationOutput(BaseModel):
     )
 
 
-async def _validate_claim(potential_claim: PotentialClaim) -> ValidatedClaim:
+class ClaimValidation(BaseModel):
+    """Validation result for one claim of a batch."""
+
+    index: int = Field(description="The number of the claim in the list")
+    is_complete_declarative: bool = Field(
+        description="Whether the claim is a complete declarative sentence"
+    )
+
+
+class BatchValidationOutput(BaseModel):
+    """Response schema for batched validation LLM calls."""
+
+    results: List[ClaimValidation] = Field(
+        default_factory=list, description="One result per claim in the list"
+    )
+
+
+def _to_validated_claim(potential_claim: PotentialClaim, is_valid: bool) -> ValidatedClaim:
+    log_level = logging.INFO if is_valid else logging.WARNING
+    logger.log(
+        log_level,
+        f"Claim validation {'succeeded' if is_valid else 'failed'}: '{potential_claim.claim_text}'",
+    )
+
+    return ValidatedClaim(
+        claim_text=potential_claim.claim_text,
+        is_complete_declarative=is_valid,
+        disambiguated_sentence=potential_claim.disambiguated_sentence,
+        original_sentence=potential_claim.original_sentence,
+        original_index=potential_claim.original_index,
+    )
+
+
+async def _validate_claim(potential_claim: PotentialClaim) -> Optional[bool]:
     """Check if a claim is a properly formed complete sentence.
 
     Args:
         potential_claim: Claim to validate
 
     Returns:
-        Validation result
+        Whether the claim is valid, or None if the LLM call failed
     """
     logger.debug(f"Validating claim: '{potential_claim.claim_text}'")
 
@@ -50,26 +108,83 @@ async def _validate_claim(potential_claim: PotentialClaim) -> ValidatedClaim:
         context_desc=f"validation of claim '{potential_claim.claim_text}'",
     )
 
-    # Check if valid
-    is_valid = False
-    if response and response.is_complete_declarative:
-        is_valid = True
+    if not response:
+        return None
+    return response.is_complete_declarative
 
-    log_level = logging.INFO if is_valid else logging.WARNING
-    logger.log(
-        log_level,
-        f"Claim validation {'succeeded' if is_valid else 'failed'}: '{potential_claim.claim_text}'",
-    )
 
-    # Return result
-    return ValidatedClaim(
-        claim_text=potential_claim.claim_text,
-        is_complete_declarative=is_valid,
-        disambiguated_sentence=potential_claim.disambiguated_sentence,
-        original_sentence=potential_claim.original_sentence,
-        original_index=potential_claim.original_index,
+def _pack_batches(potential_claims: Sequence[PotentialClaim]) -> List[List[PotentialClaim]]:
+    """Split claims into batches that fit the size and token budget.
+
+    Args:
+        potential_claims: Claims to validate
+
+    Returns:
+        Batches in the original claim order
+    """
+    batches: List[List[PotentialClaim]] = []
+    batch: List[PotentialClaim] = []
+    batch_tokens = 0
+
+    for claim in potential_claims:
+        tokens = count_tokens(claim.claim_text) + CLAIM_OVERHEAD_TOKENS
+        if batch and (len(batch) >= MAX_BATCH_SIZE or batch_tokens + tokens > BATCH_TOKEN_BUDGET):
+            batches.append(batch)
+            batch, batch_tokens = [], 0
+        batch.append(claim)
+        batch_tokens += tokens
+
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+async def _validate_batch(batch: List[PotentialClaim]) -> List[Optional[bool]]:
+    """Validate a batch of claims in one call.
+
+    Claims the response does not cover (or a failed call) are validated one
+    by one instead.
+
+    Args:
+        batch: Claims to validate
+
+    Returns:
+        Validity per claim in batch order, None where the LLM call failed
+    """
+    if len(batch) == 1:
+        return [await _validate_claim(batch[0])]
+
+    numbered = "\n".join(f"[{i}] {claim.claim_text}" for i, claim in enumerate(batch, 1))
+    messages = [
+        ("system", BATCH_VALIDATION_SYSTEM_PROMPT),
+        ("human", BATCH_VALIDATION_HUMAN_PROMPT.format(claims=numbered)),
+    ]
+
+    response = await call_llm_with_structured_output(
+        llm=get_llm(),
+        output_class=BatchValidationOutput,
+        messages=messages,
+        context_desc=f"batch validation of {len(batch)} claims",
     )
 
+    verdicts: Dict[int, bool] = {}
+    if response:
+        verdicts = {
+            result.index: result.is_complete_declarative
+            for result in response.results
+            if 1 <= result.index <= len(batch)
+        }
+
+    missing = [claim for i, claim in enumerate(batch, 1) if i not in verdicts]
+    if missing:
+        logger.warning(
+            f"Batch validation left {len(missing)} of {len(batch)} claims unanswered, "
+            "validating them one by one"
+        )
+    fallback = iter(await asyncio.gather(*(_validate_claim(claim) for claim in missing)))
+
+    return [verdicts[i] if i in verdicts else next(fallback) for i in range(1, len(batch) + 1)]
+
 
 async def validation_node(state: State) -> Dict[str, Sequence[ValidatedClaim]]:
     """Validate claims as complete, properly formed sentences.
@@ -86,11 +201,40 @@ async def validation_node(state: State) -> Dict[str, Sequence[ValidatedClaim]]:
         logger.warning("No claims to validate")
         return {}
 
-    # Validate all claims in parallel
-    validation_results = await asyncio.gather(
-        *[_validate_claim(claim) for claim in potential_claims]
+    # Claims validated by an earlier run are reused
+    llm = get_llm()
+    keys = [_memo.key(llm, claim.claim_text) for claim in potential_claims]
+    memoized = await _memo.get_many(keys)
+    pending = [claim for claim, is_valid in zip(potential_claims, memoized) if is_valid is MISS]
+
+    # Validate all claims in parallel, many per call when batching
+    if BATCHING and pending:
+        batches = _pack_batches(pending)
+        logger.info(f"Validating {len(pending)} claims in {len(batches)} batches")
+        batch_results = await asyncio.gather(*[_validate_batch(batch) for batch in batches])
+        pending_results = [result for results in batch_results for result in results]
+    else:
+        pending_results = await asyncio.gather(*[_validate_claim(claim) for claim in pending])
+
+    # Failed calls count as invalid for this run but are not stored
+    await _memo.set_many(
+        [
+            (key, FAILED if is_valid is None else is_valid)
+            for key, is_valid in zip(
+                (key for key, is_valid in zip(keys, memoized) if is_valid is MISS),
+                pending_results,
+            )
+        ]
     )
 
+    fresh_results = iter(pending_results)
+    validation_results = [
+        _to_validated_claim(
+            claim, bool(next(fresh_results) if is_valid is MISS else is_valid)
+        )
+        for claim, is_valid in zip(potential_claims, memoized)
+    ]
+
     # Filter out invalid and duplicate claims
     validated_claims = []
     seen_claims = set()
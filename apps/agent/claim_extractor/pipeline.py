@@ -0,0 +1,103 @@
+"""Per-sentence streaming extraction.
+
+Runs each sentence through selection, disambiguation, decomposition and
+validation on its own and yields validated claims as soon as their
+sentence is done, instead of waiting for every sentence at every stage.
+"""
+
+import asyncio
+import logging
+from typing import AsyncIterator, List, Optional
+
+from claim_extractor.config import STREAMING_CONFIG
+from claim_extractor.nodes import (
+    decomposition_node,
+    disambiguation_node,
+    selection_node,
+    sentence_splitter_node,
+    validation_node,
+)
+from claim_extractor.schemas import ContextualSentence, State, ValidatedClaim
+
+logger = logging.getLogger(__name__)
+
+MAX_PARALLEL_SENTENCES = STREAMING_CONFIG["max_parallel_sentences"]
+
+# Stages run in order on a single-sentence state
+_SENTENCE_STAGES = (
+    selection_node,
+    disambiguation_node,
+    decomposition_node,
+    validation_node,
+)
+
+
+async def extract_sentence_claims(
+    sentence: ContextualSentence, document_state: State
+) -> List[ValidatedClaim]:
+    """Run one sentence through every extraction stage.
+
+    Args:
+        sentence: Sentence with its context window
+        document_state: State holding every sentence of the text
+
+    Returns:
+        Validated claims from the sentence
+    """
+    # Shallow copy - every sentence shares the one sentence list
+    state = document_state.model_copy(update={"contextual_sentences": [sentence]})
+
+    for stage in _SENTENCE_STAGES:
+        update = await stage(state)
+        if not update:
+            return []
+        # The state holds one sentence, so updates can replace rather than add
+        state = state.model_copy(update=update)
+
+    return state.validated_claims
+
+
+async def stream_claims(
+    answer_text: str, metadata: Optional[str] = None
+) -> AsyncIterator[ValidatedClaim]:
+    """Yield validated claims as each sentence finishes extraction.
+
+    Claims repeated verbatim across sentences are yielded once, like in
+    validation_node.
+
+    Args:
+        answer_text: Text to extract claims from
+        metadata: Source metadata
+
+    Yields:
+        Validated claims in order of completion
+    """
+    state = State(answer_text=answer_text, metadata=metadata)
+    split = await sentence_splitter_node(state)
+    sentences = split["contextual_sentences"]
+    document_state = state.model_copy(update={"sentences": split["sentences"]})
+    semaphore = asyncio.Semaphore(MAX_PARALLEL_SENTENCES)
+
+    async def extract(sentence: ContextualSentence) -> List[ValidatedClaim]:
+        async with semaphore:
+            try:
+                return await extract_sentence_claims(sentence, document_state)
+            except Exception as e:
+                logger.error(f"Extraction failed for sentence {sentence.original_index}: {e}")
+                return []
+
+    tasks = [asyncio.create_task(extract(sentence)) for sentence in sentences]
+    seen_claims = set()
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            for claim in await next_done:
+                if claim.claim_text in seen_claims:
+                    continue
+                seen_claims.add(claim.claim_text)
+                yield claim
+    finally:
+        # The consumer may stop early - don't leave sentences running
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
@@ -0,0 +1,190 @@
+"""Local pre-filter for the selection stage.
+
+Scores how likely a sentence is to contain no verifiable claim, so obvious
+non-claims (questions, greetings, bare fragments, headings, opinions) can
+be skipped before any LLM call. Scores come from conservative heuristics
+and, when a trained model is configured, a small scikit-learn classifier
+trained on logged selection outcomes (see scripts/train_prefilter.py).
+"""
+
+import json
+import logging
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from claim_extractor.config import SELECTION_PREFILTER_CONFIG
+from claim_extractor.schemas import ContextualSentence
+
+logger = logging.getLogger(__name__)
+
+DROP_THRESHOLD = SELECTION_PREFILTER_CONFIG["drop_threshold"]
+MODEL_PATH = SELECTION_PREFILTER_CONFIG["model_path"]
+OUTCOME_LOG_PATH = SELECTION_PREFILTER_CONFIG["outcome_log_path"]
+
+# Confidence that a sentence holds no verifiable claim, per heuristic
+HEURISTIC_CONFIDENCE = {
+    "fragment": 0.97,
+    "greeting": 0.97,
+    "question": 0.85,  # Below the default threshold: "Did you know ...?" can hide a claim
+    "heading": 0.8,
+    "opinion": 0.75,
+}
+
+# Whole-sentence greetings only, optionally followed by a filler or a name
+_GREETING_PATTERN = re.compile(
+    r"^(hi|hello|hey|thanks|thank you|welcome|good (morning|afternoon|evening)|"
+    r"best regards|regards|cheers|ahoj|dobrý den|dobrý večer|děkuji|díky|"
+    r"vítejte|s pozdravem)"
+    r"(\s+(there|all|everyone|everybody|again|so much|very much|a lot|moc|"
+    r"for (reading|listening|watching|your (time|attention))))?"
+    r"(\s*,\s*[^\W\d_]+(\s+[^\W\d_]+)?)?\s*[.!]*$",
+    re.IGNORECASE,
+)
+_OPINION_PATTERN = re.compile(
+    r"^(i think|i believe|i feel|in my (opinion|view)|imho|personally|"
+    r"myslím si|podle mě|podle mého názoru|osobně)\b",
+    re.IGNORECASE,
+)
+_WORD_PATTERN = re.compile(r"[^\W\d_]+")
+_LIST_MARKER_PATTERN = re.compile(r"^([-*•#>]+|\d{1,2}[.)])\s+")
+
+
+def heuristic_score(sentence: str) -> Tuple[float, Optional[str]]:
+    """Score a sentence with the built-in heuristics.
+
+    Returns:
+        (confidence that the sentence has no claim, heuristic name or None)
+    """
+    text = _LIST_MARKER_PATTERN.sub("", sentence.strip())
+    words = _WORD_PATTERN.findall(text)
+    has_number = bool(re.search(r"\d", text))
+    # Capitalized words after the first are a cheap stand-in for named entities
+    has_entity = any(word[0].isupper() for word in words[1:])
+
+    # Single words only: two are enough for a claim ("Obama resigned"),
+    # so short lines are left to the (lower confidence) heading rule
+    if len(words) < 2 and not has_number and not text.endswith((".", "!")):
+        return HEURISTIC_CONFIDENCE["fragment"], "fragment"
+    if _GREETING_PATTERN.match(text):
+        return HEURISTIC_CONFIDENCE["greeting"], "greeting"
+    # Questions naming a number or an entity often carry a claim
+    if text.endswith("?") and not has_number and not has_entity:
+        return HEURISTIC_CONFIDENCE["question"], "question"
+    # Short lines without terminal punctuation or numbers, e.g. "Our Story:"
+    if len(words) <= 6 and not text.endswith((".", "!", "?")) and not has_number:
+        return HEURISTIC_CONFIDENCE["heading"], "heading"
+    if _OPINION_PATTERN.match(text):
+        return HEURISTIC_CONFIDENCE["opinion"], "opinion"
+
+    return 0.0, None
+
+
+@lru_cache(maxsize=1)
+def _load_model() -> Optional[Any]:
+    if not MODEL_PATH or not Path(MODEL_PATH).exists():
+        return None
+    try:
+        import joblib
+
+        return joblib.load(MODEL_PATH)
+    except Exception as e:
+        logger.warning(f"Failed to load pre-filter model from {MODEL_PATH}: {e}")
+        return None
+
+
+def score_sentences(sentences: Sequence[str]) -> List[Tuple[float, Optional[str]]]:
+    """Score sentences by how likely they are to contain no verifiable claim.
+
+    Args:
+        sentences: Sentences to score
+
+    Returns:
+        (confidence, reason) per sentence; the reason names the heuristic or
+        "model" for whichever gave the higher confidence
+    """
+    scores = [heuristic_score(sentence) for sentence in sentences]
+
+    model = _load_model()
+    if model is None or not sentences:
+        return scores
+
+    # Label 1 means the selection stage found no verifiable claim
+    probabilities = model.predict_proba(list(sentences))[:, 1]
+    return [
+        (float(probability), "model") if probability > confidence else (confidence, reason)
+        for (confidence, reason), probability in zip(scores, probabilities)
+    ]
+
+
+def prefilter_sentences(
+    contextual_sentences: Sequence[ContextualSentence],
+    threshold: float = DROP_THRESHOLD,
+) -> Tuple[List[ContextualSentence], Dict[int, str]]:
+    """Split sentences into ones worth an LLM call and confident non-claims.
+
+    Args:
+        contextual_sentences: Sentences about to go through selection
+        threshold: Min confidence for a sentence to be dropped
+
+    Returns:
+        (sentences to keep, reason per dropped original_index)
+    """
+    scores = score_sentences([item.original_sentence for item in contextual_sentences])
+    kept: List[ContextualSentence] = []
+    dropped: Dict[int, str] = {}
+
+    for item, (confidence, reason) in zip(contextual_sentences, scores):
+        if reason is not None and confidence >= threshold:
+            dropped[item.original_index] = reason
+        else:
+            kept.append(item)
+
+    return kept, dropped
+
+
+def shadow_report(dropped: Dict[int, str], selected_indices: Set[int]) -> Dict[str, Any]:
+    """Compare would-be drops with what the LLM actually selected.
+
+    Args:
+        dropped: Reason per sentence the pre-filter would have dropped
+        selected_indices: original_index of every sentence the LLM selected
+
+    Returns:
+        Counts per reason plus overall precision of the would-be drops
+    """
+    report: Dict[str, Any] = {"would_drop": len(dropped), "false_drops": 0, "by_reason": {}}
+
+    for index, reason in dropped.items():
+        counts = report["by_reason"].setdefault(reason, {"would_drop": 0, "false_drops": 0})
+        counts["would_drop"] += 1
+        if index in selected_indices:
+            counts["false_drops"] += 1
+            report["false_drops"] += 1
+
+    report["precision"] = (
+        1 - report["false_drops"] / report["would_drop"] if report["would_drop"] else None
+    )
+    return report
+
+
+def log_outcomes(
+    contextual_sentences: Iterable[ContextualSentence], selected_indices: Set[int]
+) -> None:
+    """Append selection outcomes to the training log, if one is configured."""
+    if not OUTCOME_LOG_PATH:
+        return
+
+    try:
+        path = Path(OUTCOME_LOG_PATH)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as log_file:
+            for item in contextual_sentences:
+                record = {
+                    "sentence": item.original_sentence,
+                    "selected": item.original_index in selected_indices,
+                }
+                log_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except OSError as e:
+        logger.warning(f"Failed to log selection outcomes to {OUTCOME_LOG_PATH}: {e}")
@@ -12,6 +12,11 @@ Claim:
 {claim}
 """
 
+BATCH_VALIDATION_HUMAN_PROMPT = """
+Claims:
+{claims}
+"""
+
 ### SYSTEM PROMPTS ###
 
 SELECTION_SYSTEM_PROMPT = """
@@ -206,3 +211,19 @@ Claim: Sourcing materials from sustainable suppliers
 C = Sourcing materials from sustainable suppliers
 In isolation, is C a complete, declarative sentence? It's missing a subject and a verb, so C is not a complete, declarative sentence.
 """
+
+BATCH_VALIDATION_SYSTEM_PROMPT = """
+## Overview
+You will be given a numbered list of claims. For each claim C, your task is to determine whether C, in isolation, is a complete, declarative sentence. Judge every claim independently of the others - the other claims in the list are NOT context for it.
+
+Return exactly one result per claim, using the claim's number as its index, with is_complete_declarative set to true if C is a complete, declarative sentence and false otherwise.
+
+## Examples
+Claims:
+[1] Sourcing materials from sustainable suppliers is an example of how companies are improving their sustainability practices
+[2] Sourcing materials from sustainable suppliers
+
+Results:
+- index 1: C is a complete, declarative sentence -> is_complete_declarative = true
+- index 2: It's missing a subject and a verb, so C is not a complete, declarative sentence -> is_complete_declarative = false
+"""
@@ -10,18 +10,25 @@ from pydantic import BaseModel, Field
 
 
 class ContextualSentence(BaseModel):
-    """A sentence with its surrounding context."""
+    """A sentence with its surrounding context.
+
+    The context is a window of State.sentences; see SentenceDocument for
+    turning it into text for the LLM.
+    """
 
     original_sentence: str = Field(description="The raw sentence from the source text")
-    context_for_llm: str = Field(
-        description="Full context for the LLM including surrounding sentences and metadata"
-    )
     metadata: Optional[str] = Field(
         default=None, description="Additional metadata about the source"
     )
     original_index: int = Field(
         description="Index of the sentence in the original text"
     )
+    window_start: int = Field(
+        description="Index of the first preceding sentence in the context window"
+    )
+    window_end: int = Field(
+        description="Index one past the last following sentence in the context window"
+    )
 
 
 class SelectedContent(BaseModel):
@@ -83,6 +90,9 @@ class State(BaseModel):
     """The workflow graph state object."""
 
     answer_text: str = Field(description="The answer text being analyzed")
+    sentences: List[str] = Field(
+        default_factory=list, description="Every sentence of the text, stored once"
+    )
     contextual_sentences: List[ContextualSentence] = Field(
         default_factory=list, description="Sentences with their surrounding context"
     )
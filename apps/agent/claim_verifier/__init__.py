@@ -10,7 +10,9 @@ from claim_verifier.schemas import (
     ClaimVerifierState,
     VerificationResult,
     IntermediateAssessment,
+    VerdictProvenance,
 )
+from claim_verifier.verdict_store import lookup_verdict, store_verdict
 
 __all__ = [
     # Main functionality
@@ -22,4 +24,8 @@ __all__ = [
     "Verdict",
     "VerificationResult",
     "IntermediateAssessment",
+    "VerdictProvenance",
+    # Verdict reuse
+    "lookup_verdict",
+    "store_verdict",
 ]
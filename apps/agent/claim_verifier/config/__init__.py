@@ -8,6 +8,7 @@ from claim_verifier.config.nodes import (
     EVIDENCE_RETRIEVAL_CONFIG,
     EVIDENCE_EVALUATION_CONFIG,
     ITERATIVE_SEARCH_CONFIG,
+    VERDICT_STORE_CONFIG,
 )
 
 __all__ = [
@@ -16,4 +17,5 @@ __all__ = [
     "EVIDENCE_RETRIEVAL_CONFIG",
     "EVIDENCE_EVALUATION_CONFIG",
     "ITERATIVE_SEARCH_CONFIG",
+    "VERDICT_STORE_CONFIG",
 ]
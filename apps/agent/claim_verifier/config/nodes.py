@@ -11,14 +11,38 @@ QUERY_GENERATION_CONFIG = {
 EVIDENCE_RETRIEVAL_CONFIG = {
     "results_per_query": 5,  # Number of search results to fetch per query
     "search_provider": "serper",  # Search provider: "exa" or "tavily"
+    "search_mode": "single",  # "single", "fanout" (all providers) or "hedged"
+    "search_providers": ["serper", "exa", "tavily"],  # Priority order for fanout/hedged
+    "hedge_delay_seconds": 2.0,  # Wait this long before firing the next provider
     "gl": "cz",  # Google Serper gl parameter
     "hl": "cs",  # Google Serper hl parameter
+    "max_characters": 2000,  # Max characters kept per evidence snippet
+    "exa_search_type": "neural",  # Exa search type: "neural", "keyword" or "auto"
+    "tavily_topic": "general",  # Tavily topic: "general", "news" or "finance"
+    "max_connections": 50,  # Connection pool size of the shared HTTP session
+    "cache_enabled": True,  # Reuse results for equivalent queries
+    "cache_ttl_seconds": 6 * 60 * 60,
+    "cache_max_entries": 5_000,  # In-memory tier size
+    "cache_use_redis": False,  # Share cached results across workers via Redis
 }
 
 EVIDENCE_EVALUATION_CONFIG = {
     "temperature": 0.0,  # Zero temp for consistent results
+    "top_k": 12,  # Most relevant evidence items sent to the evaluation prompt
 }
 
 ITERATIVE_SEARCH_CONFIG = {
     "max_iterations": 3,
+    "summary_top_k": 10,  # Most relevant evidence items shown to the search decision
+}
+
+VERDICT_STORE_CONFIG = {
+    "enabled": True,  # Reuse verdicts of claims verified in earlier requests
+    "use_redis": True,  # Share verdicts across workers; memory tier sits in front
+    "max_entries": 10_000,  # In-memory tier size
+    "ttl_seconds": 7 * 24 * 60 * 60,  # Freshness of timeless claims
+    "time_sensitive_ttl_seconds": 6 * 60 * 60,  # Claims about the present or recent dates
+    "near_match_enabled": True,  # Also reuse verdicts of paraphrased claims
+    "near_match_threshold": 0.95,  # Min cosine similarity for a near match (numbers and names must match too)
+    "near_match_max_entries": 5_000,  # Claims kept in the local embedding index
 }
@@ -0,0 +1,177 @@
+"""Evidence post-processing for the claim verification pipeline.
+
+Collapses near-duplicate evidence (mirrors, syndicated copies, tracking-URL
+variants) and ranks evidence by semantic relevance to the claim.
+"""
+
+import hashlib
+import logging
+import re
+from typing import List, Optional, Sequence, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from utils import cosine_scores, embed_texts
+
+from claim_verifier.schemas import Evidence
+
+logger = logging.getLogger(__name__)
+
+# Near-duplicate detection settings
+SHINGLE_SIZE = 3  # Words per shingle
+MIN_SHINGLE_WORDS = 8  # Shorter texts are only matched by URL
+SIMHASH_MAX_DISTANCE = 3  # Max differing bits (of 64) for near-duplicates
+
+_TRACKING_PARAMS = {"fbclid", "gclid", "msclkid", "ocid", "ref", "ref_src", "cmpid"}
+_HOST_PREFIXES = ("www.", "m.", "amp.", "mobile.")
+
+
+def canonicalize_url(url: str) -> str:
+    """Reduce a URL to a canonical form shared by its trivial variants.
+
+    Ignores scheme, common host prefixes (www, m, amp), fragments, tracking
+    parameters, parameter order, trailing slashes and AMP path suffixes.
+    """
+    if not url:
+        return ""
+
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    for prefix in _HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix) :]
+            break
+
+    path = re.sub(r"/(amp|amp\.html)?/?$", "", parts.path) or "/"
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+        )
+    )
+    return f"{host}{path}" + (f"?{query}" if query else "")
+
+
+def simhash(text: str) -> Optional[int]:
+    """64-bit SimHash over word shingles, or None if the text is too short."""
+    words = re.findall(r"\w+", text.casefold())
+    if len(words) < MIN_SHINGLE_WORDS:
+        return None
+
+    weights = [0] * 64
+    for i in range(len(words) - SHINGLE_SIZE + 1):
+        shingle = " ".join(words[i : i + SHINGLE_SIZE]).encode("utf-8")
+        value = int.from_bytes(hashlib.blake2b(shingle, digest_size=8).digest(), "big")
+        for bit in range(64):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+class _Cluster:
+    """A group of evidence items considered copies of the same source.
+
+    Items are added with their canonical URL and SimHash, computed once per
+    item by the caller, so matching only compares strings and integers.
+    """
+
+    def __init__(self, item: Evidence, url: str, fingerprint: Optional[int]):
+        self.best = item
+        self.urls: Set[str] = set()
+        self.hashes: List[int] = []
+        self.add(item, url, fingerprint)
+
+    def add(self, item: Evidence, url: str, fingerprint: Optional[int]) -> None:
+        if url:
+            self.urls.add(url)
+        if fingerprint is not None:
+            self.hashes.append(fingerprint)
+        if _quality(item) > _quality(self.best):
+            self.best = item
+
+    def matches(self, url: str, fingerprint: Optional[int]) -> bool:
+        if url and url in self.urls:
+            return True
+        return fingerprint is not None and any(
+            (fingerprint ^ other).bit_count() <= SIMHASH_MAX_DISTANCE
+            for other in self.hashes
+        )
+
+
+def _signature(item: Evidence) -> Tuple[str, Optional[int]]:
+    return canonicalize_url(item.url), simhash(item.text)
+
+
+def _quality(item: Evidence) -> Tuple[bool, bool, int]:
+    """Prefer copies with a URL, then a title, then the longest text."""
+    return bool(item.url), bool(item.title), len(item.text)
+
+
+def collapse_duplicates(
+    evidence: List[Evidence], existing: Sequence[Evidence] = ()
+) -> List[Evidence]:
+    """Collapse near-duplicate evidence, keeping the best copy of each cluster.
+
+    Items match when their canonical URLs are equal or their text SimHashes
+    are within SIMHASH_MAX_DISTANCE bits.
+
+    Args:
+        evidence: Evidence to deduplicate
+        existing: Evidence already collected; new items duplicating any of
+            it are dropped
+
+    Returns:
+        One item per cluster, in order of first appearance
+    """
+    known = [_Cluster(item, *_signature(item)) for item in existing]
+    clusters: List[_Cluster] = []
+
+    for item in evidence:
+        url, fingerprint = _signature(item)
+        if any(cluster.matches(url, fingerprint) for cluster in known):
+            continue
+        for cluster in clusters:
+            if cluster.matches(url, fingerprint):
+                cluster.add(item, url, fingerprint)
+                break
+        else:
+            clusters.append(_Cluster(item, url, fingerprint))
+
+    collapsed = [cluster.best for cluster in clusters]
+    if len(collapsed) < len(evidence):
+        logger.info(f"Collapsed duplicate evidence: {len(evidence)} → {len(collapsed)}")
+    return collapsed
+
+
+def _evidence_text(evidence: Evidence) -> str:
+    return f"{evidence.title}\n{evidence.text}" if evidence.title else evidence.text
+
+
+async def rank_evidence(
+    claim_text: str, evidence: List[Evidence]
+) -> Tuple[List[Evidence], Optional[List[float]]]:
+    """Order evidence by cosine similarity to the claim, most relevant first.
+
+    Args:
+        claim_text: The claim being verified
+        evidence: Evidence to rank
+
+    Returns:
+        (ranked evidence, matching scores). If embeddings are unavailable the
+        evidence comes back in its original order with scores set to None.
+    """
+    if not evidence:
+        return evidence, None
+
+    vectors = await embed_texts([claim_text] + [_evidence_text(e) for e in evidence])
+    if vectors is None:
+        return evidence, None
+
+    scores = cosine_scores(vectors[0], vectors[1:])
+    ranked = sorted(zip(evidence, scores), key=lambda pair: pair[1], reverse=True)
+
+    logger.debug(
+        f"Ranked {len(evidence)} evidence items for '{claim_text}', "
+        f"top score {ranked[0][1]:.3f}"
+    )
+    return [item for item, _ in ranked], [score for _, score in ranked]
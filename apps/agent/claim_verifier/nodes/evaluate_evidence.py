@@ -13,6 +13,8 @@ from utils import (
     truncate_evidence_for_token_limit,
 )
 
+from claim_verifier.config import EVIDENCE_EVALUATION_CONFIG
+from claim_verifier.evidence import rank_evidence
 from claim_verifier.prompts import (
     EVIDENCE_EVALUATION_HUMAN_PROMPT,
     EVIDENCE_EVALUATION_SYSTEM_PROMPT,
@@ -27,6 +29,8 @@ from claim_verifier.schemas import (
 
 logger = logging.getLogger(__name__)
 
+TOP_K = EVIDENCE_EVALUATION_CONFIG["top_k"]
+
 
 class EvidenceEvaluationOutput(BaseModel):
     verdict: VerificationResult = Field(
@@ -57,6 +61,7 @@ def _format_evidence_snippets(snippets: List[Evidence]) -> str:
 
 async def evaluate_evidence_node(state: ClaimVerifierState) -> dict:
     claim = state.claim
+    # Already collapsed as it was retrieved (see retrieve_evidence_node)
     evidence_snippets = state.evidence
     iteration_count = state.iteration_count
 
@@ -70,12 +75,21 @@ async def evaluate_evidence_node(state: ClaimVerifierState) -> dict:
         current_time=get_current_timestamp()
     )
 
+    # Only the most relevant passages go to the (expensive) evaluation model
+    ranked_evidence, relevance_scores = await rank_evidence(
+        claim.claim_text, evidence_snippets
+    )
+    if relevance_scores is not None:
+        ranked_evidence = ranked_evidence[:TOP_K]
+        relevance_scores = relevance_scores[:TOP_K]
+
     truncated_evidence = truncate_evidence_for_token_limit(
-        evidence_items=evidence_snippets,
+        evidence_items=ranked_evidence,
         claim_text=claim.claim_text,
         system_prompt=system_prompt,
         human_prompt_template=EVIDENCE_EVALUATION_HUMAN_PROMPT,
         format_evidence_func=_format_evidence_snippets,
+        relevance_scores=relevance_scores,
     )
 
     messages = [
@@ -99,54 +113,51 @@ async def evaluate_evidence_node(state: ClaimVerifierState) -> dict:
     )
 
     if not response:
-        logger.warning(f"Failed to evaluate evidence for claim: '{claim.claim_text}'")
-        verdict = Verdict(
-            claim_text=claim.claim_text,
-            disambiguated_sentence=claim.disambiguated_sentence,
-            original_sentence=claim.original_sentence,
-            original_index=claim.original_index,
-            result=VerificationResult.REFUTED,
-            reasoning="Failed to evaluate the evidence due to technical issues.",
-            sources=[],
-        )
-    else:
-        try:
-            result = VerificationResult(response.verdict)
-        except ValueError:
-            logger.warning(
-                f"Invalid verdict '{response.verdict}', defaulting to REFUTED"
-            )
-            result = VerificationResult.REFUTED
-
-        influential_urls = (
-            {
-                truncated_evidence[idx - 1].url
-                for idx in response.influential_source_indices
-                if 1 <= idx <= len(truncated_evidence)
-            }
-            if response.influential_source_indices
-            else set()
+        # No verdict rather than a guessed one: the claim stays unverified and
+        # is left out of the stream events, the report and the verdict store
+        logger.warning(
+            f"Failed to evaluate evidence for claim: '{claim.claim_text}', "
+            f"leaving it unverified"
         )
+        return {"verdict": None}
 
-        sources = [
-            Evidence(
-                url=source.url,
-                text=source.text,
-                title=source.title,
-                is_influential=source.url in influential_urls,
-            )
-            for source in {source.url: source for source in evidence_snippets}.values()
-        ]
+    try:
+        result = VerificationResult(response.verdict)
+    except ValueError:
+        logger.warning(
+            f"Invalid verdict '{response.verdict}', defaulting to REFUTED"
+        )
+        result = VerificationResult.REFUTED
+
+    influential_urls = (
+        {
+            truncated_evidence[idx - 1].url
+            for idx in response.influential_source_indices
+            if 1 <= idx <= len(truncated_evidence)
+        }
+        if response.influential_source_indices
+        else set()
+    )
 
-        verdict = Verdict(
-            claim_text=claim.claim_text,
-            disambiguated_sentence=claim.disambiguated_sentence,
-            original_sentence=claim.original_sentence,
-            original_index=claim.original_index,
-            result=result,
-            reasoning=response.reasoning,
-            sources=sources,
+    sources = [
+        Evidence(
+            url=source.url,
+            text=source.text,
+            title=source.title,
+            is_influential=source.url in influential_urls,
         )
+        for source in {source.url: source for source in evidence_snippets}.values()
+    ]
+
+    verdict = Verdict(
+        claim_text=claim.claim_text,
+        disambiguated_sentence=claim.disambiguated_sentence,
+        original_sentence=claim.original_sentence,
+        original_index=claim.original_index,
+        result=result,
+        reasoning=response.reasoning,
+        sources=sources,
+    )
 
     # Log final result
     influential_count = sum(source.is_influential for source in verdict.sources)
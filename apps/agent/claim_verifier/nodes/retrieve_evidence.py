@@ -5,13 +5,19 @@ Uses search queries to retrieve relevant evidence snippets from the web using ne
 
 import logging
 import asyncio
-from typing import Any, Dict, List
+import re
+import unicodedata
+from typing import Any, Dict, List, Optional
 
+import aiohttp
 from langchain_exa import ExaSearchRetriever
 from langchain_tavily import TavilySearch
 from langchain_community.utilities import GoogleSerperAPIWrapper
+from pydantic import TypeAdapter
+from utils import TieredCache, governed, make_cache_key
 
 from claim_verifier.config import EVIDENCE_RETRIEVAL_CONFIG
+from claim_verifier.evidence import collapse_duplicates
 from claim_verifier.schemas import ClaimVerifierState, Evidence
 
 logger = logging.getLogger(__name__)
@@ -19,6 +25,88 @@ logger = logging.getLogger(__name__)
 # Retrieval settings
 RESULTS_PER_QUERY = EVIDENCE_RETRIEVAL_CONFIG["results_per_query"]
 SEARCH_PROVIDER = EVIDENCE_RETRIEVAL_CONFIG["search_provider"]
+MAX_CHARACTERS = EVIDENCE_RETRIEVAL_CONFIG["max_characters"]
+SEARCH_MODE = EVIDENCE_RETRIEVAL_CONFIG["search_mode"]
+SEARCH_PROVIDERS = EVIDENCE_RETRIEVAL_CONFIG["search_providers"]
+HEDGE_DELAY_SECONDS = EVIDENCE_RETRIEVAL_CONFIG["hedge_delay_seconds"]
+
+_EVIDENCE_LIST = TypeAdapter(List[Evidence])
+
+_evidence_cache: Optional[TieredCache] = (
+    TieredCache(
+        namespace="evidence",
+        max_entries=EVIDENCE_RETRIEVAL_CONFIG["cache_max_entries"],
+        ttl_seconds=EVIDENCE_RETRIEVAL_CONFIG["cache_ttl_seconds"],
+        use_redis=EVIDENCE_RETRIEVAL_CONFIG["cache_use_redis"],
+    )
+    if EVIDENCE_RETRIEVAL_CONFIG["cache_enabled"]
+    else None
+)
+
+
+class SearchClients:
+    """Process-wide search provider clients, built once on first use.
+
+    Clients that accept an aiohttp session share one pooled session, which is
+    rebuilt if the event loop changes (sessions are bound to their loop).
+    """
+
+    _clients: Dict[Any, Any] = {}
+    _session: Optional[aiohttp.ClientSession] = None
+    _session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @classmethod
+    def session(cls) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        stale = cls._session is None or cls._session.closed
+        if stale or cls._session_loop is not loop:
+            cls._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=EVIDENCE_RETRIEVAL_CONFIG["max_connections"]
+                )
+            )
+            cls._session_loop = loop
+        return cls._session
+
+    @classmethod
+    def exa(cls) -> ExaSearchRetriever:
+        if "exa" not in cls._clients:
+            cls._clients["exa"] = ExaSearchRetriever(
+                k=RESULTS_PER_QUERY,
+                text_contents_options={"max_characters": MAX_CHARACTERS},
+                type=EVIDENCE_RETRIEVAL_CONFIG["exa_search_type"],
+            )
+        return cls._clients["exa"]
+
+    @classmethod
+    def tavily(cls) -> TavilySearch:
+        if "tavily" not in cls._clients:
+            cls._clients["tavily"] = TavilySearch(
+                max_results=RESULTS_PER_QUERY,
+                topic=EVIDENCE_RETRIEVAL_CONFIG["tavily_topic"],
+                include_raw_content="markdown",
+            )
+        return cls._clients["tavily"]
+
+    @classmethod
+    def serper(cls, gl: str, hl: str) -> GoogleSerperAPIWrapper:
+        session = cls.session()
+        client = cls._clients.get(("serper", gl, hl))
+        if client is None or client.aiosession is not session:
+            client = GoogleSerperAPIWrapper(
+                gl=gl, hl=hl, k=RESULTS_PER_QUERY, aiosession=session
+            )
+            cls._clients[("serper", gl, hl)] = client
+        return client
+
+    @classmethod
+    async def close(cls) -> None:
+        """Drop cached clients and close the shared HTTP session."""
+        cls._clients.clear()
+        if cls._session is not None and not cls._session.closed:
+            await cls._session.close()
+        cls._session = None
+        cls._session_loop = None
 
 
 class SearchProviders:
@@ -26,16 +114,13 @@ class SearchProviders:
     async def exa(query: str) -> List[Evidence]:
         logger.info(f"Searching with Exa: '{query}'")
         try:
-            retriever = ExaSearchRetriever(
-                k=RESULTS_PER_QUERY,
-                text_contents_options={"max_characters": 2000},
-                type="neural",
+            results = await governed(
+                "exa", lambda: SearchClients.exa().ainvoke(query)
             )
-            results = await retriever.ainvoke(query)
             evidence = [
                 Evidence(
                     url=doc.metadata.get("url", ""),
-                    text=doc.page_content[:2000],
+                    text=doc.page_content[:MAX_CHARACTERS],
                     title=doc.metadata.get("title"),
                 )
                 for doc in results
@@ -50,12 +135,9 @@ class SearchProviders:
     async def tavily(query: str) -> List[Evidence]:
         logger.info(f"Searching with Tavily: '{query}'")
         try:
-            search = TavilySearch(
-                max_results=RESULTS_PER_QUERY,
-                topic="general",
-                include_raw_content="markdown",
+            results = await governed(
+                "tavily", lambda: SearchClients.tavily().ainvoke(query)
             )
-            results = await search.ainvoke(query)
             evidence = SearchProviders._parse_tavily_results(results)
             logger.info(f"Retrieved {len(evidence)} evidence items")
             return evidence
@@ -68,8 +150,9 @@ class SearchProviders:
         hl, gl = EVIDENCE_RETRIEVAL_CONFIG.get("hl", hl), EVIDENCE_RETRIEVAL_CONFIG.get("gl", gl)
         logger.info(f"Searching with Serper: '{query}'")
         try:
-            wrapper = GoogleSerperAPIWrapper(gl=gl, hl=hl)
-            raw = await wrapper.aresults(query)
+            raw = await governed(
+                "serper", lambda: SearchClients.serper(gl=gl, hl=hl).aresults(query)
+            )
             if not isinstance(raw, dict):
                 # Fallback: treat as plain text
                 return [Evidence(url="", text=str(raw), title="Serper Search Result")]
@@ -83,7 +166,7 @@ class SearchProviders:
                     Evidence(
                         url=item.get("link", "") or item.get("url", ""),
                         title=item.get("title", ""),
-                        text=(item.get("snippet") or item.get("content") or "")[:2000],
+                        text=(item.get("snippet") or item.get("content") or "")[:MAX_CHARACTERS],
                     )
                 )
 
@@ -93,7 +176,7 @@ class SearchProviders:
                     Evidence(
                         url="",
                         title="Serper Summary",
-                        text=str(summary)[:2000],
+                        text=str(summary)[:MAX_CHARACTERS],
                     )
                 )
 
@@ -122,14 +205,136 @@ class SearchProviders:
                 return []
 
 
-async def _search_query(query: str, gl: str = "cz", hl: str = "cs") -> List[Evidence]:
-    match SEARCH_PROVIDER.lower():
+def normalize_query(query: str) -> str:
+    """Reduce a query to a canonical form so equivalent queries share results.
+
+    Case, Unicode form, punctuation and whitespace are ignored. Word order
+    and repeated words are kept, since they change what is being asked.
+    """
+    text = unicodedata.normalize("NFKC", query).casefold()
+    return " ".join(re.sub(r"[^\w]+", " ", text).split())
+
+
+def _provider_name(provider: str) -> str:
+    provider = provider.lower()
+    return provider if provider in ("tavily", "serper") else "exa"
+
+
+async def _search_provider(
+    provider: str, query: str, gl: str = "cz", hl: str = "cs"
+) -> List[Evidence]:
+    """Search a single provider, going through the evidence cache."""
+    provider = _provider_name(provider)
+    params = (
+        {
+            "gl": EVIDENCE_RETRIEVAL_CONFIG.get("gl", gl),
+            "hl": EVIDENCE_RETRIEVAL_CONFIG.get("hl", hl),
+        }
+        if provider == "serper"
+        else {}
+    )
+    # Namespace keys per provider so results never leak between them
+    digest = make_cache_key(normalize_query(query), params, RESULTS_PER_QUERY)
+    cache_key = f"{provider}:{digest}"
+
+    if _evidence_cache is not None:
+        cached = await _evidence_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Evidence cache hit ({provider}): '{query}'")
+            return _EVIDENCE_LIST.validate_json(cached)
+
+    match provider:
         case "tavily":
-            return await SearchProviders.tavily(query)
+            evidence = await SearchProviders.tavily(query)
         case "serper":
-            return await SearchProviders.serper(query, gl=gl, hl=hl)
+            evidence = await SearchProviders.serper(query, gl=gl, hl=hl)
+        case _:
+            evidence = await SearchProviders.exa(query)
+
+    # Failed searches come back empty - don't pin them in the cache
+    if evidence and _evidence_cache is not None:
+        serialized = _EVIDENCE_LIST.dump_json(evidence).decode()
+        await _evidence_cache.set(cache_key, serialized)
+
+    return evidence
+
+
+def _merge_results(result_lists: List[List[Evidence]]) -> List[Evidence]:
+    """Concatenate provider results in priority order, dropping repeated URLs."""
+    seen_urls = set()
+    merged: List[Evidence] = []
+
+    for results in result_lists:
+        for item in results:
+            if item.url and item.url in seen_urls:
+                continue
+            seen_urls.add(item.url)
+            merged.append(item)
+
+    return merged
+
+
+async def _fan_out_search(
+    query: str, providers: List[str], gl: str = "cz", hl: str = "cs"
+) -> List[Evidence]:
+    """Query every provider concurrently and merge the results."""
+    results = await asyncio.gather(
+        *(_search_provider(provider, query, gl=gl, hl=hl) for provider in providers)
+    )
+    evidence = _merge_results(list(results))
+    logger.info(f"Fan-out search over {len(providers)} providers: {len(evidence)} results")
+    return evidence
+
+
+async def _hedged_search(
+    query: str, providers: List[str], gl: str = "cz", hl: str = "cs"
+) -> List[Evidence]:
+    """Query providers in priority order, hedging slow or empty ones.
+
+    The next provider is fired when the ones in flight have not answered
+    within the hedge delay or came back empty. The first non-empty answer
+    wins and every other request is cancelled.
+    """
+    remaining = list(providers)
+    pending: set = set()
+
+    def launch_next() -> None:
+        provider = remaining.pop(0)
+        pending.add(
+            asyncio.create_task(_search_provider(provider, query, gl=gl, hl=hl))
+        )
+
+    launch_next()
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending,
+                timeout=HEDGE_DELAY_SECONDS if remaining else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for task in done:
+                if evidence := task.result():
+                    return evidence
+
+            if remaining:
+                logger.info(f"Hedging search for '{query}' with {remaining[0]}")
+                launch_next()
+
+        return []
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _search_query(query: str, gl: str = "cz", hl: str = "cs") -> List[Evidence]:
+    match SEARCH_MODE.lower():
+        case "fanout":
+            return await _fan_out_search(query, SEARCH_PROVIDERS, gl=gl, hl=hl)
+        case "hedged":
+            return await _hedged_search(query, SEARCH_PROVIDERS, gl=gl, hl=hl)
         case _:
-            return await SearchProviders.exa(query)
+            return await _search_provider(SEARCH_PROVIDER, query, gl=gl, hl=hl)
 
 
 async def retrieve_evidence_node(
@@ -144,4 +349,10 @@ async def retrieve_evidence_node(
     evidence = await _search_query(state.query, gl=gl, hl=hl)
     logger.info(f"Retrieved {len(evidence)} total evidence snippets")
 
+    # Earlier iterations often return the same articles under other URLs;
+    # hashing every snippet is CPU-bound, so keep it off the event loop
+    evidence = await asyncio.to_thread(
+        collapse_duplicates, evidence, existing=state.evidence
+    )
+
     return {"evidence": [item.model_dump() for item in evidence]}
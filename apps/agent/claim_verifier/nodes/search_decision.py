@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field
 from utils import call_llm_with_structured_output, get_llm
 
 from claim_verifier.config import ITERATIVE_SEARCH_CONFIG
+from claim_verifier.evidence import rank_evidence
 from claim_verifier.prompts import (
     SEARCH_DECISION_HUMAN_PROMPT,
     SEARCH_DECISION_SYSTEM_PROMPT,
@@ -60,10 +61,12 @@ async def search_decision_node(
     # Assess evidence sufficiency with LLM
     llm = get_llm()
 
+    # Summarize the most relevant evidence rather than the first few results
+    ranked_evidence, _ = await rank_evidence(claim.claim_text, evidence)
     evidence_summary = "\n".join(
         [
             f"- {ev.title}: {ev.text[:200]}..." if ev.title else f"- {ev.text[:200]}..."
-            for ev in evidence[:10]
+            for ev in ranked_evidence[: ITERATIVE_SEARCH_CONFIG["summary_top_k"]]
         ]
     )
 
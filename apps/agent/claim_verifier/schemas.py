@@ -3,8 +3,9 @@
 All the structured types used throughout the verification workflow.
 """
 
+from datetime import datetime
 from enum import Enum
-from typing import Annotated, List, Optional
+from typing import Annotated, List, Literal, Optional
 from pydantic import BaseModel, Field
 from claim_extractor.schemas import ValidatedClaim
 from operator import add
@@ -30,6 +31,19 @@ class Evidence(BaseModel):
     )
 
 
+class VerdictProvenance(BaseModel):
+    """Where a verdict came from when it was reused from the verdict store."""
+
+    match: Literal["exact", "near"] = Field(
+        description="Whether the stored claim matched exactly or by similarity"
+    )
+    matched_claim: str = Field(description="The text of the claim originally verified")
+    similarity: float = Field(
+        default=1.0, description="Cosine similarity to the stored claim (1.0 for exact)"
+    )
+    verified_at: datetime = Field(description="When the stored verdict was produced")
+
+
 class Verdict(BaseModel):
     """The result of fact-checking a single claim."""
 
@@ -48,6 +62,9 @@ class Verdict(BaseModel):
     result: VerificationResult = Field(description="The fact-checking verdict (Supported, Refuted, etc.)")
     reasoning: str = Field(description="Brief explanation of the verdict")
     sources: List[Evidence] = Field(default_factory=list, description="List of evidence sources")
+    provenance: Optional[VerdictProvenance] = Field(
+        default=None, description="Set when the verdict was reused from the verdict store"
+    )
 
 
 class IntermediateAssessment(BaseModel):
@@ -0,0 +1,195 @@
+"""Verdict store for claims verified in earlier requests.
+
+Verdicts are keyed by normalized claim text and cached in memory in front
+of Redis. Claims about the present or recent dates expire sooner than
+timeless ones. An optional local embedding index finds verdicts for
+paraphrases of stored claims that mention the same numbers and names.
+"""
+
+import logging
+import re
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Tuple
+
+import numpy as np
+from claim_extractor import ValidatedClaim
+from utils import TieredCache, embed_texts, make_cache_key, same_key_terms
+
+from claim_verifier.config import VERDICT_STORE_CONFIG
+from claim_verifier.schemas import Verdict, VerdictProvenance
+
+logger = logging.getLogger(__name__)
+
+TTL_SECONDS = VERDICT_STORE_CONFIG["ttl_seconds"]
+TIME_SENSITIVE_TTL_SECONDS = VERDICT_STORE_CONFIG["time_sensitive_ttl_seconds"]
+NEAR_MATCH_ENABLED = VERDICT_STORE_CONFIG["near_match_enabled"]
+NEAR_MATCH_THRESHOLD = VERDICT_STORE_CONFIG["near_match_threshold"]
+NEAR_MATCH_MAX_ENTRIES = VERDICT_STORE_CONFIG["near_match_max_entries"]
+
+# Words marking claims about the present (English and Czech)
+_TIME_SENSITIVE_PATTERN = re.compile(
+    r"\b(today|yesterday|tonight|now|currently|current|latest|recent(ly)?|"
+    r"this (week|month|year)|so far|as of|still|"
+    r"dnes|včera|nyní|teď|aktuáln\w*|současn\w*|letos|právě|nejnověj\w*)\b",
+    re.IGNORECASE,
+)
+_YEAR_PATTERN = re.compile(r"\b(1[89]\d{2}|2\d{3})\b")
+RECENT_YEARS = 1  # Claims mentioning this year or the previous one are time-sensitive
+
+_store: Optional[TieredCache] = (
+    TieredCache(
+        namespace="verdict",
+        max_entries=VERDICT_STORE_CONFIG["max_entries"],
+        ttl_seconds=TTL_SECONDS,
+        use_redis=VERDICT_STORE_CONFIG["use_redis"],
+    )
+    if VERDICT_STORE_CONFIG["enabled"]
+    else None
+)
+
+# Normalized claim text -> (claim text, embedding), for near-match lookups in this process
+_near_match_index: "OrderedDict[str, Tuple[str, np.ndarray]]" = OrderedDict()
+
+
+def normalize_claim(text: str) -> str:
+    """Reduce a claim to a canonical form ignoring case, punctuation and spacing."""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return " ".join(re.findall(r"\w+", text))
+
+
+def claim_ttl_seconds(text: str) -> float:
+    """Freshness TTL for a claim's verdict, shorter for time-sensitive claims."""
+    if _TIME_SENSITIVE_PATTERN.search(text):
+        return TIME_SENSITIVE_TTL_SECONDS
+
+    this_year = datetime.now().year
+    if any(int(year) >= this_year - RECENT_YEARS for year in _YEAR_PATTERN.findall(text)):
+        return TIME_SENSITIVE_TTL_SECONDS
+
+    return TTL_SECONDS
+
+
+def _store_key(normalized: str) -> str:
+    return make_cache_key(normalized)
+
+
+def _remember_embedding(normalized: str, text: str, vector: np.ndarray) -> None:
+    _near_match_index[normalized] = (text, vector)
+    _near_match_index.move_to_end(normalized)
+    while len(_near_match_index) > NEAR_MATCH_MAX_ENTRIES:
+        _near_match_index.popitem(last=False)
+
+
+async def _embed_claim(text: str) -> Optional[np.ndarray]:
+    if not NEAR_MATCH_ENABLED:
+        return None
+    vectors = await embed_texts([text])
+    return vectors[0] if vectors is not None else None
+
+
+def _nearest(text: str, vector: np.ndarray) -> Optional[Tuple[str, float]]:
+    # Only claims about the same numbers and names are candidates
+    candidates = [
+        (normalized, stored_vector)
+        for normalized, (stored_text, stored_vector) in _near_match_index.items()
+        if same_key_terms(text, stored_text)
+    ]
+    if not candidates:
+        return None
+
+    similarities = np.vstack([stored_vector for _, stored_vector in candidates]) @ vector
+    best = int(np.argmax(similarities))
+    if similarities[best] < NEAR_MATCH_THRESHOLD:
+        return None
+    return candidates[best][0], float(similarities[best])
+
+
+async def _load(normalized: str) -> Optional[Verdict]:
+    cached = await _store.get(_store_key(normalized))
+    return Verdict.model_validate_json(cached) if cached is not None else None
+
+
+async def lookup_verdict(claim: ValidatedClaim) -> Optional[Verdict]:
+    """Find a stored verdict for a claim or a close paraphrase of it.
+
+    Args:
+        claim: The claim about to be verified
+
+    Returns:
+        The stored verdict re-targeted at this claim, with provenance set,
+        or None if nothing fresh is stored
+    """
+    if _store is None:
+        return None
+
+    try:
+        normalized = normalize_claim(claim.claim_text)
+        stored = await _load(normalized)
+        match, similarity = "exact", 1.0
+
+        if stored is None and NEAR_MATCH_ENABLED:
+            vector = await _embed_claim(claim.claim_text)
+            nearest = _nearest(claim.claim_text, vector) if vector is not None else None
+            if nearest is not None:
+                stored = await _load(nearest[0])
+                match, similarity = "near", nearest[1]
+                if stored is None:
+                    # The stored verdict expired
+                    _near_match_index.pop(nearest[0], None)
+    except Exception as e:
+        logger.warning(f"Verdict store lookup failed for '{claim.claim_text}': {e}")
+        return None
+
+    if stored is None:
+        return None
+
+    logger.info(f"Reusing stored verdict ({match}) for '{claim.claim_text}'")
+    provenance = VerdictProvenance(
+        match=match,
+        matched_claim=stored.claim_text,
+        similarity=similarity,
+        verified_at=stored.provenance.verified_at if stored.provenance else datetime.now(),
+    )
+    return stored.model_copy(
+        update={
+            "claim_text": claim.claim_text,
+            "disambiguated_sentence": claim.disambiguated_sentence,
+            "original_sentence": claim.original_sentence,
+            "original_index": claim.original_index,
+            "provenance": provenance,
+        }
+    )
+
+
+async def store_verdict(verdict: Verdict) -> None:
+    """Store a freshly produced verdict for reuse by later requests.
+
+    Verdicts without sources (failed evaluations) are not stored.
+    """
+    if _store is None or not verdict.sources:
+        return
+
+    try:
+        normalized = normalize_claim(verdict.claim_text)
+        record = verdict.model_copy(
+            update={
+                "provenance": VerdictProvenance(
+                    match="exact",
+                    matched_claim=verdict.claim_text,
+                    verified_at=datetime.now(),
+                )
+            }
+        )
+        await _store.set(
+            _store_key(normalized),
+            record.model_dump_json(),
+            ttl_seconds=claim_ttl_seconds(verdict.claim_text),
+        )
+
+        vector = await _embed_claim(verdict.claim_text)
+        if vector is not None:
+            _remember_embedding(normalized, verdict.claim_text, vector)
+    except Exception as e:
+        logger.warning(f"Failed to store verdict for '{verdict.claim_text}': {e}")
@@ -4,7 +4,7 @@ Integrates claim extraction and verification into a complete workflow.
 """
 
 from fact_checker.agent import create_graph, graph
-from fact_checker.schemas import FactCheckReport, State
+from fact_checker.schemas import FactCheckReport, ReportEvent, State, VerdictEvent
 
 __all__ = [
     # Main functionality
@@ -13,4 +13,7 @@ __all__ = [
     # Data models
     "State",
     "FactCheckReport",
+    # Stream events
+    "VerdictEvent",
+    "ReportEvent",
 ]
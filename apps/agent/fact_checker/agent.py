@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 
 from dotenv import load_dotenv
 from langgraph.graph import END, StateGraph
@@ -6,10 +7,13 @@ from langgraph.graph.state import CompiledStateGraph
 
 from fact_checker.nodes import (
     claim_verifier_node,
+    cluster_claims_node,
     dispatch_claims_for_verification,
+    extract_and_verify_node,
     extract_claims,
     generate_report_node,
 )
+from fact_checker.config import PIPELINE_CONFIG
 from fact_checker.schemas import State
 
 load_dotenv()
@@ -20,18 +24,34 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def create_graph() -> CompiledStateGraph:
+def create_graph(mode: Optional[str] = None) -> CompiledStateGraph:
     """Set up the main fact checker workflow graph.
 
     The pipeline follows these steps:
     1. Extract claims from input text
-    2. Distribute claims for parallel verification
-    3. Generate final report
+    2. Group paraphrased claims so each fact is verified once
+    3. Distribute claims for parallel verification
+    4. Generate final report
+
+    In pipelined mode, steps 1-3 overlap: claims are verified as soon as
+    their sentence is extracted.
+
+    Args:
+        mode: "staged" or "pipelined"; defaults to PIPELINE_CONFIG["mode"]
     """
     workflow = StateGraph(State)
 
+    if (mode or PIPELINE_CONFIG["mode"]) == "pipelined":
+        workflow.add_node("extract_and_verify", extract_and_verify_node)
+        workflow.add_node("generate_report_node", generate_report_node)
+        workflow.set_entry_point("extract_and_verify")
+        workflow.add_edge("extract_and_verify", "generate_report_node")
+        workflow.set_finish_point("generate_report_node")
+        return workflow.compile()
+
     # Add nodes
     workflow.add_node("extract_claims", extract_claims)
+    workflow.add_node("cluster_claims", cluster_claims_node)
     workflow.add_node("claim_verifier", claim_verifier_node)
     workflow.add_node("generate_report_node", generate_report_node)
 
@@ -39,8 +59,9 @@ def create_graph() -> CompiledStateGraph:
     workflow.set_entry_point("extract_claims")
 
     # Connect the nodes in sequence
+    workflow.add_edge("extract_claims", "cluster_claims")
     workflow.add_conditional_edges(
-        "extract_claims", dispatch_claims_for_verification, ["claim_verifier", END]
+        "cluster_claims", dispatch_claims_for_verification, ["claim_verifier", END]
     )
     workflow.add_edge("claim_verifier", "generate_report_node")
 
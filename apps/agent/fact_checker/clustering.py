@@ -0,0 +1,87 @@
+"""Semantic clustering of extracted claims.
+
+Articles often restate one fact in different words. Claims whose embeddings
+are close enough are grouped, so each group is verified only once.
+"""
+
+import logging
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+from claim_extractor import ValidatedClaim
+from utils import embed_texts, same_key_terms
+
+from fact_checker.config import CLAIM_CLUSTERING_CONFIG
+from fact_checker.schemas import ClaimCluster
+
+logger = logging.getLogger(__name__)
+
+SIMILARITY_THRESHOLD = CLAIM_CLUSTERING_CONFIG["similarity_threshold"]
+
+
+def _normalize(text: str) -> str:
+    return " ".join(re.findall(r"\w+", text.casefold()))
+
+
+class ClaimClusterer:
+    """Incrementally assigns claims to clusters.
+
+    A claim joins the most similar cluster whose representative is at least
+    `threshold` similar to it and mentions the same numbers and entities,
+    otherwise it starts a new cluster. Without an embedding, only claims
+    with identical normalized text are grouped.
+    """
+
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self.clusters: List[ClaimCluster] = []
+        self._vectors: List[Optional[np.ndarray]] = []
+        self._by_text: Dict[str, int] = {}
+
+    def add(self, claim: ValidatedClaim, vector: Optional[np.ndarray] = None) -> ClaimCluster:
+        """Assign a claim to a cluster and return that cluster."""
+        key = _normalize(claim.claim_text)
+        index = self._by_text.get(key)
+
+        if index is None and vector is not None:
+            similarities = [
+                float(vector @ other)
+                if other is not None
+                and same_key_terms(claim.claim_text, cluster.representative.claim_text)
+                else -1.0
+                for cluster, other in zip(self.clusters, self._vectors)
+            ]
+            if similarities and max(similarities) >= self.threshold:
+                index = int(np.argmax(similarities))
+
+        if index is None:
+            self.clusters.append(ClaimCluster(representative=claim, members=[claim]))
+            self._vectors.append(vector)
+            index = len(self.clusters) - 1
+        else:
+            self.clusters[index].members.append(claim)
+
+        self._by_text.setdefault(key, index)
+        return self.clusters[index]
+
+
+async def cluster_claims(
+    claims: List[ValidatedClaim], threshold: float = SIMILARITY_THRESHOLD
+) -> List[ClaimCluster]:
+    """Group paraphrased claims, keeping them in document order.
+
+    Args:
+        claims: Validated claims to group
+        threshold: Min cosine similarity for two claims to share a cluster
+
+    Returns:
+        Clusters in order of their representatives' first appearance
+    """
+    vectors = await embed_texts([claim.claim_text for claim in claims]) if claims else None
+
+    clusterer = ClaimClusterer(threshold)
+    for i, claim in enumerate(claims):
+        clusterer.add(claim, vectors[i] if vectors is not None else None)
+
+    return clusterer.clusters
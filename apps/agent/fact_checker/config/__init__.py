@@ -0,0 +1,18 @@
+"""Configuration for the fact checker.
+
+Central storage for all configuration settings.
+"""
+
+from fact_checker.config.nodes import (
+    CLAIM_CLUSTERING_CONFIG,
+    DISPATCH_CONFIG,
+    PIPELINE_CONFIG,
+)
+
+__all__ = [
+    # Graph layout
+    "PIPELINE_CONFIG",
+    # Node configurations
+    "CLAIM_CLUSTERING_CONFIG",
+    "DISPATCH_CONFIG",
+]
@@ -0,0 +1,24 @@
+"""Node configuration settings.
+
+Contains settings for the fact checker orchestration nodes.
+"""
+
+# Graph layout
+PIPELINE_CONFIG = {
+    # "staged": extract every claim, then verify them all
+    # "pipelined": start verifying each claim as soon as its sentence is extracted
+    "mode": "staged",
+}
+
+# Node settings
+CLAIM_CLUSTERING_CONFIG = {
+    "enabled": True,  # Verify one representative per cluster of paraphrased claims
+    "similarity_threshold": 0.92,  # Min cosine similarity to join a cluster (numbers and names must match too)
+}
+
+DISPATCH_CONFIG = {
+    "max_parallel_claims": 8,  # Claims verified at once per worker, across all requests
+    "priority": "original_index",  # "original_index" (top of the text first) or "none"
+    "backpressure": True,  # Hold new verifications while an LLM/search governor is saturated
+    "backpressure_max_wait_seconds": 30.0,
+}
@@ -1,13 +1,17 @@
 """Node components for the fact checker workflow."""
 
 from fact_checker.nodes.extract_claims import extract_claims
+from fact_checker.nodes.cluster_claims import cluster_claims_node
 from fact_checker.nodes.dispatch_claims import dispatch_claims_for_verification
 from fact_checker.nodes.claim_verifier import claim_verifier_node
+from fact_checker.nodes.extract_and_verify import extract_and_verify_node
 from fact_checker.nodes.generate_report import generate_report_node
 
 __all__ = [
     "extract_claims",
+    "cluster_claims_node",
     "dispatch_claims_for_verification",
     "claim_verifier_node",
+    "extract_and_verify_node",
     "generate_report_node",
 ]
@@ -4,39 +4,119 @@ Interfaces with the claim verifier subsystem to check factual accuracy.
 """
 
 import logging
-from typing import Dict
+from collections import OrderedDict
+from typing import Dict, List
 
-from claim_verifier import Verdict
+from claim_extractor import ValidatedClaim
+from claim_verifier import Verdict, lookup_verdict, store_verdict
 from claim_verifier import graph as claim_verifier_graph
+from utils import PriorityLimiter, wait_for_capacity
+
+from fact_checker.config import DISPATCH_CONFIG
+from fact_checker.streaming import emit_verdicts
 
 logger = logging.getLogger(__name__)
 
+BACKPRESSURE = DISPATCH_CONFIG["backpressure"]
+BACKPRESSURE_MAX_WAIT_SECONDS = DISPATCH_CONFIG["backpressure_max_wait_seconds"]
+
+MAX_TRACKED_RUNS = 1_024  # Runs whose fair-share start is kept in memory at once
+
+# Shared by every request on this worker so large documents can't starve others
+_claim_limiter = PriorityLimiter(DISPATCH_CONFIG["max_parallel_claims"])
+
+# Start-time fair queuing across runs: a run's n-th claim is admitted at
+# virtual time start + n, where start is the virtual time when the run's
+# first claim arrived. Concurrent runs share slots evenly, and a long
+# document keeps its place instead of yielding to every newer request.
+_run_starts: "OrderedDict[str, float]" = OrderedDict()
+_virtual_time = 0.0
+
+
+def admission_priority(run_key: str, rank: float) -> float:
+    """Limiter priority of a run's claim under fair sharing (lower runs first).
+
+    Args:
+        run_key: Identifies the run the claim belongs to
+        rank: The claim's position among its run's claims
+    """
+    if run_key not in _run_starts:
+        _run_starts[run_key] = _virtual_time
+        while len(_run_starts) > MAX_TRACKED_RUNS:
+            _run_starts.popitem(last=False)
+    return _run_starts[run_key] + rank
+
+
+def fan_out_verdict(verdict: Verdict, members: List[ValidatedClaim]) -> List[Verdict]:
+    """Copy a representative's verdict to every claim in its cluster."""
+    if not members:
+        return [verdict]
+
+    return [
+        verdict.model_copy(
+            update={
+                "claim_text": member.claim_text,
+                "disambiguated_sentence": member.disambiguated_sentence,
+                "original_sentence": member.original_sentence,
+                "original_index": member.original_index,
+            }
+        )
+        for member in members
+    ]
+
 
 async def claim_verifier_node(inputs: Dict) -> Dict[str, Verdict]:
     """Process a single claim through the claim verifier.
 
     Args:
-        inputs: Dictionary with the claim to verify
+        inputs: Dictionary with the claim to verify, the members of its
+            cluster (which all receive the claim's verdict), its priority
+            (position among the run's claims), and the run key and expected
+            total used for stream events
 
     Returns:
-        Dictionary with verdict key
+        Dictionary with verification_results key
     """
     claim = inputs.get("claim")
     if not claim:
         logger.warning("No claim provided to verifier")
         return {}
 
-    logger.info(f"Verifying claim: '{claim.claim_text}'")
+    members = inputs.get("members") or []
+    run_key = inputs.get("run_key", "")
+    total = inputs.get("total")
+
+    # Popular claims were often verified already by earlier requests
+    cached_verdict = await lookup_verdict(claim)
+    if cached_verdict:
+        verdicts = fan_out_verdict(cached_verdict, members)
+        emit_verdicts(run_key, verdicts, total)
+        return {"verification_results": verdicts}
+
+    global _virtual_time
 
     verifier_payload = {"claim": claim}
+    priority = admission_priority(run_key, inputs.get("priority", 0))
 
     try:
-        verifier_result = await claim_verifier_graph.ainvoke(verifier_payload)
+        async with _claim_limiter.slot(priority):
+            _virtual_time = max(_virtual_time, priority)
+            if BACKPRESSURE:
+                waited = await wait_for_capacity(max_wait=BACKPRESSURE_MAX_WAIT_SECONDS)
+                if waited >= 1:
+                    logger.info(f"Held claim for {waited:.1f}s while providers were saturated")
+
+            logger.info(f"Verifying claim: '{claim.claim_text}'")
+            verifier_result = await claim_verifier_graph.ainvoke(verifier_payload)
+
         verdict = verifier_result.get("verdict")
 
         if verdict:
             logger.info(f"Verdict for '{claim.claim_text}': {verdict.result}")
-            return {"verification_results": [verdict]}
+            await store_verdict(verdict)
+            verdicts = fan_out_verdict(verdict, members)
+            emit_verdicts(run_key, verdicts, total)
+            return {"verification_results": verdicts}
         else:
             logger.warning(f"No verdict returned for claim: '{claim.claim_text}'")
             return {}
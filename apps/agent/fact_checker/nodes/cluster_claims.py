@@ -0,0 +1,47 @@
+"""Cluster claims node - groups paraphrased claims before verification.
+
+Only one representative per cluster is sent to the claim verifier.
+"""
+
+import logging
+from typing import Any, Dict
+from uuid import uuid4
+
+from fact_checker.clustering import cluster_claims
+from fact_checker.config import CLAIM_CLUSTERING_CONFIG
+from fact_checker.schemas import ClaimCluster, State
+
+logger = logging.getLogger(__name__)
+
+ENABLED = CLAIM_CLUSTERING_CONFIG["enabled"]
+
+
+async def cluster_claims_node(state: State) -> Dict[str, Any]:
+    """Group semantically equivalent claims.
+
+    Args:
+        state: Current workflow state with extracted claims
+
+    Returns:
+        Dictionary with claim_clusters and run_key keys
+    """
+    claims = state.extracted_claims
+    # Every verification branch tags its stream events with this key
+    run_key = state.run_key or uuid4().hex
+
+    if not ENABLED:
+        clusters = [ClaimCluster(representative=claim, members=[claim]) for claim in claims]
+        return {"claim_clusters": clusters, "run_key": run_key}
+
+    try:
+        clusters = await cluster_claims(claims)
+    except Exception as e:
+        logger.error(f"Claim clustering failed, verifying every claim: {e}")
+        clusters = [ClaimCluster(representative=claim, members=[claim]) for claim in claims]
+
+    if len(clusters) < len(claims):
+        logger.info(
+            f"Clustered {len(claims)} claims into {len(clusters)} "
+            f"(saved {len(claims) - len(clusters)} verifier runs)"
+        )
+    return {"claim_clusters": clusters, "run_key": run_key}
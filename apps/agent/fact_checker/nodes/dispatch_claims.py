@@ -1,6 +1,7 @@
 """Dispatch claims node - distributes claims for parallel verification.
 
-Sends each claim to a separate verification process.
+Sends the representative of each claim cluster to a separate verification process,
+ordered by the configured priority policy.
 """
 
 import logging
@@ -9,13 +10,33 @@ from typing import List
 from langgraph.graph import END
 from langgraph.graph.state import Send
 
-from fact_checker.schemas import State
+from fact_checker.config import DISPATCH_CONFIG
+from fact_checker.schemas import ClaimCluster, State
 
 logger = logging.getLogger(__name__)
 
+PRIORITY = DISPATCH_CONFIG["priority"]
+
+
+def claim_priority(cluster: ClaimCluster, position: int) -> int:
+    """Priority of a cluster under the configured policy (lower runs first).
+
+    Args:
+        cluster: The claim cluster to rank
+        position: The cluster's position in extraction order
+
+    Returns:
+        The earliest sentence index in the cluster for "original_index",
+        otherwise the extraction position
+    """
+    if PRIORITY == "original_index":
+        members = cluster.members or [cluster.representative]
+        return min(member.original_index for member in members)
+    return position
+
 
 def dispatch_claims_for_verification(state: State) -> List[Send] | str:
-    """Dispatch extracted claims for parallel verification.
+    """Dispatch claim clusters for parallel verification.
 
     Args:
         state: Current workflow state
@@ -23,13 +44,38 @@ def dispatch_claims_for_verification(state: State) -> List[Send] | str:
     Returns:
         Either a list of Send objects or END
     """
-    claims = state.extracted_claims
+    clusters = state.claim_clusters
 
-    if not claims:
+    if not clusters:
         logger.warning("No claims to verify, ending process")
         return END
 
-    logger.info(f"Dispatching {len(claims)} claims for parallel verification")
+    logger.info(f"Dispatching {len(clusters)} claims for parallel verification")
+
+    total = sum(len(cluster.members) or 1 for cluster in clusters)
+    # Sort on the priority alone: clusters are not orderable, and sorted()
+    # is stable, so ties keep their extraction order
+    prioritized = sorted(
+        (
+            (claim_priority(cluster, position), cluster)
+            for position, cluster in enumerate(clusters)
+        ),
+        key=lambda pair: pair[0],
+    )
 
-    # Create Send objects for each claim to be verified in parallel
-    return [Send("claim_verifier", {"claim": claim}) for claim in claims]
+    # Create Send objects for each cluster to be verified in parallel; the
+    # verifier node admits them in this order, sharing slots fairly with
+    # other runs, under a concurrency bound
+    return [
+        Send(
+            "claim_verifier",
+            {
+                "claim": cluster.representative,
+                "members": cluster.members,
+                "priority": rank,
+                "run_key": state.run_key,
+                "total": total,
+            },
+        )
+        for rank, (_, cluster) in enumerate(prioritized)
+    ]
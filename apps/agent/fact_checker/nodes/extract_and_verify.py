@@ -0,0 +1,109 @@
+"""Extract and verify node - overlaps claim extraction with verification.
+
+Used in pipelined mode. Each sentence moves through the extraction stages
+on its own, and every claim is handed to verification as soon as it is
+validated, so verification no longer waits for the slowest sentence.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, List
+from uuid import uuid4
+
+from claim_extractor import ValidatedClaim
+from claim_extractor.pipeline import stream_claims
+from claim_verifier import Verdict
+from utils import embed_texts
+
+from fact_checker.clustering import ClaimClusterer
+from fact_checker.config import CLAIM_CLUSTERING_CONFIG
+from fact_checker.nodes.claim_verifier import claim_verifier_node, fan_out_verdict
+from fact_checker.schemas import State
+from fact_checker.streaming import emit_verdicts
+
+logger = logging.getLogger(__name__)
+
+CLUSTERING_ENABLED = CLAIM_CLUSTERING_CONFIG["enabled"]
+
+
+async def extract_and_verify_node(state: State) -> Dict[str, Any]:
+    """Extract claims sentence by sentence and verify each one as it arrives.
+
+    Args:
+        state: Current workflow state containing text to extract claims from
+
+    Returns:
+        Dictionary with extracted_claims, claim_clusters, verification_results
+        and run_key keys
+    """
+    run_key = state.run_key or uuid4().hex
+    clusterer = ClaimClusterer()
+    claims: List[ValidatedClaim] = []
+    verifications: Dict[int, asyncio.Task] = {}
+    # Paraphrases verified on their own because their representative failed
+    fallbacks: List[asyncio.Task] = []
+    late_verdicts: List[Verdict] = []
+
+    def verify(claim: ValidatedClaim, members: List[ValidatedClaim]) -> asyncio.Task:
+        # The verifier reads the members list when it fans out the verdict,
+        # so paraphrases arriving until then are included
+        return asyncio.create_task(
+            claim_verifier_node(
+                {
+                    "claim": claim,
+                    "members": members,
+                    "priority": len(verifications) + len(fallbacks),
+                    "run_key": run_key,
+                }
+            )
+        )
+
+    try:
+        async for claim in stream_claims(state.answer):
+            claims.append(claim)
+
+            vectors = await embed_texts([claim.claim_text]) if CLUSTERING_ENABLED else None
+            cluster = clusterer.add(claim, vectors[0] if vectors is not None else None)
+
+            if cluster.representative is claim:
+                verifications[id(cluster)] = verify(claim, cluster.members)
+                continue
+
+            verification = verifications[id(cluster)]
+            if not verification.done():
+                continue
+
+            # Paraphrase of a claim whose verification already finished
+            failed = verification.cancelled() or verification.exception() is not None
+            results = [] if failed else verification.result().get("verification_results")
+            if results:
+                verdicts = fan_out_verdict(results[0], [claim])
+                emit_verdicts(run_key, verdicts)
+                late_verdicts.extend(verdicts)
+            else:
+                # No verdict to share - verify the paraphrase itself
+                fallbacks.append(verify(claim, [claim]))
+    except Exception as e:
+        logger.error(f"Claim extraction failed: {e}")
+
+    logger.info(
+        f"Extracted {len(claims)} validated claims, "
+        f"verifying {len(verifications) + len(fallbacks)} after clustering"
+    )
+
+    results = await asyncio.gather(
+        *verifications.values(), *fallbacks, return_exceptions=True
+    )
+    verification_results = [
+        verdict
+        for result in results
+        if isinstance(result, dict)
+        for verdict in result.get("verification_results", [])
+    ] + late_verdicts
+
+    return {
+        "run_key": run_key,
+        "extracted_claims": claims,
+        "claim_clusters": clusterer.clusters,
+        "verification_results": verification_results,
+    }
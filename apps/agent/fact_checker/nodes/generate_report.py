@@ -1,14 +1,14 @@
 """Generate report node - creates a comprehensive fact-check report.
 
-Compiles verification results into a final report with summary.
+Takes the report assembled from the verdicts streamed during the run and
+emits it as the run's last stream event.
 """
 
 import logging
-from datetime import datetime
 from typing import Dict
 
-from claim_verifier.schemas import VerificationResult
 from fact_checker.schemas import FactCheckReport, State
+from fact_checker.streaming import build_report, emit_report
 
 logger = logging.getLogger(__name__)
 
@@ -24,32 +24,12 @@ async def generate_report_node(state: State) -> Dict[str, FactCheckReport]:
     """
     logger.info("Generating final fact-check report")
 
-    # Count claims by verification result
-    result_counts = {
-        VerificationResult.SUPPORTED: 0,
-        VerificationResult.REFUTED: 0,
-    }
-
-    for verdict in state.verification_results:
-        if verdict.result in result_counts:
-            logger.info(f"Verdict for '{verdict.claim_text}': {verdict.result}")
-            result_counts[verdict.result] += 1
-
-    # Generate summary text
-    summary = (
-        f"Fact-check complete. Of {len(state.verification_results)} claims verified: "
-        f"{result_counts[VerificationResult.SUPPORTED]} supported, "
-        f"{result_counts[VerificationResult.REFUTED]} refuted"
-    )
-
-    # Create the final report
-    report = FactCheckReport(
-        answer=state.answer,
-        claims_verified=len(state.verification_results),
-        verified_claims=state.verification_results,
-        summary=summary,
-        timestamp=datetime.now(),
-    )
-
-    logger.info(f"Report generated: {summary}")
+    # Built from the running counts carried by the verdict stream events
+    report = build_report(state.run_key, state.answer, state.verification_results)
+
+    for verdict in report.verified_claims:
+        logger.info(f"Verdict for '{verdict.claim_text}': {verdict.result}")
+
+    logger.info(f"Report generated: {report.summary}")
+    emit_report(state.run_key, report)
     return {"final_report": report}
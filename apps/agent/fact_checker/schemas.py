@@ -4,7 +4,7 @@ All the structured types used throughout the orchestration workflow.
 """
 
 from datetime import datetime
-from typing import Annotated, List, Optional
+from typing import Annotated, Dict, List, Literal, Optional
 
 from operator import add
 from pydantic import BaseModel, Field
@@ -27,13 +27,54 @@ class FactCheckReport(BaseModel):
     )
 
 
+class VerdictEvent(BaseModel):
+    """Custom stream event emitted as soon as a claim's verdict is ready."""
+
+    event: Literal["verdict"] = "verdict"
+    sequence: int = Field(description="1-based position of the event within the run")
+    completed: int = Field(description="Verdicts emitted so far, including this one")
+    total: Optional[int] = Field(
+        default=None,
+        description="Verdicts expected in this run, None while claims are still being extracted",
+    )
+    counts: Dict[str, int] = Field(
+        default_factory=dict, description="Running verdict counts by result"
+    )
+    summary: str = Field(description="Running summary of the results so far")
+    verdict: Verdict = Field(description="The verdict for one claim")
+
+
+class ReportEvent(BaseModel):
+    """Custom stream event emitted once the final report is assembled."""
+
+    event: Literal["report"] = "report"
+    sequence: int = Field(description="1-based position of the event within the run")
+    report: FactCheckReport = Field(description="The final fact-checking report")
+
+
+class ClaimCluster(BaseModel):
+    """Claims that state the same fact, verified once through a representative."""
+
+    representative: ValidatedClaim = Field(description="The claim sent to verification")
+    members: List[ValidatedClaim] = Field(
+        default_factory=list,
+        description="Every claim in the cluster, including the representative",
+    )
+
+
 class State(BaseModel):
     """The state for the main fact checker workflow."""
 
     answer: str = Field(description="The text to extract claims from")
+    run_key: str = Field(
+        default="", description="Identifies this run's stream events"
+    )
     extracted_claims: List[ValidatedClaim] = Field(
         default_factory=list, description="Claims extracted from the text"
     )
+    claim_clusters: List[ClaimCluster] = Field(
+        default_factory=list, description="Extracted claims grouped by meaning"
+    )
     verification_results: Annotated[List[Verdict], add] = Field(
         default_factory=list, description="Verification results for each claim"
     )
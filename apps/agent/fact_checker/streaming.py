@@ -0,0 +1,152 @@
+"""Streaming of per-claim verdicts out of the fact checker graph.
+
+Verdicts are emitted as LangGraph custom stream events the moment each
+verification branch finishes, so clients can render results without
+waiting for the slowest claim. Consume them with stream_mode="custom";
+see README.md for the event schema. The final report is assembled from
+the same running progress.
+"""
+
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from claim_verifier import Verdict
+from claim_verifier.schemas import VerificationResult
+from langgraph.config import get_stream_writer
+
+from fact_checker.schemas import FactCheckReport, ReportEvent, VerdictEvent
+
+logger = logging.getLogger(__name__)
+
+MAX_TRACKED_RUNS = 1_024  # Runs whose progress is kept in memory at once
+
+
+def count_verdicts(verdicts: Iterable[Verdict]) -> Dict[str, int]:
+    """Count verdicts by result."""
+    counts = {result.value: 0 for result in VerificationResult}
+    for verdict in verdicts:
+        counts[verdict.result.value] = counts.get(verdict.result.value, 0) + 1
+    return counts
+
+
+def summarize_counts(
+    counts: Dict[str, int], total: Optional[int] = None, total_known: bool = True
+) -> str:
+    """Summary line for verdict counts, shared by stream events and the report.
+
+    Args:
+        counts: Verdict counts by result
+        total: Verdicts expected; a smaller count is reported as in progress
+        total_known: False while claims are still being extracted, which is
+            always reported as in progress
+    """
+    completed = sum(counts.values())
+    results = (
+        f"{counts.get(VerificationResult.SUPPORTED.value, 0)} supported, "
+        f"{counts.get(VerificationResult.REFUTED.value, 0)} refuted"
+    )
+    if not total_known:
+        return f"Fact-check in progress. {completed} claims verified so far: {results}"
+    if total is not None and completed < total:
+        return f"Fact-check in progress. {completed} of {total} claims verified so far: {results}"
+    return f"Fact-check complete. Of {completed} claims verified: {results}"
+
+
+class RunProgress:
+    """Sequence numbers, running counts and verdicts of one run's stream events."""
+
+    def __init__(self):
+        self.sequence = 0
+        self.completed = 0
+        self.counts = count_verdicts([])
+        self.verdicts: List[Verdict] = []
+
+    def next_sequence(self) -> int:
+        self.sequence += 1
+        return self.sequence
+
+
+_runs: "OrderedDict[str, RunProgress]" = OrderedDict()
+
+
+def _progress(run_key: str) -> RunProgress:
+    if run_key not in _runs:
+        _runs[run_key] = RunProgress()
+        while len(_runs) > MAX_TRACKED_RUNS:
+            _runs.popitem(last=False)
+    return _runs[run_key]
+
+
+def _write(payload: Dict) -> None:
+    try:
+        writer = get_stream_writer()
+    except RuntimeError:
+        # Called outside a graph run - nobody is listening
+        return
+    writer(payload)
+
+
+def emit_verdicts(run_key: str, verdicts: List[Verdict], total: Optional[int] = None) -> None:
+    """Emit one verdict event per verdict and update the run's running counts.
+
+    Args:
+        run_key: Identifies the run the verdicts belong to
+        verdicts: Verdicts that just became available
+        total: Number of verdicts expected in the run, or None while it is
+            still unknown (pipelined mode, where extraction is still running)
+    """
+    progress = _progress(run_key)
+
+    for verdict in verdicts:
+        progress.completed += 1
+        progress.counts[verdict.result.value] += 1
+        progress.verdicts.append(verdict)
+        event = VerdictEvent(
+            sequence=progress.next_sequence(),
+            completed=progress.completed,
+            total=total,
+            counts=dict(progress.counts),
+            summary=summarize_counts(progress.counts, total, total_known=total is not None),
+            verdict=verdict,
+        )
+        _write(event.model_dump(mode="json"))
+
+
+def build_report(run_key: str, answer: str, verdicts: List[Verdict]) -> FactCheckReport:
+    """Assemble the final report from the run's streamed progress.
+
+    The verdicts and counts collected while verdict events were emitted
+    become the report. If they do not cover every verdict of the run (e.g.
+    it resumed on another worker), the report is built from `verdicts`.
+
+    Args:
+        run_key: Identifies the run
+        answer: The checked text
+        verdicts: Every verdict of the run, as accumulated in the graph state
+
+    Returns:
+        The report, with verdicts in document order
+    """
+    progress = _runs.get(run_key)
+    if progress is not None and progress.completed == len(verdicts):
+        collected, counts = progress.verdicts, progress.counts
+    else:
+        logger.info("Streamed progress is incomplete, building the report from the state")
+        collected, counts = verdicts, count_verdicts(verdicts)
+
+    return FactCheckReport(
+        answer=answer,
+        claims_verified=len(collected),
+        verified_claims=sorted(collected, key=lambda verdict: verdict.original_index),
+        summary=summarize_counts(counts),
+        timestamp=datetime.now(),
+    )
+
+
+def emit_report(run_key: str, report: FactCheckReport) -> None:
+    """Emit the final report event and forget the run's progress."""
+    progress = _runs.pop(run_key, None) or RunProgress()
+    event = ReportEvent(sequence=progress.next_sequence(), report=report)
+    _write(event.model_dump(mode="json"))
@@ -3,15 +3,18 @@
 
 import asyncio
 import sys
-from typing import Optional
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
 
 from security.api_keys import (
     generate_secure_api_key,
-    get_api_keys,
+    iter_api_keys,
     revoke_api_key,
+    revoke_api_keys,
     store_api_key,
+    store_api_keys,
 )
-from utils.redis import test_redis_connection
+from utils.redis import close_redis, test_redis_connection
 
 
 def print_usage() -> None:
@@ -23,15 +26,32 @@ def print_usage() -> None:
         python api_key.py generate [description]  - Generate new API key
         python api_key.py list                   - List all API keys
         python api_key.py revoke <api_key>       - Revoke an API key
+        python api_key.py import <file>          - Store keys from a file
+        python api_key.py revoke-bulk <file>     - Revoke keys listed in a file
         python api_key.py test                   - Test Redis connection
 
+    Key files contain one key per line, optionally followed by a tab and a
+    description. Blank lines and lines starting with '#' are ignored.
+
     Examples:
         python api_key.py generate "Production API key"
         python api_key.py generate "Development testing"
         python api_key.py revoke abc123xyz789
+        python api_key.py import keys.tsv
     """)
 
 
+def read_key_file(path: str) -> Iterator[Tuple[str, str]]:
+    """Yield (api_key, description) pairs from a key file."""
+    with Path(path).open(encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            api_key, _, description = line.partition("\t")
+            yield api_key.strip(), description.strip() or "Imported API key"
+
+
 async def handle_generate(description: Optional[str] = None) -> None:
     """Handle API key generation."""
     if not await test_redis_connection():
@@ -51,23 +71,25 @@ async def handle_generate(description: Optional[str] = None) -> None:
 
 
 async def handle_list() -> None:
-    """Handle listing API keys."""
-    api_keys = await get_api_keys()
+    """Handle listing API keys, printing each page as it arrives."""
+    count = 0
 
-    if not api_keys:
-        print("📭 No API keys found in Redis.")
-        return
-
-    print(f"📋 Found {len(api_keys)} API key(s):")
-    print("-" * 60)
-
-    for key_data in api_keys:
+    async for key_data in iter_api_keys():
+        if count == 0:
+            print("-" * 60)
+        count += 1
         print(f"🔑 Key: {key_data['key']}")
         print(f"📝 Description: {key_data['description']}")
         print(f"📅 Created: {key_data['created_at']}")
         print(f"✅ Active: {key_data['active']}")
         print("-" * 60)
 
+    if not count:
+        print("📭 No API keys found in Redis.")
+        return
+
+    print(f"📋 Found {count} API key(s).")
+
 
 async def handle_revoke(api_key: str) -> None:
     """Handle API key revocation."""
@@ -77,6 +99,19 @@ async def handle_revoke(api_key: str) -> None:
         print(f"❌ API key '{api_key}' not found.")
 
 
+async def handle_import(path: str) -> None:
+    """Handle bulk API key import from a file."""
+    stored = await store_api_keys(read_key_file(path))
+    print(f"✅ Stored {stored} API key(s) from '{path}'.")
+
+
+async def handle_revoke_bulk(path: str) -> None:
+    """Handle bulk API key revocation from a file."""
+    api_keys = (api_key for api_key, _ in read_key_file(path))
+    revoked = await revoke_api_keys(api_keys)
+    print(f"✅ Revoked {revoked} API key(s) listed in '{path}'.")
+
+
 async def handle_test() -> None:
     """Handle Redis connection test."""
     if await test_redis_connection():
@@ -118,6 +153,14 @@ async def main() -> None:
                 return
             await ensure_redis_connection(handle_revoke, sys.argv[2])
 
+        elif command in ("import", "revoke-bulk"):
+            if len(sys.argv) < 3:
+                print("❌ Please provide a key file.")
+                print(f"Usage: python api_key.py {command} <file>")
+                return
+            handler = handle_import if command == "import" else handle_revoke_bulk
+            await ensure_redis_connection(handler, sys.argv[2])
+
         elif command == "test":
             await handle_test()
 
@@ -127,6 +170,8 @@ async def main() -> None:
 
     except Exception as e:
         print(f"❌ Error executing command '{command}': {e}")
+    finally:
+        await close_redis()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Train the selection pre-filter from logged selection outcomes.
+
+Reads the JSONL outcome log written by selection_node (set
+SELECTION_PREFILTER_CONFIG["outcome_log_path"]), fits a TF-IDF + logistic
+regression classifier predicting "no verifiable claim", reports the
+precision of its drops at a few thresholds and saves it with joblib.
+
+Usage:
+    python scripts/train_prefilter.py <outcome_log.jsonl> <model.joblib>
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+import joblib
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import train_test_split
+from sklearn.pipeline import FeatureUnion, Pipeline
+
+THRESHOLDS = (0.8, 0.9, 0.95, 0.98)
+MIN_EXAMPLES = 200
+
+
+def load_outcomes(path: Path) -> Tuple[List[str], List[int]]:
+    """Load sentences and labels (1 = no claim selected), latest outcome wins."""
+    outcomes = {}
+    with path.open(encoding="utf-8") as log_file:
+        for line in log_file:
+            if line.strip():
+                record = json.loads(line)
+                outcomes[record["sentence"]] = 0 if record["selected"] else 1
+    return list(outcomes), list(outcomes.values())
+
+
+def build_model() -> Pipeline:
+    """Word and character n-grams feeding a balanced logistic regression."""
+    features = FeatureUnion(
+        [
+            ("words", TfidfVectorizer(ngram_range=(1, 2), min_df=2, sublinear_tf=True)),
+            (
+                "chars",
+                TfidfVectorizer(
+                    analyzer="char_wb", ngram_range=(2, 4), min_df=2, sublinear_tf=True
+                ),
+            ),
+        ]
+    )
+    return Pipeline(
+        [
+            ("features", features),
+            ("classifier", LogisticRegression(max_iter=1_000, class_weight="balanced")),
+        ]
+    )
+
+
+def main() -> None:
+    if len(sys.argv) != 3:
+        print(__doc__)
+        sys.exit(1)
+
+    sentences, labels = load_outcomes(Path(sys.argv[1]))
+    if len(sentences) < MIN_EXAMPLES or len(set(labels)) < 2:
+        print(f"❌ Need at least {MIN_EXAMPLES} distinct sentences with both outcomes")
+        sys.exit(1)
+
+    train_x, test_x, train_y, test_y = train_test_split(
+        sentences, labels, test_size=0.2, stratify=labels, random_state=0
+    )
+    model = build_model().fit(train_x, train_y)
+
+    # Precision matters most: a false drop loses a claim for good
+    probabilities = model.predict_proba(test_x)[:, 1]
+    test_y = np.array(test_y)
+    print(f"📊 {len(sentences)} sentences, {int(np.sum(labels))} without claims")
+    for threshold in THRESHOLDS:
+        drops = probabilities >= threshold
+        if drops.any():
+            precision = test_y[drops].mean()
+            print(
+                f"   threshold {threshold:.2f}: drops {drops.mean():.1%} of sentences, "
+                f"precision {precision:.1%}"
+            )
+        else:
+            print(f"   threshold {threshold:.2f}: drops nothing")
+
+    # Refit on everything before saving
+    model = build_model().fit(sentences, labels)
+    joblib.dump(model, sys.argv[2])
+    print(f"✅ Model saved to {sys.argv[2]}")
+
+
+if __name__ == "__main__":
+    main()
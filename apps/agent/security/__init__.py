@@ -3,15 +3,23 @@
 from .api_keys import (
     generate_secure_api_key,
     get_api_keys,
+    get_api_keys_page,
+    iter_api_keys,
     revoke_api_key,
+    revoke_api_keys,
     store_api_key,
+    store_api_keys,
     validate_api_key,
 )
 
 __all__ = [
     "generate_secure_api_key",
     "get_api_keys",
+    "get_api_keys_page",
+    "iter_api_keys",
     "revoke_api_key",
+    "revoke_api_keys",
     "store_api_key",
+    "store_api_keys",
     "validate_api_key",
 ]
@@ -3,6 +3,9 @@
 import secrets
 import string
 from datetime import datetime
+from typing import AsyncIterator, Iterable, Tuple
+
+import redis.asyncio as redis
 
 from utils.redis import redis_client
 
@@ -10,7 +13,11 @@ from utils.redis import redis_client
 API_KEY_LENGTH = 32
 API_KEY_PREFIX = "api_key:"
 API_KEYS_SET = "api_keys"
+# Pub/sub channel announcing keys whose state changed, so caches can drop them
+API_KEY_EVENTS_CHANNEL = "api_keys:events"
 ALPHABET = string.ascii_letters + string.digits
+# Keys fetched per SSCAN page / written per MULTI transaction
+BATCH_SIZE = 500
 
 
 def generate_secure_api_key(length: int = API_KEY_LENGTH) -> str:
@@ -18,54 +25,153 @@ def generate_secure_api_key(length: int = API_KEY_LENGTH) -> str:
     return "".join(secrets.choice(ALPHABET) for _ in range(length))
 
 
+def _new_key_data(description: str) -> dict:
+    return {
+        "created_at": datetime.now().isoformat(),
+        "description": description,
+        "active": "true",
+    }
+
+
+def _queue_store(pipe: redis.client.Pipeline, api_key: str, description: str) -> None:
+    pipe.hset(f"{API_KEY_PREFIX}{api_key}", mapping=_new_key_data(description))
+    pipe.sadd(API_KEYS_SET, api_key)
+    pipe.publish(API_KEY_EVENTS_CHANNEL, api_key)
+
+
+def _queue_revoke(pipe: redis.client.Pipeline, api_key: str) -> None:
+    pipe.delete(f"{API_KEY_PREFIX}{api_key}")
+    pipe.srem(API_KEYS_SET, api_key)
+    pipe.publish(API_KEY_EVENTS_CHANNEL, api_key)
+
+
 async def store_api_key(api_key: str, description: str = "") -> None:
-    """Store API key in Redis with metadata."""
+    """Store API key in Redis with metadata in a single transaction."""
     async with redis_client() as client:
-        key_data = {
-            "created_at": datetime.now().isoformat(),
-            "description": description,
-            "active": "true",
-        }
+        async with client.pipeline(transaction=True) as pipe:
+            _queue_store(pipe, api_key, description)
+            await pipe.execute()
 
-        await client.hset(f"{API_KEY_PREFIX}{api_key}", mapping=key_data)
-        await client.sadd(API_KEYS_SET, api_key)
 
+async def store_api_keys(
+    entries: Iterable[Tuple[str, str]], batch_size: int = BATCH_SIZE
+) -> int:
+    """Store many (api_key, description) pairs, one transaction per batch."""
+    stored = 0
+    batch = []
 
-async def get_api_keys() -> list[dict]:
-    """Get all stored API keys with their metadata."""
     async with redis_client() as client:
-        api_keys = await client.smembers(API_KEYS_SET)
 
-        if not api_keys:
-            return []
-
-        keys_data = []
-        for api_key in api_keys:
-            key_str = api_key.decode()
-            key_data = await client.hgetall(f"{API_KEY_PREFIX}{key_str}")
+        async def flush() -> None:
+            nonlocal stored
+            async with client.pipeline(transaction=True) as pipe:
+                for api_key, description in batch:
+                    _queue_store(pipe, api_key, description)
+                await pipe.execute()
+            stored += len(batch)
+            batch.clear()
+
+        for entry in entries:
+            batch.append(entry)
+            if len(batch) >= batch_size:
+                await flush()
+        if batch:
+            await flush()
+
+    return stored
+
+
+def _decode_key_data(key_str: str, key_data: dict) -> dict:
+    return {
+        "key": key_str,
+        "description": key_data.get(b"description", b"").decode(),
+        "created_at": key_data.get(b"created_at", b"").decode(),
+        "active": key_data.get(b"active", b"").decode(),
+    }
+
+
+async def get_api_keys_page(
+    cursor: int = 0, count: int = BATCH_SIZE
+) -> Tuple[int, list[dict]]:
+    """Get one SSCAN page of API keys with metadata.
+
+    Returns the cursor for the next page (0 once the scan is complete) and
+    the keys on this page. Metadata for the page is fetched in one pipeline.
+    """
+    async with redis_client() as client:
+        next_cursor, members = await client.sscan(
+            API_KEYS_SET, cursor=cursor, count=count
+        )
+        if not members:
+            return next_cursor, []
+
+        key_strs = [member.decode() for member in members]
+        async with client.pipeline(transaction=False) as pipe:
+            for key_str in key_strs:
+                pipe.hgetall(f"{API_KEY_PREFIX}{key_str}")
+            results = await pipe.execute()
+
+    return next_cursor, [
+        _decode_key_data(key_str, key_data)
+        for key_str, key_data in zip(key_strs, results)
+        if key_data
+    ]
+
+
+async def iter_api_keys(batch_size: int = BATCH_SIZE) -> AsyncIterator[dict]:
+    """Stream all stored API keys with metadata, one page at a time."""
+    seen = set()  # SSCAN may return a member more than once
+    cursor = 0
+
+    while True:
+        cursor, page = await get_api_keys_page(cursor, batch_size)
+        for key_data in page:
+            if key_data["key"] not in seen:
+                seen.add(key_data["key"])
+                yield key_data
+        if cursor == 0:
+            break
 
-            if key_data:
-                keys_data.append(
-                    {
-                        "key": key_str,
-                        "description": key_data.get(b"description", b"").decode(),
-                        "created_at": key_data.get(b"created_at", b"").decode(),
-                        "active": key_data.get(b"active", b"").decode(),
-                    }
-                )
 
-        return keys_data
+async def get_api_keys() -> list[dict]:
+    """Get all stored API keys with their metadata."""
+    return [key_data async for key_data in iter_api_keys()]
 
 
 async def revoke_api_key(api_key: str) -> bool:
     """Revoke an API key by removing it from Redis. Returns True if key existed."""
     async with redis_client() as client:
-        if not await client.exists(f"{API_KEY_PREFIX}{api_key}"):
-            return False
+        async with client.pipeline(transaction=True) as pipe:
+            _queue_revoke(pipe, api_key)
+            deleted, _, _ = await pipe.execute()
+        return bool(deleted)
+
+
+async def revoke_api_keys(api_keys: Iterable[str], batch_size: int = BATCH_SIZE) -> int:
+    """Revoke many API keys, one transaction per batch. Returns how many existed."""
+    revoked = 0
+    batch = []
+
+    async with redis_client() as client:
+
+        async def flush() -> None:
+            nonlocal revoked
+            async with client.pipeline(transaction=True) as pipe:
+                for api_key in batch:
+                    _queue_revoke(pipe, api_key)
+                results = await pipe.execute()
+            # Every key queues DEL, SREM, PUBLISH - DEL tells us if it existed
+            revoked += sum(bool(deleted) for deleted in results[::3])
+            batch.clear()
+
+        for api_key in api_keys:
+            batch.append(api_key)
+            if len(batch) >= batch_size:
+                await flush()
+        if batch:
+            await flush()
 
-        await client.delete(f"{API_KEY_PREFIX}{api_key}")
-        await client.srem(API_KEYS_SET, api_key)
-        return True
+    return revoked
 
 
 async def validate_api_key(api_key: str) -> bool:
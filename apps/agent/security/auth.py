@@ -1,33 +1,93 @@
+import asyncio
+import logging
+from typing import Optional
+
 import redis.asyncio as redis
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator
 
 from langgraph_sdk import Auth
+from utils.cache import TTLCache
+from utils.redis import redis_client
 from utils.settings import settings
-from security.api_keys import API_KEY_PREFIX
+from security.api_keys import API_KEY_EVENTS_CHANNEL, API_KEY_PREFIX
+
+logger = logging.getLogger(__name__)
 
 auth = Auth()
 
 BEARER_SCHEME = "bearer"
+INVALIDATION_RETRY_SECONDS = 5.0
+
+# Recent verification results, positive and negative, keyed by API key
+_verification_cache: TTLCache[str, bool] = TTLCache(
+    max_entries=settings.api_key_cache_max_entries,
+    ttl_seconds=settings.api_key_cache_ttl_seconds,
+)
+_invalidation_listener: Optional[asyncio.Task] = None
+
+
+def invalidate_cached_api_key(api_key: Optional[str] = None) -> None:
+    """Drop a cached verification result, or all of them if no key is given."""
+    if api_key is None:
+        _verification_cache.clear()
+    else:
+        _verification_cache.delete(api_key)
+
+
+async def _listen_for_key_events() -> None:
+    """Invalidate cached results when keys are stored or revoked anywhere."""
+    while True:
+        try:
+            async with redis_client() as client:
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(API_KEY_EVENTS_CHANNEL)
+                    # Anything cached before we subscribed may be stale
+                    invalidate_cached_api_key()
+                    async for message in pubsub.listen():
+                        if message.get("type") != "message":
+                            continue
+                        data = message["data"]
+                        invalidate_cached_api_key(
+                            data.decode() if isinstance(data, bytes) else data
+                        )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"API key invalidation listener failed: {e}")
+            invalidate_cached_api_key()
+            await asyncio.sleep(INVALIDATION_RETRY_SECONDS)
+
+
+def _ensure_invalidation_listener() -> None:
+    """Start the pub/sub invalidation listener once per process."""
+    global _invalidation_listener
+
+    if _invalidation_listener is None or _invalidation_listener.done():
+        _invalidation_listener = asyncio.create_task(_listen_for_key_events())
 
 
-@asynccontextmanager
-async def redis_client() -> AsyncGenerator[redis.Redis, None]:
-    """Redis client context manager for proper connection handling."""
-    client = redis.from_url(str(settings.redis_uri))
-    try:
-        yield client
-    finally:
-        await client.aclose()
+async def _verify_api_key(api_key: str) -> bool:
+    """Verify API key exists in Redis, using the short-lived local cache.
 
+    Raises:
+        Auth.exceptions.HTTPException: 503 if Redis can't be reached, so an
+            outage or an exhausted pool never looks like an invalid key
+    """
+    _ensure_invalidation_listener()
+
+    cached = _verification_cache.get(api_key)
+    if cached is not None:
+        return cached
 
-async def _verify_api_key(api_key: str) -> bool:
-    """Verify API key exists in Redis."""
     try:
         async with redis_client() as client:
-            return bool(await client.exists(f"{API_KEY_PREFIX}{api_key}"))
-    except redis.RedisError:
-        return False
+            is_valid = bool(await client.exists(f"{API_KEY_PREFIX}{api_key}"))
+    except redis.RedisError as e:
+        # Don't cache failures - the next request should retry Redis
+        logger.error(f"API key verification unavailable: {e}")
+        raise Auth.exceptions.HTTPException(503, "Authentication temporarily unavailable")
+
+    _verification_cache.set(api_key, is_valid)
+    return is_valid
 
 
 def _parse_authorization(authorization: str) -> str:
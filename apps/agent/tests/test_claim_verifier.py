@@ -0,0 +1,58 @@
+import asyncio
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+
+from fact_checker.nodes import claim_verifier
+from utils import PriorityLimiter
+
+
+@pytest.fixture
+def verified(monkeypatch):
+    """Claims in the order the (stubbed) verifier graph receives them."""
+    order = []
+
+    async def no_cached_verdict(claim):
+        return None
+
+    async def ainvoke(payload):
+        order.append(payload["claim"].claim_text)
+        await asyncio.sleep(0.01)
+        return {}
+
+    monkeypatch.setattr(claim_verifier, "_claim_limiter", PriorityLimiter(2))
+    monkeypatch.setattr(claim_verifier, "_run_starts", OrderedDict())
+    monkeypatch.setattr(claim_verifier, "_virtual_time", 0.0)
+    monkeypatch.setattr(claim_verifier, "BACKPRESSURE", False)
+    monkeypatch.setattr(claim_verifier, "lookup_verdict", no_cached_verdict)
+    monkeypatch.setattr(
+        claim_verifier, "claim_verifier_graph", SimpleNamespace(ainvoke=ainvoke)
+    )
+    return order
+
+
+def verify(run_key, rank):
+    claim = SimpleNamespace(claim_text=f"{run_key}{rank}")
+    return claim_verifier.claim_verifier_node(
+        {"claim": claim, "run_key": run_key, "priority": rank}
+    )
+
+
+def test_new_run_shares_slots_with_a_long_one(verified):
+    async def scenario():
+        long_run = [asyncio.create_task(verify("a", rank)) for rank in range(20)]
+        await asyncio.sleep(0.035)
+        new_run = [asyncio.create_task(verify("b", rank)) for rank in range(3)]
+        await asyncio.gather(*long_run, *new_run)
+
+    asyncio.run(scenario())
+
+    # Each run keeps its own order
+    assert [claim for claim in verified if claim[0] == "a"] == [f"a{i}" for i in range(20)]
+    assert [claim for claim in verified if claim[0] == "b"] == ["b0", "b1", "b2"]
+    # The new run neither jumps ahead of the claims already admitted nor
+    # waits behind the whole long run: the two alternate
+    start = verified.index("b0")
+    assert start > 0
+    assert [claim[0] for claim in verified[start : start + 5]] == list("babab")
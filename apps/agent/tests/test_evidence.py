@@ -0,0 +1,80 @@
+from claim_verifier.evidence import canonicalize_url, collapse_duplicates, simhash
+from claim_verifier.schemas import Evidence
+
+ARTICLE = (
+    "The city council approved the new budget on Tuesday after a long debate. "
+    "The plan raises spending on public transport and schools, while cutting "
+    "the administration costs of the town hall. Opposition members criticised "
+    "the late publication of the proposal and asked for more time to review "
+    "the numbers before the final vote next month."
+)
+OTHER_ARTICLE = (
+    "Heavy rain caused flooding in several villages in the south of the region. "
+    "Firefighters evacuated dozens of residents and the main road stayed closed "
+    "for most of the day while workers cleared fallen trees and debris."
+)
+
+
+def test_url_variants_share_a_canonical_form():
+    canonical = canonicalize_url("https://example.com/news/budget")
+
+    for variant in (
+        "http://www.example.com/news/budget/",
+        "https://m.example.com/news/budget?utm_source=x&fbclid=y",
+        "https://amp.example.com/news/budget/amp#comments",
+    ):
+        assert canonicalize_url(variant) == canonical
+
+
+def test_short_texts_have_no_fingerprint():
+    assert simhash("Too short to fingerprint.") is None
+
+
+def test_copies_under_other_urls_are_collapsed():
+    evidence = [
+        Evidence(url="https://example.com/budget", text=ARTICLE),
+        Evidence(url="https://mirror.example.org/a/1", text=ARTICLE.upper()),
+        Evidence(url="https://example.com/floods", text=OTHER_ARTICLE),
+    ]
+
+    collapsed = collapse_duplicates(evidence)
+
+    assert [item.url for item in collapsed] == [
+        "https://example.com/budget",
+        "https://example.com/floods",
+    ]
+
+
+def test_reformatted_copies_are_collapsed():
+    # Syndicated copies often differ only in punctuation, case and spacing
+    edited = ARTICLE.replace(",", "").replace(". ", ".\n\n").replace("The plan", "the plan")
+    evidence = [
+        Evidence(url="https://a.example.com/1", text=ARTICLE),
+        Evidence(url="https://b.example.com/2", text=edited),
+    ]
+
+    assert len(collapse_duplicates(evidence)) == 1
+
+
+def test_best_copy_is_kept():
+    evidence = [
+        Evidence(url="https://example.com/budget?utm_source=feed", text=ARTICLE[:200]),
+        Evidence(url="https://www.example.com/budget", text=ARTICLE, title="Budget"),
+    ]
+
+    (kept,) = collapse_duplicates(evidence)
+
+    assert kept.title == "Budget"
+    assert kept.text == ARTICLE
+
+
+def test_duplicates_of_existing_evidence_are_dropped():
+    existing = [Evidence(url="https://example.com/budget", text=ARTICLE)]
+    evidence = [
+        Evidence(url="https://www.example.com/budget/", text="Snippet of the same page."),
+        Evidence(url="https://example.com/floods", text=OTHER_ARTICLE),
+    ]
+
+    collapsed = collapse_duplicates(evidence, existing=existing)
+
+    assert [item.url for item in collapsed] == ["https://example.com/floods"]
@@ -0,0 +1,35 @@
+import pytest
+
+from claim_extractor.prefilter import DROP_THRESHOLD, heuristic_score
+
+
+@pytest.mark.parametrize(
+    "sentence",
+    [
+        "Inflation hit 9%.",
+        "Inflation hit 9%",
+        "Biden won Arizona.",
+        "Biden won Arizona",
+        "- Biden won Arizona",
+        "Obama resigned",
+        "Is Prague the capital?",
+        "GDP grew 3% in 2023",
+    ],
+)
+def test_short_claims_are_kept(sentence):
+    confidence, _ = heuristic_score(sentence)
+    assert confidence < DROP_THRESHOLD
+
+
+@pytest.mark.parametrize(
+    "sentence, reason",
+    [
+        ("Really", "fragment"),
+        ("Thanks!", "greeting"),
+        ("Hello everyone, Jana", "greeting"),
+    ],
+)
+def test_obvious_non_claims_are_dropped(sentence, reason):
+    confidence, heuristic = heuristic_score(sentence)
+    assert heuristic == reason
+    assert confidence >= DROP_THRESHOLD
@@ -0,0 +1,167 @@
+import asyncio
+import time
+
+import pytest
+
+from utils import ratelimit
+from utils.ratelimit import (
+    Governor,
+    PriorityLimiter,
+    is_rate_limit_error,
+    retry_after_seconds,
+)
+
+
+class RateLimitError(Exception):
+    def __init__(self, retry_after_ms="10"):
+        super().__init__("HTTP 429")
+        self.status_code = 429
+        self.headers = {"retry-after-ms": retry_after_ms}
+
+
+def governor():
+    return Governor("test", requests_per_second=1_000, burst=1_000, max_concurrency=4)
+
+
+def test_rate_limit_errors_are_recognized():
+    error = RateLimitError(retry_after_ms="250")
+
+    assert is_rate_limit_error(error)
+    assert retry_after_seconds(error) == 0.25
+    assert not is_rate_limit_error(ValueError())
+
+
+def test_rate_limited_call_is_retried():
+    calls = []
+
+    async def call():
+        calls.append(time.monotonic())
+        if len(calls) < 3:
+            raise RateLimitError()
+        return "ok"
+
+    assert asyncio.run(governor().run(call)) == "ok"
+    assert len(calls) == 3
+    # Each retry waits for the provider's Retry-After hint
+    assert calls[2] - calls[0] >= 0.02
+
+
+def test_retries_are_bounded():
+    calls = []
+
+    async def call():
+        calls.append(1)
+        raise RateLimitError(retry_after_ms="1")
+
+    with pytest.raises(RateLimitError):
+        asyncio.run(governor().run(call))
+    assert len(calls) == ratelimit.MAX_RATE_LIMIT_RETRIES + 1
+
+
+def test_other_errors_are_not_retried():
+    calls = []
+
+    async def call():
+        calls.append(1)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        asyncio.run(governor().run(call))
+    assert len(calls) == 1
+
+
+def test_rate_limit_pauses_every_caller():
+    gov = governor()
+    started = []
+
+    async def limited():
+        if not started:
+            started.append(time.monotonic())
+            raise RateLimitError(retry_after_ms="100")
+        return "ok"
+
+    async def other():
+        started.append(time.monotonic())
+
+    async def other_later():
+        await asyncio.sleep(0.01)
+        await gov.run(other)
+
+    async def both():
+        await asyncio.gather(gov.run(limited), other_later())
+
+    asyncio.run(both())
+    # The second caller waited out the pause triggered by the first
+    assert started[1] - started[0] >= 0.09
+
+
+async def hold(limiter, priority, order, release=None):
+    async with limiter.slot(priority):
+        order.append(priority)
+        if release is not None:
+            await release.wait()
+
+
+def test_limiter_admits_lowest_priority_first():
+    async def scenario():
+        limiter = PriorityLimiter(1)
+        order = []
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(limiter, 0, order, release))
+        await asyncio.sleep(0)
+
+        waiters = [asyncio.create_task(hold(limiter, p, order)) for p in (5, 1, 3, 1)]
+        await asyncio.sleep(0)
+        assert limiter.queue_depth == 4
+
+        release.set()
+        await asyncio.gather(holder, *waiters)
+        return order, limiter.in_flight
+
+    order, in_flight = asyncio.run(scenario())
+    assert order == [0, 1, 1, 3, 5]
+    assert in_flight == 0
+
+
+def test_cancelled_waiter_is_skipped():
+    async def scenario():
+        limiter = PriorityLimiter(1)
+        order = []
+        release = asyncio.Event()
+        holder = asyncio.create_task(hold(limiter, 0, order, release))
+        await asyncio.sleep(0)
+
+        first = asyncio.create_task(hold(limiter, 1, order))
+        second = asyncio.create_task(hold(limiter, 2, order))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        release.set()
+        await asyncio.gather(holder, second)
+        return order, limiter.in_flight
+
+    order, in_flight = asyncio.run(scenario())
+    assert order == [0, 2]
+    assert in_flight == 0
+
+
+def test_slot_handed_to_cancelled_waiter_is_passed_on():
+    async def scenario():
+        limiter = PriorityLimiter(1)
+        order = []
+        held = limiter.slot(0)
+        await held.__aenter__()
+
+        first = asyncio.create_task(hold(limiter, 1, order))
+        second = asyncio.create_task(hold(limiter, 2, order))
+        await asyncio.sleep(0)
+
+        # Hand the slot to `first`, then cancel it before it gets to run
+        await held.__aexit__(None, None, None)
+        first.cancel()
+        await asyncio.wait_for(second, timeout=1)
+        return order, limiter.in_flight
+
+    order, in_flight = asyncio.run(scenario())
+    assert order == [2]
+    assert in_flight == 0
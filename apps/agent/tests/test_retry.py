@@ -0,0 +1,183 @@
+import asyncio
+import itertools
+from types import SimpleNamespace
+
+import pytest
+
+from utils import llm, retry
+from utils.retry import CircuitBreaker, is_retryable_error
+
+
+class StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class FakeModel:
+    """Chat model stand-in whose structured calls run a scripted coroutine."""
+
+    _names = itertools.count()
+
+    def __init__(self, respond):
+        # A fresh name per model, so each test gets its own breaker
+        self.model_name = f"fake-model-{next(self._names)}"
+        self.respond = respond
+
+    def with_structured_output(self, output_class):
+        return self
+
+    async def ainvoke(self, messages):
+        return await self.respond()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Frozen clock for the breaker only (asyncio keeps the real one)."""
+    now = [1_000.0]
+    monkeypatch.setattr(retry, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(llm, "backoff_with_jitter", lambda attempt: 0.0)
+
+
+def invoke(model, max_attempts=3):
+    return asyncio.run(
+        llm._invoke_with_retries(
+            model, dict, [], "test call", max_attempts=max_attempts, deadline_seconds=5
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    "error, retryable",
+    [
+        (StatusError(503), True),
+        (StatusError(408), True),
+        (StatusError(429), False),
+        (StatusError(400), False),
+        (TimeoutError(), True),
+        (ConnectionError(), True),
+        (ValueError(), False),
+    ],
+)
+def test_is_retryable_error(error, retryable):
+    assert is_retryable_error(error) is retryable
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_timeout=30)
+
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+
+    assert breaker.state == breaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_breaker_lets_one_probe_through_after_timeout(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+
+    clock[0] += 31
+    assert breaker.allow_request()
+    assert breaker.state == breaker.HALF_OPEN
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == breaker.CLOSED
+    assert breaker.allow_request()
+
+
+def test_failed_probe_reopens_breaker(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock[0] += 31
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+
+    assert breaker.state == breaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_released_probe_lets_next_call_probe(clock):
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock[0] += 31
+    assert breaker.allow_request()
+
+    breaker.release_probe()
+
+    assert breaker.allow_request()
+    assert breaker.state == breaker.HALF_OPEN
+
+
+def test_transient_errors_are_retried():
+    errors = [StatusError(503), TimeoutError()]
+
+    async def respond():
+        if errors:
+            raise errors.pop(0)
+        return {"ok": True}
+
+    model = FakeModel(respond)
+
+    assert invoke(model) == {"ok": True}
+    assert retry.get_circuit_breaker(model.model_name).state == CircuitBreaker.CLOSED
+
+
+def test_permanent_errors_are_not_retried():
+    calls = []
+
+    async def respond():
+        calls.append(1)
+        raise StatusError(400)
+
+    assert invoke(FakeModel(respond)) is None
+    assert len(calls) == 1
+
+
+def test_open_breaker_skips_the_call():
+    calls = []
+
+    async def respond():
+        calls.append(1)
+        return {"ok": True}
+
+    model = FakeModel(respond)
+    breaker = retry.get_circuit_breaker(model.model_name)
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+    assert invoke(model) is None
+    assert calls == []
+
+
+def test_cancelled_probe_is_released(clock):
+    async def respond():
+        await asyncio.sleep(10)
+
+    model = FakeModel(respond)
+    breaker = retry.get_circuit_breaker(model.model_name)
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    clock[0] += breaker.reset_timeout + 1
+
+    async def cancel_probe():
+        task = asyncio.create_task(
+            llm._invoke_with_retries(model, dict, [], "probe", 1, deadline_seconds=5)
+        )
+        await asyncio.sleep(0.01)
+        assert breaker.state == breaker.HALF_OPEN
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_probe())
+
+    assert breaker.allow_request()
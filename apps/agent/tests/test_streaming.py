@@ -0,0 +1,96 @@
+from collections import OrderedDict
+
+import pytest
+
+from claim_verifier import Verdict
+from claim_verifier.schemas import VerificationResult
+from fact_checker import streaming
+
+SUPPORTED = VerificationResult.SUPPORTED
+REFUTED = VerificationResult.REFUTED
+
+
+@pytest.fixture
+def events(monkeypatch):
+    """Payloads written to the (stubbed) stream writer."""
+    written = []
+    monkeypatch.setattr(streaming, "_runs", OrderedDict())
+    monkeypatch.setattr(streaming, "get_stream_writer", lambda: written.append)
+    return written
+
+
+def verdict(index, result=SUPPORTED):
+    return Verdict(
+        claim_text=f"Claim {index}.",
+        original_index=index,
+        result=result,
+        reasoning="Because.",
+    )
+
+
+def test_summary_reports_progress_until_every_claim_is_verified():
+    counts = {SUPPORTED.value: 2, REFUTED.value: 1}
+
+    assert streaming.summarize_counts(counts, total=5).startswith(
+        "Fact-check in progress. 3 of 5"
+    )
+    assert streaming.summarize_counts(counts, total_known=False).startswith(
+        "Fact-check in progress. 3 claims"
+    )
+    assert streaming.summarize_counts(counts, total=3) == (
+        "Fact-check complete. Of 3 claims verified: 2 supported, 1 refuted"
+    )
+
+
+def test_each_verdict_is_emitted_with_running_counts(events):
+    streaming.emit_verdicts("run", [verdict(2), verdict(0, REFUTED)], total=3)
+    streaming.emit_verdicts("run", [verdict(1)], total=3)
+
+    assert [event["sequence"] for event in events] == [1, 2, 3]
+    assert [event["completed"] for event in events] == [1, 2, 3]
+    assert events[-1]["counts"] == {SUPPORTED.value: 2, REFUTED.value: 1}
+    assert events[-1]["summary"].startswith("Fact-check complete")
+
+
+def test_pipelined_events_have_no_total(events):
+    streaming.emit_verdicts("run", [verdict(0)], total=None)
+
+    (event,) = events
+    assert event["total"] is None
+    assert event["summary"].startswith("Fact-check in progress")
+
+
+def test_report_is_built_from_streamed_progress(events):
+    verdicts = [verdict(2), verdict(0, REFUTED), verdict(1)]
+    streaming.emit_verdicts("run", verdicts, total=3)
+
+    report = streaming.build_report("run", "Answer.", verdicts)
+    streaming.emit_report("run", report)
+
+    assert [v.original_index for v in report.verified_claims] == [0, 1, 2]
+    assert report.summary.endswith("2 supported, 1 refuted")
+    assert events[-1]["sequence"] == 4
+    assert "run" not in streaming._runs
+
+
+def test_report_falls_back_to_state_when_progress_is_incomplete(events):
+    verdicts = [verdict(0), verdict(1, REFUTED)]
+    # Only one verdict was streamed on this worker
+    streaming.emit_verdicts("run", verdicts[:1], total=2)
+
+    report = streaming.build_report("run", "Answer.", verdicts)
+
+    assert report.claims_verified == 2
+    assert report.summary.endswith("1 supported, 1 refuted")
+
+
+def test_events_outside_a_graph_are_dropped(monkeypatch):
+    def no_graph():
+        raise RuntimeError("Called get_config outside of a runnable context")
+
+    monkeypatch.setattr(streaming, "_runs", OrderedDict())
+    monkeypatch.setattr(streaming, "get_stream_writer", no_graph)
+
+    streaming.emit_verdicts("run", [verdict(0)], total=1)
+
+    assert streaming._runs["run"].completed == 1
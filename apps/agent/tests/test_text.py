@@ -0,0 +1,41 @@
+import pytest
+
+from utils.text import same_key_terms
+
+
+@pytest.mark.parametrize(
+    "text, other",
+    [
+        ("Prague is the capital of Czechia", "Prague is the capital city of Czechia"),
+        ("The capital is Prague", "Prague is the capital"),
+        ("Inflation hit 9% in 2022", "Inflation hit 9 percent in 2022"),
+        ("Praha má 1,3 milionu obyvatel", "Praha má 1,3 milionů obyvatel"),
+        ("Vaccines aren't dangerous", "Vaccines are not dangerous"),
+        ("The bridge was never finished", "The bridge was not finished"),
+    ],
+)
+def test_matching_claims(text, other):
+    assert same_key_terms(text, other)
+    assert same_key_terms(other, text)
+
+
+@pytest.mark.parametrize(
+    "text, other",
+    [
+        ("Inflation hit 9% in 2022", "Inflation hit 9% in 2023"),
+        ("Biden won Arizona", "Trump won Arizona"),
+        # Negated pairs
+        ("Vaccines are safe", "Vaccines are not safe"),
+        ("The bridge was finished in 1990", "The bridge was never finished in 1990"),
+        ("Vaccines cause autism", "Vaccines don't cause autism"),
+        ("Praha je hlavní město", "Praha není hlavní město"),
+        # Re-scaled pairs
+        ("The city has 3 million residents", "The city has 3 billion residents"),
+        ("The deficit is 5 billion", "The deficit is 5 percent"),
+        ("Unemployment fell by 5%", "Unemployment fell by 5"),
+        ("Rozpočet je 20 milionů", "Rozpočet je 20 miliard"),
+    ],
+)
+def test_differing_claims(text, other):
+    assert not same_key_terms(text, other)
+    assert not same_key_terms(other, text)
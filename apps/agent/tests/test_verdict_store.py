@@ -0,0 +1,100 @@
+import asyncio
+from collections import OrderedDict
+
+import numpy as np
+import pytest
+
+from claim_extractor import ValidatedClaim
+from claim_verifier import verdict_store
+from claim_verifier.schemas import Evidence, Verdict, VerificationResult
+from utils import TieredCache
+
+CLAIM = "The Eiffel Tower is 330 metres tall."
+PARAPHRASE = "The height of the Eiffel Tower is 330 metres."
+OTHER_NUMBER = "The Eiffel Tower is 300 metres tall."
+NEGATED = "The Eiffel Tower is not 330 metres tall."
+UNRELATED = "Prague is the capital of the Czech Republic."
+
+
+@pytest.fixture(autouse=True)
+def store(monkeypatch):
+    """Memory-only store with fixed embeddings instead of the embedding model."""
+    same = np.array([1.0, 0.0])
+    vectors = {
+        CLAIM: same,
+        PARAPHRASE: np.array([0.99, 0.141]),
+        # Same direction as the stored claim, so only the key terms tell them apart
+        OTHER_NUMBER: same,
+        NEGATED: same,
+        UNRELATED: np.array([0.0, 1.0]),
+    }
+
+    async def embed_claim(text):
+        return vectors[text]
+
+    monkeypatch.setattr(verdict_store, "_store", TieredCache("test-verdict"))
+    monkeypatch.setattr(verdict_store, "_near_match_index", OrderedDict())
+    monkeypatch.setattr(verdict_store, "_embed_claim", embed_claim)
+
+
+def verdict(claim_text, sources=True):
+    return Verdict(
+        claim_text=claim_text,
+        result=VerificationResult.SUPPORTED,
+        reasoning="Official figures.",
+        sources=[Evidence(url="https://example.com/tower", text="330 m")] if sources else [],
+    )
+
+
+def lookup(claim_text):
+    return asyncio.run(verdict_store.lookup_verdict(ValidatedClaim(claim_text=claim_text)))
+
+
+def test_claims_are_normalized():
+    assert verdict_store.normalize_claim("  The  EIFFEL tower, is 330 m! ") == (
+        "the eiffel tower is 330 m"
+    )
+
+
+def test_present_tense_claims_expire_sooner():
+    assert verdict_store.claim_ttl_seconds(CLAIM) == verdict_store.TTL_SECONDS
+    assert (
+        verdict_store.claim_ttl_seconds("Inflation is currently 3 %.")
+        == verdict_store.TIME_SENSITIVE_TTL_SECONDS
+    )
+
+
+def test_exact_match_is_reused():
+    asyncio.run(verdict_store.store_verdict(verdict(CLAIM)))
+
+    reused = lookup("the eiffel tower is 330 metres tall")
+
+    assert reused.claim_text == "the eiffel tower is 330 metres tall"
+    assert reused.result == VerificationResult.SUPPORTED
+    assert reused.provenance.match == "exact"
+    assert reused.provenance.matched_claim == CLAIM
+
+
+def test_paraphrase_is_reused():
+    asyncio.run(verdict_store.store_verdict(verdict(CLAIM)))
+
+    reused = lookup(PARAPHRASE)
+
+    assert reused.claim_text == PARAPHRASE
+    assert reused.provenance.match == "near"
+    assert reused.provenance.matched_claim == CLAIM
+    assert reused.provenance.similarity >= verdict_store.NEAR_MATCH_THRESHOLD
+
+
+@pytest.mark.parametrize("claim_text", [OTHER_NUMBER, NEGATED, UNRELATED])
+def test_claims_with_other_key_terms_are_not_reused(claim_text):
+    asyncio.run(verdict_store.store_verdict(verdict(CLAIM)))
+
+    assert lookup(claim_text) is None
+
+
+def test_verdicts_without_sources_are_not_stored():
+    asyncio.run(verdict_store.store_verdict(verdict(CLAIM, sources=False)))
+
+    assert lookup(CLAIM) is None
+    assert not verdict_store._near_match_index
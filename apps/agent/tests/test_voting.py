@@ -0,0 +1,110 @@
+import asyncio
+import gc
+
+import pytest
+
+from utils import llm
+
+
+@pytest.fixture(autouse=True)
+def no_response_cache():
+    cache = llm.get_response_cache()
+    llm.set_response_cache(None)
+    yield
+    llm.set_response_cache(cache)
+
+
+def vote(processor, items, completions=3, min_successes=2, early_exit=True):
+    return asyncio.run(
+        llm.process_with_voting(
+            items,
+            processor,
+            llm=None,
+            completions=completions,
+            min_successes=min_successes,
+            result_factory=lambda result, item: result,
+            early_exit=early_exit,
+        )
+    )
+
+
+def test_early_exit_skips_undecidable_attempts():
+    calls = []
+
+    async def succeed(item, _):
+        calls.append(item)
+        return True, item
+
+    assert vote(succeed, ["a", "b"]) == ["a", "b"]
+    # Two successes decide each item, so the third attempt is never sent
+    assert len(calls) == 4
+
+
+def test_failed_attempt_is_replaced():
+    calls = []
+
+    async def first_fails(item, _):
+        calls.append(item)
+        return len(calls) > 1, item
+
+    assert vote(first_fails, ["a"]) == ["a"]
+    assert len(calls) == 3
+
+
+def test_item_is_dropped_once_threshold_is_out_of_reach():
+    calls = []
+
+    async def fail(item, _):
+        calls.append(item)
+        return False, None
+
+    assert vote(fail, ["a"]) == []
+    assert len(calls) == 2
+
+
+def test_without_early_exit_every_attempt_runs():
+    calls = []
+
+    async def succeed(item, _):
+        calls.append(item)
+        return True, item
+
+    assert vote(succeed, ["a"], early_exit=False) == ["a"]
+    assert len(calls) == 3
+
+
+def test_decided_item_cancels_running_attempts():
+    cancelled = []
+
+    async def attempt(index):
+        if index == 0:
+            return False, None
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(index)
+            raise
+        return True, "late"
+
+    attempts = asyncio.run(llm._collect_until_decided(attempt, 2, 2))
+
+    assert attempts == [(False, None)]
+    assert cancelled == [1]
+
+
+def test_failed_attempts_are_all_retrieved():
+    unhandled = []
+
+    async def attempt(index):
+        raise ValueError(f"attempt {index}")
+
+    async def collect():
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: unhandled.append(context)
+        )
+        with pytest.raises(ValueError):
+            await llm._collect_until_decided(attempt, 3, 3)
+        gc.collect()
+
+    asyncio.run(collect())
+    assert unhandled == []
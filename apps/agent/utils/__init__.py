@@ -3,35 +3,77 @@
 Common tools shared across all components.
 """
 
+from .cache import TieredCache, TTLCache, make_cache_key
+from .embeddings import cosine_scores, embed_texts, embed_texts_sync
 from .llm import (
     call_llm_with_structured_output,
     process_with_voting,
     estimate_token_count,
     truncate_evidence_for_token_limit,
+    get_response_cache,
+    set_response_cache,
+    response_cache_stats,
+)
+from .ratelimit import (
+    PriorityLimiter,
+    get_governor,
+    governed,
+    governor_stats,
+    wait_for_capacity,
+)
+from .models import close_llm_clients, get_default_llm, get_llm
+from .redis import (
+    close_redis,
+    get_redis,
+    init_redis,
+    redis_client,
+    test_redis_connection,
 )
-from .models import get_llm, get_default_llm
-from .redis import redis_client, test_redis_connection
 from .settings import settings
-from .text import remove_following_sentences
+from .text import same_key_terms
+from .tokens import count_tokens
 
 __all__ = [
+    # Cache utilities
+    "TTLCache",
+    "TieredCache",
+    "make_cache_key",
     # Checkpointer utilities
     "create_checkpointer",
     "setup_checkpointer",
     "create_checkpointer_sync",
+    # Embedding utilities
+    "embed_texts",
+    "embed_texts_sync",
+    "cosine_scores",
     # LLM utilities
     "call_llm_with_structured_output",
     "process_with_voting",
     "estimate_token_count",
     "truncate_evidence_for_token_limit",
+    "get_response_cache",
+    "set_response_cache",
+    "response_cache_stats",
     # LLM models
     "get_llm",
     "get_default_llm",
+    "close_llm_clients",
+    # Rate limiting
+    "get_governor",
+    "governed",
+    "governor_stats",
+    "PriorityLimiter",
+    "wait_for_capacity",
     # Redis utilities
     "redis_client",
+    "get_redis",
+    "init_redis",
+    "close_redis",
     "test_redis_connection",
     # Settings
     "settings",
     # Text utilities
-    "remove_following_sentences",
+    "same_key_terms",
+    # Token accounting
+    "count_tokens",
 ]
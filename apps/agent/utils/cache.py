@@ -0,0 +1,197 @@
+"""Caching utilities.
+
+In-memory LRU/TTL cache with an optional Redis tier behind it.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, List, Optional, Sequence, Tuple, TypeVar
+
+from .redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+CACHE_KEY_PREFIX = "cache:"
+
+
+def make_cache_key(*parts: Any) -> str:
+    """Hash arbitrary JSON-serializable parts into a stable cache key."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TTLCache(Generic[K, V]):
+    """Bounded in-memory LRU cache where every entry expires after a TTL."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl_seconds: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        """Remove a single entry if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TieredCache:
+    """String cache with an in-memory LRU tier and an optional Redis tier.
+
+    Values are stored as strings (usually JSON) so both tiers hold the same
+    representation. Redis failures are logged and treated as cache misses.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_entries: int = 10_000,
+        ttl_seconds: float = 86_400,
+        use_redis: bool = False,
+    ):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.use_redis = use_redis
+        self._memory: TTLCache[str, str] = TTLCache(max_entries, ttl_seconds)
+        self._stats = {"hits": 0, "misses": 0, "memory_hits": 0, "redis_hits": 0}
+
+    def _redis_key(self, key: str) -> str:
+        return f"{CACHE_KEY_PREFIX}{self.namespace}:{key}"
+
+    async def get(self, key: str) -> Optional[str]:
+        """Look up a key in memory first, then in Redis."""
+        value = self._memory.get(key)
+        if value is not None:
+            self._stats["hits"] += 1
+            self._stats["memory_hits"] += 1
+            return value
+
+        if self.use_redis:
+            try:
+                async with redis_client() as client:
+                    raw = await client.get(self._redis_key(key))
+            except Exception as e:
+                logger.warning(f"Redis cache lookup failed for {self.namespace}: {e}")
+                raw = None
+
+            if raw is not None:
+                value = raw.decode() if isinstance(raw, bytes) else raw
+                self._memory.set(key, value)
+                self._stats["hits"] += 1
+                self._stats["redis_hits"] += 1
+                return value
+
+        self._stats["misses"] += 1
+        return None
+
+    async def get_many(self, keys: Sequence[str]) -> List[Optional[str]]:
+        """Look up several keys: memory per key, then one Redis MGET for the rest."""
+        values = [self._memory.get(key) for key in keys]
+        self._stats["memory_hits"] += sum(value is not None for value in values)
+
+        missing = [i for i, value in enumerate(values) if value is None]
+        if missing and self.use_redis:
+            try:
+                async with redis_client() as client:
+                    raws = await client.mget([self._redis_key(keys[i]) for i in missing])
+            except Exception as e:
+                logger.warning(f"Redis cache lookup failed for {self.namespace}: {e}")
+                raws = [None] * len(missing)
+
+            for i, raw in zip(missing, raws):
+                if raw is not None:
+                    values[i] = raw.decode() if isinstance(raw, bytes) else raw
+                    self._memory.set(keys[i], values[i])
+                    self._stats["redis_hits"] += 1
+
+        hits = sum(value is not None for value in values)
+        self._stats["hits"] += hits
+        self._stats["misses"] += len(values) - hits
+        return values
+
+    async def set(
+        self, key: str, value: str, ttl_seconds: Optional[float] = None
+    ) -> None:
+        """Store a value in every enabled tier."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._memory.set(key, value, ttl)
+
+        if self.use_redis:
+            try:
+                async with redis_client() as client:
+                    await client.set(self._redis_key(key), value, ex=max(1, int(ttl)))
+            except Exception as e:
+                logger.warning(f"Redis cache write failed for {self.namespace}: {e}")
+
+    async def set_many(
+        self, items: Sequence[Tuple[str, str, Optional[float]]]
+    ) -> None:
+        """Store several (key, value, ttl_seconds) entries, in one Redis round trip."""
+        if not items:
+            return
+
+        entries = [
+            (key, value, self.ttl_seconds if ttl is None else ttl) for key, value, ttl in items
+        ]
+        for key, value, ttl in entries:
+            self._memory.set(key, value, ttl)
+
+        if self.use_redis:
+            try:
+                async with redis_client() as client:
+                    async with client.pipeline(transaction=False) as pipe:
+                        for key, value, ttl in entries:
+                            pipe.set(self._redis_key(key), value, ex=max(1, int(ttl)))
+                        await pipe.execute()
+            except Exception as e:
+                logger.warning(f"Redis cache write failed for {self.namespace}: {e}")
+
+    async def delete(self, key: str) -> None:
+        """Remove a key from every enabled tier."""
+        self._memory.delete(key)
+
+        if self.use_redis:
+            try:
+                async with redis_client() as client:
+                    await client.delete(self._redis_key(key))
+            except Exception as e:
+                logger.warning(f"Redis cache delete failed for {self.namespace}: {e}")
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit and miss counters plus the current in-memory size."""
+        return {**self._stats, "size": len(self._memory)}
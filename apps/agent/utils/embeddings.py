@@ -0,0 +1,86 @@
+"""Sentence embedding utilities.
+
+Embeds text on CPU with sentence-transformers. The model is loaded once per
+process; embeddings are L2-normalized, so a dot product is cosine similarity.
+"""
+
+import asyncio
+import logging
+import threading
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+
+from .cache import TTLCache
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_BATCH_SIZE = 32
+EMBEDDING_CACHE_SIZE = 20_000
+EMBEDDING_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Recently embedded texts, so repeated claims and snippets are encoded once
+_embedding_cache: TTLCache[str, np.ndarray] = TTLCache(
+    EMBEDDING_CACHE_SIZE, EMBEDDING_CACHE_TTL_SECONDS
+)
+# Embedding runs in worker threads, so guard the shared cache
+_embedding_cache_lock = threading.Lock()
+_model_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _load_embedding_model() -> Optional[Any]:
+    try:
+        from sentence_transformers import SentenceTransformer
+
+        return SentenceTransformer(settings.embedding_model, device="cpu")
+    except Exception as e:
+        logger.warning(f"Embedding model '{settings.embedding_model}' unavailable: {e}")
+        return None
+
+
+def get_embedding_model() -> Optional[Any]:
+    """Load the embedding model once, or None if it cannot be loaded."""
+    # Concurrent first calls from worker threads must not load it twice
+    with _model_lock:
+        return _load_embedding_model()
+
+
+def embed_texts_sync(texts: Sequence[str]) -> Optional[np.ndarray]:
+    """Embed texts in batches, returning one normalized row per text."""
+    model = get_embedding_model()
+    if model is None:
+        return None
+    if not texts:
+        return np.zeros((0, model.get_sentence_embedding_dimension()))
+
+    with _embedding_cache_lock:
+        found = {text: _embedding_cache.get(text) for text in dict.fromkeys(texts)}
+
+    missing = [text for text, vector in found.items() if vector is None]
+    if missing:
+        vectors = model.encode(
+            missing,
+            batch_size=EMBEDDING_BATCH_SIZE,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+        )
+        with _embedding_cache_lock:
+            for text, vector in zip(missing, vectors):
+                found[text] = vector
+                _embedding_cache.set(text, vector)
+
+    return np.vstack([found[text] for text in texts])
+
+
+async def embed_texts(texts: Sequence[str]) -> Optional[np.ndarray]:
+    """Embed texts without blocking the event loop."""
+    return await asyncio.to_thread(embed_texts_sync, list(texts))
+
+
+def cosine_scores(query: np.ndarray, candidates: np.ndarray) -> List[float]:
+    """Cosine similarity of one normalized vector against normalized rows."""
+    return (candidates @ query).tolist()
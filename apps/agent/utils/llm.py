@@ -5,10 +5,30 @@ Helper functions for working with language models.
 
 import asyncio
 import logging
-from typing import Any, Callable, List, Optional, Tuple, Type, TypeVar
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+
+from .cache import TieredCache, make_cache_key
+from .ratelimit import backoff_with_jitter, governed, retry_after_seconds
+from .retry import get_circuit_breaker, is_retryable_error
+from .settings import settings
+from .tokens import count_tokens
 
 T = TypeVar("T")
 R = TypeVar("R")
@@ -16,9 +36,98 @@ M = TypeVar("M", bound=BaseModel)
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent LLM calls made by a single process_with_voting run
+DEFAULT_MAX_CONCURRENCY = 16
+
+# Retry settings for structured LLM calls
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_DEADLINE_SECONDS = 180.0  # Budget for one call including all retries
+
+# Extra tokens budgeted per evidence item for separators and numbering
+EVIDENCE_ITEM_SLACK_TOKENS = 4
+
+# Index of the voting attempt the current task belongs to. It is part of the
+# response cache key so repeated attempts stay independent samples on a fresh
+# run while re-checks of the same input still hit the cache for every attempt.
+_vote_attempt: ContextVar[int] = ContextVar("vote_attempt", default=0)
+
+_response_cache: Optional[TieredCache] = (
+    TieredCache(
+        namespace="llm",
+        max_entries=settings.llm_cache_max_entries,
+        ttl_seconds=settings.llm_cache_ttl_seconds,
+        use_redis=settings.llm_cache_use_redis,
+    )
+    if settings.llm_cache_enabled
+    else None
+)
+
+
+def set_response_cache(cache: Optional[TieredCache]) -> None:
+    """Replace the structured response cache. Pass None to disable caching."""
+    global _response_cache
+    _response_cache = cache
+
+
+def get_response_cache() -> Optional[TieredCache]:
+    """Get the structured response cache, if caching is enabled."""
+    return _response_cache
+
+
+def response_cache_stats() -> Dict[str, int]:
+    """Hit/miss counters of the structured response cache."""
+    return _response_cache.stats if _response_cache else {}
+
+
+@lru_cache(maxsize=256)
+def _schema_fingerprint(output_class: Type[BaseModel]) -> str:
+    return make_cache_key(
+        f"{output_class.__module__}.{output_class.__qualname__}",
+        output_class.model_json_schema(),
+    )
+
+
+def _normalize_messages(messages: Any) -> List[Tuple[str, Any]]:
+    """Turn tuples, message objects or prompt values into (role, content) pairs."""
+    if hasattr(messages, "to_messages"):
+        messages = messages.to_messages()
+
+    normalized = []
+    for message in messages:
+        if isinstance(message, BaseMessage):
+            role, content = message.type, message.content
+        elif isinstance(message, (tuple, list)) and len(message) == 2:
+            role, content = message
+        else:
+            role, content = "human", message
+
+        if isinstance(content, str):
+            content = " ".join(content.split())
+        normalized.append((str(role), content))
+
+    return normalized
+
+
+def _model_name(llm: BaseChatModel) -> str:
+    """Provider-side model name of a chat model, used for caching and limits."""
+    model = getattr(llm, "model_name", None) or getattr(llm, "model", None)
+    return model or type(llm).__name__
+
+
+def _response_cache_key(
+    llm: BaseChatModel, output_class: Type[BaseModel], messages: Any
+) -> str:
+    return make_cache_key(
+        _model_name(llm),
+        getattr(llm, "temperature", None),
+        _schema_fingerprint(output_class),
+        _normalize_messages(messages),
+        _vote_attempt.get(),
+    )
+
 
 def estimate_token_count(text: str) -> int:
-    return len(text) // 4
+    return count_tokens(text)
 
 
 def truncate_evidence_for_token_limit(
@@ -28,7 +137,15 @@ def truncate_evidence_for_token_limit(
     human_prompt_template: str,
     max_tokens: int = 120000,
     format_evidence_func: Callable[[List[Any]], str] = None,
+    relevance_scores: Optional[Sequence[float]] = None,
 ) -> List[Any]:
+    """Keep as much evidence as fits the token budget, in one linear pass.
+
+    Each item is costed once on its own (cached per formatted text). Items
+    are then taken greedily by relevance when scores are given, otherwise
+    most recent first, skipping any that no longer fit. The original order
+    is preserved in the result.
+    """
     if not evidence_items:
         return evidence_items
 
@@ -47,18 +164,34 @@ def truncate_evidence_for_token_limit(
     if available_tokens <= 0:
         return evidence_items[:1]
 
-    selected = []
-    for evidence in reversed(evidence_items):
-        test_tokens = estimate_token_count(format_func(selected + [evidence]))
-        if test_tokens <= available_tokens:
-            selected.append(evidence)
-        else:
-            break
+    # Formatting items one at a time misses the separator and the width of
+    # the item number, so pad each item a little
+    item_overhead = count_tokens("\n\n") + EVIDENCE_ITEM_SLACK_TOKENS
+    costs = [
+        count_tokens(format_func([item])) + item_overhead for item in evidence_items
+    ]
+
+    if relevance_scores is not None:
+        priority = sorted(
+            range(len(evidence_items)), key=lambda i: relevance_scores[i], reverse=True
+        )
+    else:
+        priority = range(len(evidence_items) - 1, -1, -1)
 
-    result = [e for e in evidence_items if e in selected]
+    keep = [False] * len(evidence_items)
+    used_tokens = 0
+    for index in priority:
+        if used_tokens + costs[index] <= available_tokens:
+            keep[index] = True
+            used_tokens += costs[index]
+
+    result = [item for item, kept in zip(evidence_items, keep) if kept]
 
     if len(result) < len(evidence_items):
-        logger.info(f"Truncated evidence: {len(evidence_items)} → {len(result)} items")
+        logger.info(
+            f"Truncated evidence: {len(evidence_items)} → {len(result)} items "
+            f"({used_tokens} of {available_tokens} tokens)"
+        )
 
     return result
 
@@ -68,24 +201,123 @@ async def call_llm_with_structured_output(
     output_class: Type[M],
     messages: List[Tuple[str, str]],
     context_desc: str = "",
+    use_cache: bool = True,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    deadline_seconds: float = DEFAULT_DEADLINE_SECONDS,
 ) -> Optional[M]:
     """Call LLM with structured output and consistent error handling.
 
+    Successful responses are stored in the response cache, keyed by the model,
+    the output schema and the normalized messages. Transient failures
+    (timeouts, connection errors, 5xx) are retried with backoff until
+    `max_attempts` or the deadline is reached, and a per-model circuit breaker
+    fails fast while the provider is down. Rate limits (429) are retried by
+    the per-model governor only.
+
     Args:
         llm: LLM instance
         output_class: Pydantic model for structured output
         messages: Messages to send to the LLM
         context_desc: Description for error logs
+        use_cache: Whether to read from and write to the response cache
+        max_attempts: How many times to try on transient errors
+        deadline_seconds: Overall time budget for the call, retries included
 
     Returns:
         Structured output or None if error
     """
-    try:
-        return await llm.with_structured_output(output_class).ainvoke(messages)
-    except Exception as e:
-        logger.error(f"Error in LLM call for {context_desc}: {e}")
+    cache = _response_cache if use_cache else None
+    cache_key = None
+
+    if cache is not None:
+        cache_key = _response_cache_key(llm, output_class, messages)
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            try:
+                return output_class.model_validate_json(cached)
+            except ValidationError:
+                logger.warning(f"Discarding stale cached response for {context_desc}")
+                await cache.delete(cache_key)
+
+    response = await _invoke_with_retries(
+        llm, output_class, messages, context_desc, max_attempts, deadline_seconds
+    )
+    if response is None:
         return None
 
+    if cache is not None and isinstance(response, BaseModel):
+        await cache.set(cache_key, response.model_dump_json())
+
+    return response
+
+
+async def _invoke_with_retries(
+    llm: BaseChatModel,
+    output_class: Type[M],
+    messages: Any,
+    context_desc: str,
+    max_attempts: int,
+    deadline_seconds: float,
+) -> Optional[M]:
+    """Invoke the model, retrying transient errors within the deadline."""
+    model = _model_name(llm)
+    breaker = get_circuit_breaker(model)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + deadline_seconds
+
+    for attempt in range(max_attempts):
+        if not breaker.allow_request():
+            logger.error(f"Circuit open for {model}, skipping call for {context_desc}")
+            return None
+        probing = breaker.state == breaker.HALF_OPEN
+
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            logger.error(f"Deadline exceeded in LLM call for {context_desc}")
+            return None
+
+        try:
+            async with asyncio.timeout(remaining):
+                # Shares per-model rate and concurrency limits with every other caller
+                response = await governed(
+                    model,
+                    lambda: llm.with_structured_output(output_class).ainvoke(messages),
+                )
+        except asyncio.CancelledError:
+            # Early exit and hedging cancel calls routinely; a cancelled probe
+            # must not leave the circuit stuck half-open
+            if probing:
+                breaker.release_probe()
+            raise
+        except Exception as e:
+            if not is_retryable_error(e):
+                # The provider answered, so it is up - this call is just bad
+                breaker.record_success()
+                logger.error(f"Error in LLM call for {context_desc}: {e}")
+                return None
+
+            breaker.record_failure()
+            if attempt + 1 >= max_attempts:
+                logger.error(
+                    f"Error in LLM call for {context_desc} "
+                    f"after {max_attempts} attempts: {e}"
+                )
+                return None
+
+            delay = retry_after_seconds(e) or backoff_with_jitter(attempt)
+            delay = min(delay, max(0.0, deadline - loop.time()))
+            logger.warning(
+                f"Transient error in LLM call for {context_desc}, "
+                f"retrying in {delay:.1f}s ({attempt + 1}/{max_attempts}): {e!r}"
+            )
+            await asyncio.sleep(delay)
+            continue
+
+        breaker.record_success()
+        return response
+
+    return None
+
 
 async def process_with_voting(
     items: List[T],
@@ -95,9 +327,16 @@ async def process_with_voting(
     min_successes: int,
     result_factory: Callable[[R, T], Any],
     description: str = "item",
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    early_exit: bool = True,
 ) -> List[Any]:
     """Process items with multiple LLM attempts and consensus voting.
 
+    All items are voted on together, with at most `max_concurrency` LLM
+    calls in flight at once. With `early_exit`, each item starts only
+    `min_successes` attempts and launches another only after one fails, so
+    attempts that cannot change the outcome are never sent.
+
     Args:
         items: Items to process
         processor: Function that processes each item
@@ -106,17 +345,34 @@ async def process_with_voting(
         min_successes: How many must succeed
         result_factory: Function to create final result
         description: Item type for logs
+        max_concurrency: Global limit on in-flight attempts
+        early_exit: Stop voting on an item once the outcome is decided
 
     Returns:
-        List of successfully processed results
+        List of successfully processed results, in the original item order
     """
-    results = []
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    saved_calls = 0
+
+    async def bounded_attempt(item: T, attempt: int) -> Tuple[bool, Optional[R]]:
+        # Runs in its own task, so this only tags calls made by this attempt
+        _vote_attempt.set(attempt)
+        async with semaphore:
+            return await processor(item, llm)
+
+    async def vote(item: T) -> Optional[Any]:
+        nonlocal saved_calls
 
-    for item in items:
         # Make multiple attempts
-        attempts = await asyncio.gather(
-            *[processor(item, llm) for _ in range(completions)]
-        )
+        if early_exit:
+            attempts = await _collect_until_decided(
+                lambda attempt: bounded_attempt(item, attempt), completions, min_successes
+            )
+            saved_calls += completions - len(attempts)
+        else:
+            attempts = await asyncio.gather(
+                *[bounded_attempt(item, attempt) for attempt in range(completions)]
+            )
 
         # Count successes
         success_count = sum(1 for success, _ in attempts if success)
@@ -126,14 +382,78 @@ async def process_with_voting(
             logger.info(
                 f"Not enough successes ({success_count}/{min_successes}) for {description}"
             )
-            continue
+            return None
 
         # Use the first successful result
         for success, result in attempts:
             if success and result is not None:
                 processed_result = result_factory(result, item)
                 if processed_result:
-                    results.append(processed_result)
-                    break
+                    return processed_result
+
+        return None
+
+    # gather keeps the input order regardless of completion order
+    voted = await asyncio.gather(*[vote(item) for item in items])
+
+    if saved_calls:
+        logger.info(
+            f"Early exit saved {saved_calls} of {len(items) * completions} "
+            f"LLM calls for {description}"
+        )
+
+    return [result for result in voted if result is not None]
+
+
+async def _collect_until_decided(
+    start_attempt: Callable[[int], Awaitable[Tuple[bool, Optional[R]]]],
+    completions: int,
+    min_successes: int,
+) -> List[Tuple[bool, Optional[R]]]:
+    """Run voting attempts for one item only while they can change the outcome.
+
+    Starts `min_successes` attempts and launches one more for each failure,
+    up to `completions`. Stops as soon as `min_successes` attempts succeeded
+    or enough have failed that the threshold is out of reach.
+
+    Args:
+        start_attempt: Makes the coroutine for the attempt with the given index
+        completions: Max attempts for the item
+        min_successes: How many must succeed
+
+    Returns:
+        Finished attempts in completion order; their count is the number of
+        attempts actually made
+    """
+    attempts: List[Tuple[bool, Optional[R]]] = []
+    successes = 0
+    launched = min(max(1, min_successes), completions)
+    running = {asyncio.create_task(start_attempt(i)) for i in range(launched)}
+
+    try:
+        while running:
+            done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            # Retrieve every finished attempt's exception before raising one,
+            # so none is left unretrieved
+            errors = [task.exception() for task in done]
+            if error := next((error for error in errors if error is not None), None):
+                raise error
+            for task in done:
+                success, result = task.result()
+                attempts.append((success, result))
+                successes += bool(success)
+
+            failures = len(attempts) - successes
+            if successes >= min_successes or completions - failures < min_successes:
+                break
+
+            # Replace each failed attempt while the threshold is still reachable
+            while launched < completions and successes + len(running) < min_successes:
+                running.add(asyncio.create_task(start_attempt(launched)))
+                launched += 1
+    finally:
+        for task in running:
+            task.cancel()
+        await asyncio.gather(*running, return_exceptions=True)
 
-    return results
+    return attempts
@@ -1,13 +1,108 @@
 """Unified LLM model instances and factory functions.
 
 Provides access to configured language model instances for all modules.
+Chat models are built once per configuration and share a pooled async HTTP
+transport, so repeated `get_llm` calls reuse warm keep-alive connections.
 """
 
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import httpx
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models.chat_models import BaseChatModel
 
 from utils.settings import settings
 
+# Registry and connection pool limits
+MAX_CACHED_MODELS = 32
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+KEEPALIVE_EXPIRY_SECONDS = 60.0
+REQUEST_TIMEOUT_SECONDS = 600.0
+
+# Model name -> (model, the HTTP client it was built with)
+_models: "OrderedDict[str, Tuple[BaseChatModel, Optional[httpx.AsyncClient]]]" = OrderedDict()
+_models_lock = threading.Lock()
+_http_async_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _discard_http_client(
+    client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]
+) -> None:
+    """Close a client whose pooled connections belong to another event loop."""
+    if client.is_closed:
+        return
+    if loop is not None and loop.is_running():
+        # Still serving another thread - close it on that loop
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        return
+
+    # The loop is gone, so the connections can't close through it; close
+    # their sockets directly (best effort)
+    pool = getattr(client._transport, "_pool", None)
+    for connection in getattr(pool, "connections", []):
+        stream = getattr(getattr(connection, "_connection", None), "_network_stream", None)
+        sock = stream.get_extra_info("socket") if stream is not None else None
+        # asyncio hands out a TransportSocket wrapper, which can't close
+        sock = getattr(sock, "_sock", sock)
+        if sock is not None:
+            sock.close()
+
+
+def _get_http_async_client() -> httpx.AsyncClient:
+    """Get the process-wide async HTTP client shared by all chat models.
+
+    The client is rebuilt if the event loop changes, since its pooled
+    connections are bound to the loop that opened them.
+    """
+    global _http_async_client, _http_client_loop
+
+    loop = _running_loop()
+    stale = _http_async_client is None or _http_async_client.is_closed
+    if stale or (loop is not None and _http_client_loop is not loop):
+        if _http_async_client is not None:
+            _discard_http_client(_http_async_client, _http_client_loop)
+
+        _http_async_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            timeout=httpx.Timeout(REQUEST_TIMEOUT_SECONDS, connect=10.0),
+        )
+        _http_client_loop = loop
+    return _http_async_client
+
+
+def _build_llm(
+    model_name: str, http_async_client: Optional[httpx.AsyncClient]
+) -> BaseChatModel:
+    """Construct a new chat model instance."""
+    extra_kwargs = {}
+    if http_async_client is not None:
+        extra_kwargs["http_async_client"] = http_async_client
+
+    return init_chat_model(
+        model=model_name,
+        api_key=settings.openai_api_key,
+        # Retries go through the circuit breaker and rate limit governor
+        # (utils.llm, utils.ratelimit); SDK retries would bypass both
+        max_retries=0,
+        **extra_kwargs,
+    )
+
 
 def get_llm(
     model_name: str = "openai:gpt-5-mini",
@@ -16,28 +111,52 @@ def get_llm(
 ) -> BaseChatModel:
     """Get LLM with specified configuration.
 
+    Instances are cached per model name in a bounded LRU registry, so
+    callers can use this freely on hot paths. Models run at their default
+    temperature (the reasoning models used here accept no other), so
+    `temperature` and `completions` do not change the returned instance.
+
     Args:
         model_name: The model to use
-        temperature: Temperature for generation
-        completions: How many completions we need (affects temperature for diversity)
+        temperature: Temperature for generation (not sent to the provider)
+        completions: How many completions we need
 
     Returns:
         Configured LLM instance
     """
-    # Use higher temp when doing multiple completions for diversity
-    if completions > 1 and temperature == 0.0:
-        temperature = 0.2
-
     if not settings.openai_api_key:
         raise ValueError("OpenAI API key not found in environment variables")
 
-    return init_chat_model(
-        model=model_name,
-        api_key=settings.openai_api_key#,
-        #temperature=temperature if model_name.startswith("openai:gpt") else None,
-    )
+    with _models_lock:
+        client = _get_http_async_client() if model_name.startswith("openai:") else None
+        entry = _models.get(model_name)
+        # Models built for another event loop's client are rebuilt
+        if entry is not None and entry[1] is client:
+            _models.move_to_end(model_name)
+            return entry[0]
+
+        llm = _build_llm(model_name, client)
+        _models[model_name] = (llm, client)
+        _models.move_to_end(model_name)
+        if len(_models) > MAX_CACHED_MODELS:
+            _models.popitem(last=False)
+
+    return llm
 
 
 def get_default_llm() -> BaseChatModel:
     """Get default LLM instance."""
     return get_llm()
+
+
+async def close_llm_clients() -> None:
+    """Drop cached models and close the shared HTTP transport (for shutdown)."""
+    global _http_async_client, _http_client_loop
+
+    with _models_lock:
+        _models.clear()
+
+    if _http_async_client is not None and not _http_async_client.is_closed:
+        await _http_async_client.aclose()
+    _http_async_client = None
+    _http_client_loop = None
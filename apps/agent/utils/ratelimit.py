@@ -0,0 +1,309 @@
+"""Rate limiting and concurrency control for external APIs.
+
+Each LLM model and search provider gets a governor combining a token bucket
+(requests per second with a burst allowance) and a semaphore (max in-flight
+requests). Rate-limited calls are retried after the provider's Retry-After
+hint, or after an exponential backoff with jitter when there is none.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Limits per LLM model name or search provider name
+RATE_LIMITS: Dict[str, Dict[str, float]] = {
+    "gpt-5-mini": {"requests_per_second": 20, "burst": 40, "max_concurrency": 32},
+    "gpt-5": {"requests_per_second": 5, "burst": 10, "max_concurrency": 8},
+    "serper": {"requests_per_second": 5, "burst": 10, "max_concurrency": 10},
+    "exa": {"requests_per_second": 5, "burst": 5, "max_concurrency": 5},
+    "tavily": {"requests_per_second": 4, "burst": 8, "max_concurrency": 8},
+}
+DEFAULT_RATE_LIMIT: Dict[str, float] = {
+    "requests_per_second": 10,
+    "burst": 20,
+    "max_concurrency": 16,
+}
+
+# Backpressure polling while governors are saturated
+BACKPRESSURE_POLL_SECONDS = 0.25
+BACKPRESSURE_MAX_WAIT_SECONDS = 30.0
+
+# Retry behaviour for rate-limited (429) calls
+MAX_RATE_LIMIT_RETRIES = 4
+BASE_BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 60.0
+
+
+def http_status_code(error: BaseException) -> Optional[int]:
+    """Extract an HTTP status code from common client exception shapes."""
+    for candidate in (error, getattr(error, "response", None)):
+        for attribute in ("status_code", "status"):
+            status = getattr(candidate, attribute, None)
+            if isinstance(status, int):
+                return status
+    return None
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Whether an exception signals an HTTP 429 / provider rate limit."""
+    return http_status_code(error) == 429 or "RateLimit" in type(error).__name__
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Read the Retry-After hint (in seconds) from an exception, if present."""
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    headers = headers or getattr(error, "headers", None)
+    if not headers:
+        return None
+
+    try:
+        if value := headers.get("retry-after-ms"):
+            return float(value) / 1000
+        if value := headers.get("retry-after"):
+            return float(value)
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+def backoff_with_jitter(attempt: int) -> float:
+    """Full-jitter exponential backoff delay for the given attempt (0-based)."""
+    ceiling = min(MAX_BACKOFF_SECONDS, BASE_BACKOFF_SECONDS * 2**attempt)
+    return random.uniform(0, ceiling)
+
+
+class TokenBucket:
+    """Async token bucket allowing `rate` acquisitions per second on average."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every acquisition for the given number of seconds."""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        # The lock keeps waiters in arrival order
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class Governor:
+    """Rate and concurrency limits for one model or provider."""
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_second: float,
+        burst: float,
+        max_concurrency: int,
+    ):
+        self.name = name
+        self.max_concurrency = int(max_concurrency)
+        self._bucket = TokenBucket(requests_per_second, burst)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._waiting = 0
+        self._in_flight = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls waiting for a slot or a token."""
+        return self._waiting
+
+    @property
+    def in_flight(self) -> int:
+        """Calls currently running."""
+        return self._in_flight
+
+    @property
+    def saturated(self) -> bool:
+        """Whether every slot is taken and calls are queueing."""
+        return self._in_flight >= self.max_concurrency and self._waiting > 0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncGenerator[None, None]:
+        """Hold one concurrency slot and one rate token for the body."""
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+            try:
+                await self._bucket.acquire()
+            except BaseException:
+                self._semaphore.release()
+                raise
+        finally:
+            self._waiting -= 1
+
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Run a call under the limits, retrying it when rate limited."""
+        attempt = 0
+        while True:
+            try:
+                async with self.slot():
+                    return await call()
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt >= MAX_RATE_LIMIT_RETRIES:
+                    raise
+                delay = retry_after_seconds(e) or backoff_with_jitter(attempt)
+                attempt += 1
+                logger.warning(
+                    f"Rate limited by {self.name}, retrying in {delay:.1f}s "
+                    f"(attempt {attempt}/{MAX_RATE_LIMIT_RETRIES})"
+                )
+                # Pausing the bucket backs off every caller, not just this one
+                self._bucket.pause(delay)
+
+
+class PriorityLimiter:
+    """Concurrency limit admitting waiters lowest priority value first.
+
+    Waiters with equal priority are admitted in arrival order.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = int(max_concurrency)
+        self._active = 0
+        self._waiters: List[Tuple[float, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def queue_depth(self) -> int:
+        """Callers waiting for a slot."""
+        return sum(not future.done() for _, _, future in self._waiters)
+
+    @property
+    def in_flight(self) -> int:
+        """Slots currently held."""
+        return self._active
+
+    def _release(self) -> None:
+        # Hand the slot straight to the best waiter still waiting
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
+
+    @asynccontextmanager
+    async def slot(self, priority: float = 0) -> AsyncGenerator[None, None]:
+        """Hold one slot for the body, queueing by priority when all are taken."""
+        if self._active < self.max_concurrency and not self.queue_depth:
+            self._active += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                # Cancelled after being handed the slot - pass it on
+                if future.done() and not future.cancelled():
+                    self._release()
+                raise
+
+        try:
+            yield
+        finally:
+            self._release()
+
+
+_governors: Dict[str, Governor] = {}
+
+
+def get_governor(name: str) -> Governor:
+    """Get the process-wide governor for a model or provider name."""
+    if name not in _governors:
+        limits = RATE_LIMITS.get(name, DEFAULT_RATE_LIMIT)
+        _governors[name] = Governor(name, **limits)
+    return _governors[name]
+
+
+async def governed(name: str, call: Callable[[], Awaitable[T]]) -> T:
+    """Run a call under the governor registered for `name`."""
+    return await get_governor(name).run(call)
+
+
+async def wait_for_capacity(
+    names: Optional[Iterable[str]] = None,
+    max_wait: float = BACKPRESSURE_MAX_WAIT_SECONDS,
+) -> float:
+    """Wait while any of the named governors (default: all) is saturated.
+
+    Returns:
+        Seconds spent waiting; gives up after `max_wait`
+    """
+    governors = (
+        [_governors[name] for name in names if name in _governors]
+        if names is not None
+        else list(_governors.values())
+    )
+    started = time.monotonic()
+
+    while any(governor.saturated for governor in governors):
+        waited = time.monotonic() - started
+        if waited >= max_wait:
+            logger.warning(f"Backpressure wait gave up after {waited:.1f}s")
+            break
+        await asyncio.sleep(BACKPRESSURE_POLL_SECONDS)
+
+    return time.monotonic() - started
+
+
+def governor_stats() -> Dict[str, Dict[str, Any]]:
+    """Queue depth and in-flight count for every governor in use."""
+    return {
+        name: {
+            "queue_depth": governor.queue_depth,
+            "in_flight": governor.in_flight,
+            "max_concurrency": governor.max_concurrency,
+        }
+        for name, governor in _governors.items()
+    }
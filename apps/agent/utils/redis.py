@@ -1,23 +1,101 @@
-"""Redis utilities for connection management and common operations."""
+"""Redis utilities for connection management and common operations.
 
+All callers share one process-wide connection pool, created lazily on first
+use (or eagerly via `init_redis`) and released with `close_redis`. When the
+pool is exhausted, callers wait up to `REDIS_POOL_TIMEOUT` for a connection
+instead of failing at once.
+"""
+
+import asyncio
+import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from itertools import chain
+from typing import AsyncGenerator, Optional
 
 import redis.asyncio as redis
 
 from .settings import settings
 
+logger = logging.getLogger(__name__)
+
+_pool: Optional[redis.BlockingConnectionPool] = None
+_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _discard_pool(pool: redis.ConnectionPool, loop: asyncio.AbstractEventLoop) -> None:
+    """Release the connections of a pool built for another event loop."""
+    if loop.is_running():
+        # Still serving another thread - disconnect on that loop
+        asyncio.run_coroutine_threadsafe(pool.disconnect(), loop)
+        return
+
+    # The loop is closed, so the transports can't close through it; close
+    # their sockets directly (best effort) and drop the connections
+    for connection in chain(pool._available_connections, pool._in_use_connections):
+        writer = getattr(connection, "_writer", None)
+        sock = getattr(writer.transport, "_sock", None) if writer is not None else None
+        if sock is not None:
+            sock.close()
+    pool.reset()
+
+
+def get_redis_pool() -> redis.BlockingConnectionPool:
+    """Get the shared connection pool, creating it for the running event loop."""
+    global _pool, _pool_loop
+
+    loop = asyncio.get_running_loop()
+    # Async connections are bound to the loop that opened them
+    if _pool is None or _pool_loop is not loop:
+        if _pool is not None and _pool_loop is not None:
+            logger.info("Event loop changed, replacing the Redis connection pool")
+            _discard_pool(_pool, _pool_loop)
+
+        _pool = redis.BlockingConnectionPool.from_url(
+            str(settings.redis_uri),
+            max_connections=settings.redis_max_connections,
+            timeout=settings.redis_pool_timeout,
+            health_check_interval=settings.redis_health_check_interval,
+            socket_timeout=settings.redis_socket_timeout,
+            socket_connect_timeout=settings.redis_socket_timeout,
+        )
+        _pool_loop = loop
+    return _pool
+
+
+def get_redis() -> redis.Redis:
+    """Get a client backed by the shared connection pool."""
+    return redis.Redis(connection_pool=get_redis_pool())
+
 
 @asynccontextmanager
 async def redis_client() -> AsyncGenerator[redis.Redis, None]:
-    """Context manager for Redis connections."""
-    client = redis.from_url(str(settings.redis_uri))
+    """Context manager for Redis connections.
+
+    Connections go back to the shared pool on exit instead of being closed.
+    """
+    client = get_redis()
     try:
         yield client
     finally:
         await client.aclose()
 
 
+async def init_redis() -> None:
+    """Create the connection pool and verify connectivity (startup hook)."""
+    async with redis_client() as client:
+        await client.ping()
+
+
+async def close_redis() -> None:
+    """Disconnect every pooled connection (shutdown hook)."""
+    global _pool, _pool_loop
+
+    if _pool is not None:
+        await _pool.disconnect()
+    _pool = None
+    _pool_loop = None
+
+
 async def test_redis_connection() -> bool:
     """Test Redis connection."""
     try:
@@ -0,0 +1,118 @@
+"""Retry classification and circuit breaking for external API calls."""
+
+import logging
+import time
+from typing import Dict
+
+from .ratelimit import http_status_code
+
+logger = logging.getLogger(__name__)
+
+# Circuit breaker settings
+FAILURE_THRESHOLD = 5  # Consecutive retryable failures before opening
+RESET_TIMEOUT_SECONDS = 30.0  # How long to fail fast before probing again
+
+_RETRYABLE_STATUS_CODES = {408, 409}
+_RETRYABLE_ERROR_NAMES = {
+    "APIConnectionError",
+    "APITimeoutError",
+    "InternalServerError",
+    "ServiceUnavailableError",
+    "ConnectError",
+    "ReadTimeout",
+    "RemoteProtocolError",
+}
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Whether an error is transient: timeouts, connection issues or 5xx.
+
+    Rate limits (429) are not included - the governor already retries them
+    with backoff, and by the time one surfaces here its retries are spent.
+    """
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+
+    status = http_status_code(error)
+    if status is not None:
+        return status >= 500 or status in _RETRYABLE_STATUS_CODES
+
+    return any(cls.__name__ in _RETRYABLE_ERROR_NAMES for cls in type(error).__mro__)
+
+
+class CircuitBreaker:
+    """Fails fast after repeated transient failures of one provider.
+
+    Closed: calls flow normally. Open: calls are rejected until the reset
+    timeout passes. Half-open: a single probe call is let through; its
+    outcome closes or re-opens the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        reset_timeout: float = RESET_TIMEOUT_SECONDS,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+
+    def allow_request(self) -> bool:
+        """Whether a call may proceed right now."""
+        if self.state == self.CLOSED:
+            return True
+
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            logger.info(f"Circuit for {self.name} half-open, sending a probe call")
+            return True
+
+        # Half-open with a probe already in flight
+        return False
+
+    def release_probe(self) -> None:
+        """The probe call ended without an outcome (e.g. it was cancelled).
+
+        Returns to open with the reset timeout already elapsed, so the next
+        call is let through as a new probe.
+        """
+        if self.state == self.HALF_OPEN:
+            self.state = self.OPEN
+
+    def record_success(self) -> None:
+        """The provider answered - close the circuit."""
+        if self.state != self.CLOSED:
+            logger.info(f"Circuit for {self.name} closed")
+        self.state = self.CLOSED
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        """A transient failure - open the circuit once the threshold is hit."""
+        self._failures += 1
+        if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(
+                    f"Circuit for {self.name} opened after {self._failures} failures"
+                )
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(name: str) -> CircuitBreaker:
+    """Get the process-wide circuit breaker for a model or provider name."""
+    if name not in _breakers:
+        _breakers[name] = CircuitBreaker(name)
+    return _breakers[name]
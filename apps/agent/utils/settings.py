@@ -41,6 +41,40 @@ class Settings(BaseSettings):
     exa_api_key: ExaAPIKey = Field(default=None, alias="EXA_API_KEY")
     tavily_api_key: TavilyAPIKey = Field(default=None, alias="TAVILY_API_KEY")
     redis_uri: RedisDsn = Field(default="redis://localhost:6379", alias="REDIS_URL")
+    redis_max_connections: int = Field(default=50, alias="REDIS_MAX_CONNECTIONS")
+    redis_health_check_interval: int = Field(
+        default=30, alias="REDIS_HEALTH_CHECK_INTERVAL"
+    )
+    redis_socket_timeout: float = Field(default=5.0, alias="REDIS_SOCKET_TIMEOUT")
+    # How long a caller waits for a free pooled connection before failing
+    redis_pool_timeout: float = Field(default=5.0, alias="REDIS_POOL_TIMEOUT")
+
+    # Directory holding the vendored tokenizer vocabulary (offline use)
+    tiktoken_cache_dir: str | None = Field(default=None, alias="TIKTOKEN_CACHE_DIR")
+
+    # Directory holding the vendored NLTK data (punkt_tab), searched first
+    nltk_data_dir: str | None = Field(default=None, alias="NLTK_DATA")
+
+    # Sentence-transformers model used for relevance ranking and clustering:
+    # a hub name, or a local path (the Docker image vendors one)
+    embedding_model: str = Field(
+        default="sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
+        alias="EMBEDDING_MODEL",
+    )
+
+    # API key verification cache
+    api_key_cache_ttl_seconds: float = Field(
+        default=30.0, alias="API_KEY_CACHE_TTL_SECONDS"
+    )
+    api_key_cache_max_entries: int = Field(
+        default=10_000, alias="API_KEY_CACHE_MAX_ENTRIES"
+    )
+
+    # Structured LLM response cache
+    llm_cache_enabled: bool = Field(default=True, alias="LLM_CACHE_ENABLED")
+    llm_cache_use_redis: bool = Field(default=False, alias="LLM_CACHE_USE_REDIS")
+    llm_cache_ttl_seconds: int = Field(default=86_400, alias="LLM_CACHE_TTL_SECONDS")
+    llm_cache_max_entries: int = Field(default=10_000, alias="LLM_CACHE_MAX_ENTRIES")
 
     model_config = SettingsConfigDict(
         env_file=".env",
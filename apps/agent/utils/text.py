@@ -4,33 +4,95 @@ Helper functions for manipulating text content.
 """
 
 import logging
+import re
+import unicodedata
+from typing import NamedTuple, Optional, Set
 
 logger = logging.getLogger(__name__)
 
 
-def remove_following_sentences(context_for_llm: str) -> str:
-    """Strips out the following sentences section from context.
+_WORD_PATTERN = re.compile(r"\w+")
+_CONTRACTED_NOT_PATTERN = re.compile(r"n['\u2019]t\b", re.IGNORECASE)
 
-    Our context looks like:
-    [Preceding Sentences:]
-    ...
-    [Sentence of Interest for current task:]
-    ...
-    [Following Sentences:]
-    ...
+# Words that negate a claim (English and Czech); "n't" is expanded to "not"
+_NEGATIONS = {
+    "not", "no", "never", "none", "nor", "neither", "nobody", "nothing", "cannot",
+    "ne", "nikdy", "nikdo", "nic", "není", "nejsou", "nebyl", "nebyla", "nebylo",
+    "nebyli", "nemá", "nemají", "neměl", "neměla", "nemůže", "nelze",
+}
+
+# Word prefixes of scale words (English and Czech) and the scale they name
+_MAGNITUDES = (
+    ("thousand", "thousand"), ("tisíc", "thousand"),
+    ("million", "million"), ("milion", "million"),
+    ("billion", "billion"), ("miliard", "billion"),
+    ("trillion", "trillion"), ("bilion", "trillion"),
+    ("percent", "percent"), ("procent", "percent"),
+)
+
+
+class _KeyTerms(NamedTuple):
+    numbers: Set[str]
+    capitalized: Set[str]  # Casefolded
+    words: Set[str]  # Casefolded
+    first: Optional[str]  # Casefolded
+    magnitudes: Set[str]
+    negated: bool
+
+
+def _magnitude(word: str) -> Optional[str]:
+    return next((scale for prefix, scale in _MAGNITUDES if word.startswith(prefix)), None)
+
+
+def _key_terms(text: str) -> _KeyTerms:
+    """Numbers, entities, scale words and negation of a text."""
+    text = _CONTRACTED_NOT_PATTERN.sub(" not", unicodedata.normalize("NFKC", text))
+    words = _WORD_PATTERN.findall(text)
+    folded = {word.casefold() for word in words}
+
+    magnitudes = {scale for word in folded if (scale := _magnitude(word))}
+    if "%" in text:
+        magnitudes.add("percent")
+
+    return _KeyTerms(
+        numbers={word for word in words if any(char.isdigit() for char in word)},
+        capitalized={word.casefold() for word in words if word[0].isupper()},
+        words=folded,
+        first=words[0].casefold() if words else None,
+        magnitudes=magnitudes,
+        negated=not folded.isdisjoint(_NEGATIONS),
+    )
+
+
+def same_key_terms(text: str, other: str) -> bool:
+    """Whether two claims mention the same numbers and named entities.
+
+    Embeddings barely separate claims that differ only in a number, a year,
+    a name, a scale or a negation, so near matches must also agree on these.
+    Numbers and scale words ("million", "percent", "%") must match exactly,
+    and either both claims are negated ("not", "never", ...) or neither is.
+    Capitalized words stand in for entities; a capitalized first word may
+    differ as long as the other text contains it too, so "The capital is
+    Prague" still matches "Prague is the capital".
 
     Args:
-        context_for_llm: The full context string
+        text: One claim
+        other: The claim to compare with
 
     Returns:
-        Context with following sentences removed
+        True if both mention the same numbers, scales and entities, with the
+        same polarity
     """
-    # Split by the marker
-    parts = context_for_llm.split("\n[Following Sentences:]")
-
-    # If there are following sentences, return only the part before them
-    if len(parts) > 1:
-        return parts[0]
+    terms, other_terms = _key_terms(text), _key_terms(other)
 
-    # No following sentences? Return as is
-    return context_for_llm
+    if (
+        terms.numbers != other_terms.numbers
+        or terms.magnitudes != other_terms.magnitudes
+        or terms.negated != other_terms.negated
+    ):
+        return False
+    return (terms.capitalized - other_terms.capitalized) <= (
+        {terms.first} & other_terms.words
+    ) and (other_terms.capitalized - terms.capitalized) <= (
+        {other_terms.first} & terms.words
+    )
@@ -0,0 +1,46 @@
+"""Token accounting utilities.
+
+Counts tokens with the model's BPE tokenizer (tiktoken). The vocabulary is
+read from TIKTOKEN_CACHE_DIR, so deployments can ship it with the image and
+never download it at request time. Without a tokenizer we fall back to a
+characters-per-token estimate.
+"""
+
+import logging
+import os
+from functools import lru_cache
+from typing import Any, Optional
+
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+# BPE vocabulary used by the gpt-4o / gpt-5 model family
+ENCODING_NAME = "o200k_base"
+FALLBACK_CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=1)
+def get_encoding() -> Optional[Any]:
+    """Load the tokenizer once, or None if it is unavailable."""
+    if settings.tiktoken_cache_dir:
+        os.environ.setdefault("TIKTOKEN_CACHE_DIR", settings.tiktoken_cache_dir)
+
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(ENCODING_NAME)
+    except Exception as e:
+        logger.warning(
+            f"Tokenizer '{ENCODING_NAME}' unavailable, estimating token counts: {e}"
+        )
+        return None
+
+
+@lru_cache(maxsize=16_384)
+def count_tokens(text: str) -> int:
+    """Count tokens in a text. Results are cached per distinct string."""
+    encoding = get_encoding()
+    if encoding is None:
+        return len(text) // FALLBACK_CHARS_PER_TOKEN
+    return len(encoding.encode(text, disallowed_special=()))
@@ -0,0 +1,35 @@
+"""HTTP app mounted next to the LangGraph API (see "http" in langgraph.json).
+
+Its lifespan opens the shared Redis connection pool at startup, and at
+shutdown releases it and closes the HTTP transport shared by the chat models.
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from starlette.applications import Starlette
+
+from utils.models import close_llm_clients
+from utils.redis import close_redis, init_redis
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: Starlette) -> AsyncIterator[None]:
+    """Set up shared connections on startup and close them on shutdown."""
+    try:
+        await init_redis()
+    except Exception as e:
+        # Caches fall back to memory; auth reports 503 until Redis is back
+        logger.warning(f"Redis unavailable at startup: {e}")
+
+    try:
+        yield
+    finally:
+        await close_llm_clients()
+        await close_redis()
+
+
+app = Starlette(lifespan=lifespan)